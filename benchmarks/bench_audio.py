@@ -0,0 +1,46 @@
+"""Benchmark per-turn audio preprocessing (trim + normalize) across recording lengths.
+
+Run from the repository root with: python -m benchmarks.bench_audio
+"""
+
+from typing import List
+
+import numpy as np
+
+from benchmarks.measure import Measurement, measure
+from mochi.io.audio import preprocess
+
+SAMPLE_RATE = 16000
+
+
+def make_recording(seconds: float, rng: np.random.Generator) -> np.ndarray:
+    """Room noise with a tone burst in the middle, as float32 mono."""
+    audio = rng.normal(0, 0.003, int(seconds * SAMPLE_RATE)).astype(np.float32)
+    mid, half = len(audio) // 2, min(len(audio) // 4, SAMPLE_RATE * 5)
+    t = np.arange(2 * half) / SAMPLE_RATE
+    audio[mid - half:mid + half] += (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    return audio
+
+
+def run(quick: bool = False) -> List[Measurement]:
+    rng = np.random.default_rng(0)
+    results = []
+    for seconds in (2, 10, 30) if quick else (2, 5, 10, 30, 60):
+        audio = make_recording(seconds, rng)
+        results.append(measure(
+            f"audio.preprocess.{seconds}s",
+            lambda: preprocess(audio, SAMPLE_RATE),
+            unit="ms",
+            repeat=20 if quick else 50,
+        ))
+    return results
+
+
+def main():
+    print(f"{'recording':>10}  {'preprocess':>12}")
+    for m in run():
+        print(f"{m.name.rsplit('.', 1)[1]:>10}  {m.value:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark the CPU cost the coach adds around an LLM call.
+
+Run from the repository root with: python -m benchmarks.bench_coach
+
+Covers the safeguard checks, system prompt assembly and ``Coach.get_response``
+/ ``stream_response`` against a stub provider that answers instantly, so the
+numbers are pure client-side overhead (history packing, request layout,
+usage accounting, filtering). No network access or API key is needed.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+from benchmarks.measure import Measurement, measure
+from mochi.ai.coach import Coach
+from mochi.ai.safeguards import CoachSafeguards
+from mochi.core.config import Config
+from mochi.core.prompts import get_system_prompt
+from mochi.schemas import InterviewState, Message, MessageRole
+
+SETTINGS = Path(__file__).parent.parent / "settings.toml"
+
+PROBLEM = (
+    "Given an array of integers nums and an integer target, return indices of the two numbers "
+    "such that they add up to target. You may assume that each input would have exactly one "
+    "solution, and you may not use the same element twice. " * 3
+)
+
+REPLY = (
+    "That's a reasonable start. Walk me through what happens to your nested loops when the "
+    "array has a million elements. Is there anything you could remember as you scan so you "
+    "don't have to look back over the whole array each time?"
+)
+
+CANDIDATE_LINES = [
+    "I think I'd start with a brute force that checks every pair of numbers.",
+    "That would be O(n squared) though, which seems slow for large inputs.",
+    "Maybe I could sort the array first and use two pointers from each end?",
+    "But sorting loses the original indices, so I'd need to keep those around.",
+]
+
+
+class StubOpenAI:
+    """Just enough of the OpenAI client surface for the coach, answering instantly."""
+
+    def __init__(self, reply: str = REPLY):
+        words = reply.split(" ")
+        self._response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=reply))],
+            usage=SimpleNamespace(prompt_tokens=900, completion_tokens=len(words), prompt_tokens_details=None),
+        )
+        self._chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=word + " "))], usage=None)
+            for word in words
+        ]
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, stream: bool = False, **kwargs):
+        return _Stream(self._chunks) if stream else self._response
+
+
+class _Stream:
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __iter__(self):
+        return self._chunks
+
+    def close(self):
+        pass
+
+
+class StubbedCoach(Coach):
+    def _init_client(self):
+        self._summary_executor = None
+        self.client = StubOpenAI()
+        self.engine = "openai"
+
+
+def make_history(turns: int) -> List[Message]:
+    history = []
+    for i in range(turns):
+        history.append(Message(role=MessageRole.CANDIDATE, content=CANDIDATE_LINES[i % len(CANDIDATE_LINES)],
+                               timestamp=datetime.now()))
+        history.append(Message(role=MessageRole.COACH, content=REPLY, timestamp=datetime.now()))
+    return history
+
+
+def run(quick: bool = False) -> List[Measurement]:
+    repeat = 300 if quick else 2000
+    safeguards = CoachSafeguards()
+    long_reply = " ".join([REPLY] * 8)
+    results = [
+        measure("safeguards.filter_coach_response.short", lambda: safeguards.filter_coach_response(REPLY), repeat=repeat),
+        measure("safeguards.filter_coach_response.long", lambda: safeguards.filter_coach_response(long_reply), repeat=repeat),
+        measure("safeguards.detect_fishing", lambda: safeguards.detect_fishing(CANDIDATE_LINES[2]), repeat=repeat),
+        measure("safeguards.stream_filter", lambda: _filter_stream(safeguards, long_reply), repeat=repeat // 4),
+        measure(
+            "prompts.get_system_prompt",
+            lambda: get_system_prompt("Two Sum", InterviewState.APPROACH, "balanced", 7.5, PROBLEM),
+            repeat=repeat,
+        ),
+    ]
+
+    coach = StubbedCoach(Config(str(SETTINGS)))
+    request = dict(
+        user_message=CANDIDATE_LINES[0],
+        problem_title="Two Sum",
+        state=InterviewState.APPROACH,
+        elapsed_min=7.5,
+        problem_statement=PROBLEM,
+    )
+    for turns in (2, 20):
+        history = make_history(turns)
+        results.append(measure(
+            f"coach.get_response.history{turns}",
+            lambda: coach.get_response(message_history=history, **request),
+            repeat=repeat // 4,
+        ))
+        results.append(measure(
+            f"coach.stream_response.history{turns}",
+            lambda: "".join(coach.stream_response(message_history=history, **request)),
+            repeat=repeat // 4,
+        ))
+    return results
+
+
+def _filter_stream(safeguards: CoachSafeguards, text: str) -> str:
+    guard = safeguards.stream_filter()
+    out = [guard.feed(text[i:i + 12]) for i in range(0, len(text), 12)]
+    out.append(guard.finish())
+    return "".join(out)
+
+
+def main():
+    print(f"{'measurement':<40} {'median':>10} {'p95':>10}")
+    for m in run():
+        print(f"{m.name:<40} {m.value:>8.1f}us {m.p95:>8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
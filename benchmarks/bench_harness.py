@@ -0,0 +1,89 @@
+"""Benchmark test-run latency for the Python harness: cold, warm pool and cached.
+
+Run from the repository root with: python -m benchmarks.bench_harness
+
+Runs a passing two_sum solution against the example's test suite:
+- cold: no pool, no cache, a fresh subprocess per run
+- settings: the [harness] pool, recycling and fan-out shipped in settings.toml,
+  cache off (what a run after an edit costs)
+- settings_parallel: as settings, with cases split over up to four workers
+- warm: pre-started workers that are never recycled (the pool's lower bound)
+- cached: result served from the in-memory cache (a repeated "run tests")
+"""
+
+import tempfile
+from pathlib import Path
+from typing import List
+
+import yaml
+
+from benchmarks.measure import Measurement, measure
+from mochi.core.config import Config
+from mochi.harness.python_harness import PythonHarness
+
+TESTS_FILE = Path(__file__).parent.parent / "examples" / "problems" / "two_sum" / "tests.yaml"
+SETTINGS = Path(__file__).parent.parent / "settings.toml"
+
+SOLUTION = """
+def two_sum(nums, target):
+    seen = {}
+    for i, num in enumerate(nums):
+        if target - num in seen:
+            return [seen[target - num], i]
+        seen[num] = i
+"""
+
+
+def run(quick: bool = False) -> List[Measurement]:
+    with open(TESTS_FILE) as f:
+        tests = yaml.safe_load(f)["tests"]
+    repeat = 5 if quick else 20
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        solution = Path(tmp) / "solution.py"
+        solution.write_text(SOLUTION)
+
+        config = Config(str(SETTINGS))
+        shipped = dict(
+            timeout_ms=config.harness_timeout_ms,
+            memory_mb=config.harness_memory_mb,
+            pool_size=config.harness_pool_size,
+            jobs_per_worker=config.harness_jobs_per_worker,
+            case_timeout_ms=config.harness_case_timeout_ms,
+            max_parallel_cases=config.harness_max_parallel_cases,
+            cache_size=0,
+        )
+        configs = {
+            "cold": dict(pool_size=0, cache_size=0),
+            "settings": shipped,
+            "settings_parallel": dict(shipped, max_parallel_cases=4),
+            "warm": dict(pool_size=2, jobs_per_worker=1000, max_parallel_cases=1, cache_size=0),
+            "cached": dict(pool_size=0, cache_size=16),
+        }
+        for name, kwargs in configs.items():
+            harness = PythonHarness(**kwargs)
+            try:
+                result = harness.run_tests(solution, tests)
+                if not result.all_passing:
+                    raise SystemExit(f"harness.{name}: benchmark solution failed: {result.error or result.failures}")
+                results.append(measure(
+                    f"harness.run_tests.{name}",
+                    lambda: harness.run_tests(solution, tests),
+                    unit="ms",
+                    repeat=repeat,
+                ))
+            finally:
+                harness.close()
+
+    return results
+
+
+def main():
+    print(f"{'harness':<32} {'median':>10} {'p95':>10}")
+    for m in run():
+        print(f"{m.name:<32} {m.value:>8.2f}ms {m.p95:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
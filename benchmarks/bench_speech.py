@@ -0,0 +1,78 @@
+"""Benchmark the markdown-to-speech normalizer against the golden corpus.
+
+Run from the repository root with: python -m benchmarks.bench_speech
+
+Every corpus entry is checked against its expected output first, then
+``strip_markdown`` is timed alongside the previous multi-pass implementation.
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+from typing import List
+
+from benchmarks.measure import Measurement, measure
+from mochi.io.utils import strip_markdown
+
+CORPUS = Path(__file__).parent / "fixtures" / "speech_corpus.json"
+
+
+def legacy_strip_markdown(text: str) -> str:
+    """The previous implementation: eight re.sub passes and seven str.replace calls."""
+    text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)
+    text = re.sub(r'\*([^\*]+)\*', r'\1', text)
+    text = re.sub(r'__([^_]+)__', r'\1', text)
+    text = re.sub(r'_([^_]+)_', r'\1', text)
+    text = re.sub(r'```[^\n]*\n.*?```', '[code block]', text, flags=re.DOTALL)
+    text = re.sub(r'`([^`]+)`', r'\1', text)
+    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    for symbol in ('✅', '❌', '🎯', '🔊', '🎤', '⌨️', '🔄'):
+        text = text.replace(symbol, '')
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def time_us(fn, text: str, repeat: int = 2000) -> float:
+    """Median wall time of ``fn(text)`` in microseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def check_golden(corpus) -> None:
+    mismatches = [case["name"] for case in corpus if strip_markdown(case["input"]) != case["expected"]]
+    if mismatches:
+        raise SystemExit(f"Golden output mismatch: {', '.join(mismatches)}")
+
+
+def run(quick: bool = False) -> List[Measurement]:
+    corpus = json.loads(CORPUS.read_text())
+    check_golden(corpus)
+    return [
+        measure(f"speech.strip_markdown.{case['name']}", lambda: strip_markdown(case["input"]),
+                repeat=500 if quick else 2000)
+        for case in corpus
+    ]
+
+
+def main():
+    corpus = json.loads(CORPUS.read_text())
+    check_golden(corpus)
+    print(f"Golden corpus: {len(corpus)} cases match\n")
+
+    print(f"{'case':<22} {'chars':>6} {'legacy':>10} {'current':>10} {'speedup':>8}")
+    for case in corpus:
+        text = case["input"]
+        legacy = time_us(legacy_strip_markdown, text)
+        current = time_us(strip_markdown, text)
+        print(f"{case['name']:<22} {len(text):>6} {legacy:>8.1f}us {current:>8.1f}us {legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
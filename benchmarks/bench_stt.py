@@ -0,0 +1,133 @@
+"""Benchmark real-time factor (decode time / audio duration) for each STT backend.
+
+Run from the repository root with:
+    python -m benchmarks.bench_stt [--model base] [--engine whisper ...] [--audio clip.wav ...]
+
+Without --audio, the bundled WAVs in benchmarks/fixtures/stt/ are used; if
+there are none, a spoken fixture is synthesized with pyttsx3 (``--save-fixture``
+writes it there so later and offline runs reuse it). Engines whose packages
+or models aren't available are reported and skipped.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from benchmarks.measure import Measurement
+from mochi.io.stt_backends import BACKENDS
+
+SAMPLE_RATE = 16000
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "stt"
+
+FIXTURE_TEXT = (
+    "I think I would start with a brute force approach that checks every pair, "
+    "which is quadratic. Then I would try to keep the numbers I have already seen "
+    "so that each lookup is constant time, which brings it down to linear."
+)
+
+
+def load_wav(path: Path) -> np.ndarray:
+    """Read a PCM WAV file as 16 kHz mono float32."""
+    with wave.open(str(path), "rb") as f:
+        rate, channels, width = f.getframerate(), f.getnchannels(), f.getsampwidth()
+        raw = f.readframes(f.getnframes())
+
+    dtype = {1: np.uint8, 2: np.int16, 4: np.int32}[width]
+    audio = np.frombuffer(raw, dtype=dtype).astype(np.float32)
+    if width == 1:
+        audio -= 128
+    audio /= float(2 ** (8 * width - 1))
+    audio = audio.reshape(-1, channels).mean(axis=1)
+
+    if rate != SAMPLE_RATE:
+        positions = np.arange(int(len(audio) * SAMPLE_RATE / rate)) * rate / SAMPLE_RATE
+        audio = np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+    return audio
+
+
+def synthesize_fixture(save_to: Optional[Path] = None) -> np.ndarray:
+    """Render FIXTURE_TEXT with pyttsx3 and load it, optionally keeping the WAV."""
+    import pyttsx3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = save_to or Path(tmp) / "fixture.wav"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        engine = pyttsx3.init()
+        engine.save_to_file(FIXTURE_TEXT, str(path))
+        engine.runAndWait()
+        return load_wav(path)
+
+
+def bundled_fixtures() -> List[np.ndarray]:
+    return [load_wav(path) for path in sorted(FIXTURE_DIR.glob("*.wav"))]
+
+
+def bench_engine(engine: str, model_size: str, clips: List[np.ndarray], repeat: int):
+    start = time.perf_counter()
+    backend = BACKENDS[engine](model_size)
+    load_s = time.perf_counter() - start
+    backend.warmup()
+
+    audio_s = sum(len(clip) for clip in clips) / SAMPLE_RATE
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for clip in clips:
+            backend.transcribe(clip)
+        runs.append(time.perf_counter() - start)
+
+    text = "".join(s.text for s in backend.transcribe(clips[0])).strip()
+    return load_s, float(np.median(runs)) / audio_s, text
+
+
+def run(quick: bool = False, model_size: str = "tiny") -> List[Measurement]:
+    clips = bundled_fixtures()
+    if not clips:
+        print("  stt: skipped (no fixture audio; run 'python -m benchmarks.bench_stt --save-fixture')", file=sys.stderr)
+        return []
+
+    results = []
+    for engine in BACKENDS:
+        try:
+            load_s, rtf, _ = bench_engine(engine, model_size, clips, repeat=1 if quick else 3)
+        except Exception as e:  # Missing package or model download on an offline box
+            print(f"  stt.{engine}: skipped ({e})", file=sys.stderr)
+            continue
+        results.append(Measurement(f"stt.{engine}.{model_size}.rtf", rtf, "x", samples=1 if quick else 3))
+        results.append(Measurement(f"stt.{engine}.{model_size}.load", load_s, "s", samples=1))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", action="append", choices=list(BACKENDS), help="Engines to compare (default: all)")
+    parser.add_argument("--model", default="base", help="Model size (default: base)")
+    parser.add_argument("--audio", action="append", type=Path, help="WAV fixtures (default: synthesized)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save-fixture", action="store_true", help=f"Synthesize the fixture into {FIXTURE_DIR}")
+    args = parser.parse_args()
+
+    if args.save_fixture:
+        synthesize_fixture(FIXTURE_DIR / "fixture.wav")
+    clips = [load_wav(path) for path in args.audio] if args.audio else bundled_fixtures() or [synthesize_fixture()]
+    audio_s = sum(len(clip) for clip in clips) / SAMPLE_RATE
+    print(f"Fixture audio: {audio_s:.1f}s, model: {args.model}\n")
+    print(f"{'engine':<16} {'load':>7} {'RTF':>7}  transcript")
+
+    for engine in args.engine or list(BACKENDS):
+        try:
+            load_s, rtf, text = bench_engine(engine, args.model, clips, args.repeat)
+        except ImportError as e:
+            print(f"{engine:<16} skipped ({e})")
+            continue
+        print(f"{engine:<16} {load_s:>6.1f}s {rtf:>7.3f}  {text[:60]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Timing helpers and the result format shared by every benchmark module.
+
+Each ``bench_*`` module exposes ``run(quick: bool) -> List[Measurement]`` for
+the suite runner (``python -m benchmarks.run``) alongside its own ``main()``.
+All measurements are "lower is better" wall times (or ratios such as RTF).
+"""
+
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class Measurement:
+    name: str          # Dotted id, stable across runs: "<module>.<case>"
+    value: float       # Median
+    unit: str          # "us", "ms" or "x" (real-time factor)
+    p95: Optional[float] = None
+    samples: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_SCALE = {"us": 1e6, "ms": 1e3, "s": 1.0}
+
+
+def measure(name: str, fn: Callable[[], Any], unit: str = "us", repeat: int = 200, warmup: int = 1) -> Measurement:
+    """Call ``fn`` ``warmup`` times untimed, then time ``repeat`` calls."""
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * _SCALE[unit])
+    return Measurement(
+        name=name,
+        value=float(np.median(samples)),
+        unit=unit,
+        p95=float(np.percentile(samples, 95)),
+        samples=repeat,
+    )
+
+
+def environment() -> Dict[str, Any]:
+    """Enough about the machine to tell whether two result files are comparable."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(current: List[Measurement], baseline: Dict[str, Dict[str, Any]], tolerance: float) -> List[Dict[str, Any]]:
+    """Relative change of each measurement against a baseline's ``results`` mapping.
+
+    A measurement regresses when it is more than ``tolerance`` (e.g. 0.25 for
+    25%) slower than the baseline median.
+    """
+    rows = []
+    for m in current:
+        base = baseline.get(m.name)
+        if not base or not base.get("value"):
+            rows.append({"name": m.name, "baseline": None, "current": m.value, "change": None, "regressed": False})
+            continue
+        change = m.value / base["value"] - 1
+        rows.append({
+            "name": m.name,
+            "baseline": base["value"],
+            "current": m.value,
+            "change": change,
+            "regressed": change > tolerance,
+        })
+    return rows
@@ -0,0 +1,127 @@
+"""Run the benchmark suite, write JSON results and compare against a baseline.
+
+Run from the repository root with:
+    python -m benchmarks.run [--quick] [--only harness ...] [--output results.json]
+                             [--baseline benchmarks/baseline.json] [--save-baseline]
+
+Everything runs offline: the coach is measured against a stub provider and
+STT is skipped unless its engine, model and fixture audio are available.
+Exits with status 1 when any measurement is more than ``--tolerance`` slower
+than the baseline, so it can gate a change in CI. Benchmarks that look
+regressed are run once more and the faster run is kept, which filters out
+most one-off noise on shared machines.
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.measure import Measurement, compare, environment
+
+MODULES = {
+    "harness": "benchmarks.bench_harness",
+    "coach": "benchmarks.bench_coach",
+    "speech": "benchmarks.bench_speech",
+    "audio": "benchmarks.bench_audio",
+    "stt": "benchmarks.bench_stt",
+}
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def run_suite(names: List[str], quick: bool) -> List[Measurement]:
+    results = []
+    for name in names:
+        start = time.perf_counter()
+        print(f"Running {name}...", file=sys.stderr)
+        module = importlib.import_module(MODULES[name])
+        results.extend(module.run(quick=quick))
+        print(f"  done in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return results
+
+
+def _prefix(module: str) -> Tuple[str, ...]:
+    """Measurement-name prefixes each module emits."""
+    return {"coach": ("safeguards.", "prompts.", "coach.")}.get(module, (f"{module}.",))
+
+
+def to_json(results: List[Measurement], quick: bool) -> Dict[str, Any]:
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "quick": quick,
+        "environment": environment(),
+        "results": {m.name: m.as_dict() for m in results},
+    }
+
+
+def print_report(results: List[Measurement], rows: List[Dict[str, Any]]):
+    changes = {row["name"]: row for row in rows}
+    width = max(len(m.name) for m in results) + 2
+    print(f"{'measurement':<{width}} {'median':>12} {'p95':>12} {'baseline':>12} {'change':>8}")
+    for m in results:
+        p95 = f"{m.p95:.2f}{m.unit}" if m.p95 is not None else "-"
+        row = changes.get(m.name)
+        if row and row["change"] is not None:
+            base = f"{row['baseline']:.2f}{m.unit}"
+            change = f"{row['change']:+.0%}" + (" !" if row["regressed"] else "")
+        else:
+            base, change = "-", ""
+        print(f"{m.name:<{width}} {m.value:>10.2f}{m.unit:<2} {p95:>12} {base:>12} {change:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", action="append", choices=list(MODULES), help="Benchmarks to run (default: all)")
+    parser.add_argument("--quick", action="store_true", help="Fewer repetitions, for a fast sanity check")
+    parser.add_argument("--output", "-o", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", "-b", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Overwrite the baseline with these results")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before failing (default: 0.25)")
+    args = parser.parse_args()
+
+    results = run_suite(args.only or list(MODULES), args.quick)
+    payload = to_json(results, args.quick)
+
+    baseline: Dict[str, Any] = {}
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("environment") != payload["environment"]:
+            print(f"Note: {args.baseline} was recorded on a different machine or Python; "
+                  "compare with care", file=sys.stderr)
+
+    rows = compare(results, baseline.get("results", {}), args.tolerance)
+    suspect = sorted({name for name in MODULES for row in rows
+                      if row["regressed"] and row["name"].startswith(_prefix(name))})
+    if suspect:
+        print(f"Re-running {', '.join(suspect)} to confirm regressions...", file=sys.stderr)
+        rerun = {m.name: m for m in run_suite(suspect, args.quick)}
+        results = [min(m, rerun.get(m.name, m), key=lambda r: r.value) for m in results]
+        payload = to_json(results, args.quick)
+        rows = compare(results, baseline.get("results", {}), args.tolerance)
+    payload["comparison"] = {"baseline": str(args.baseline) if baseline else None,
+                             "tolerance": args.tolerance, "rows": rows}
+
+    print()
+    print_report(results, rows)
+
+    if args.output:
+        args.output.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        del payload["comparison"]
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+
+    regressed = [row["name"] for row in rows if row["regressed"]]
+    if regressed:
+        print(f"\n{len(regressed)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,225 @@
 """LLM-based interview coach."""
 
-from typing import List, Optional
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
 from mochi.core.config import Config
-from mochi.schemas import Message, MessageRole, InterviewState
+from mochi.schemas import Message, MessageRole, InterviewState, SessionState
 from mochi.ai.safeguards import CoachSafeguards
-from mochi.core.prompts import get_system_prompt
+from mochi.ai.context import (
+    MIN_CACHEABLE_PREFIX_TOKENS, count_tokens, pack_history, unsummarized, summarized_count, summary_prompt,
+)
+from mochi.core.prompts import FORMAT_PROBLEM_PROMPT, get_static_prompt, get_dynamic_prompt
+from mochi.core.tracing import span
 
+# Async clients and concurrency limits are shared per process, one per provider,
+# so every session reuses the same connection pool.
+_async_clients: Dict[str, Any] = {}
+_async_limits: Dict[str, asyncio.Semaphore] = {}
+_async_lock = threading.Lock()
 
-class Coach:
-    """AI interview coach that provides guidance without revealing solutions."""
+
+class SystemPrompt(NamedTuple):
+    """System prompt parts, in the order they are sent."""
+    static: str   # Cacheable prefix: rules plus problem statement
+    summary: str  # Rolling summary of turns outside the context window ("" if none)
+    dynamic: str  # Per-turn phase, timing and helpfulness
+
+
+@dataclass
+class UsageStats:
+    """Running token usage for a coach, including provider prompt-cache hits."""
+    requests: int = 0
+    input_tokens: int = 0  # All prompt tokens, cached or not
+    cached_input_tokens: int = 0
+    cache_write_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of prompt tokens served from the provider's cache."""
+        return self.cached_input_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "cache_hit_rate": round(self.cache_hit_rate, 3)}
+
+
+class BaseCoach:
+    """Prompt building and safeguards shared by the sync and async coaches."""
 
     def __init__(self, config: Config):
         self.config = config
         self.safeguards = CoachSafeguards()
+        self.usage = UsageStats()
+        self._cacheable_prefix: Optional[str] = None
+        self._prefix_cacheable = False
         self.client = None
         self._init_client()
 
+    def _init_client(self):
+        raise NotImplementedError
+
+    def _system_prompt(
+        self,
+        problem_title: str,
+        state: InterviewState,
+        elapsed_min: float,
+        helpfulness: str,
+        problem_statement: str,
+        summary: str,
+    ) -> SystemPrompt:
+        """Return the parts of the system prompt for this turn."""
+        static = get_static_prompt(problem_statement)
+        dynamic = get_dynamic_prompt(
+            problem_title=problem_title,
+            state=state,
+            helpfulness=helpfulness or self.config.coach_helpfulness,
+            elapsed_min=elapsed_min,
+        )
+        if summary:
+            summary = f"Summary of the earlier part of this interview:\n{summary}"
+        return SystemPrompt(static, summary, dynamic)
+
+    def _build_messages(self, message_history: List[Message], user_message: str) -> List[Dict]:
+        """Convert recent history plus the new message into chat messages."""
+        messages = []
+
+        # Add as much recent history as fits the token budget
+        recent, _ = pack_history(message_history, self.config.llm_history_token_budget)
+        for msg in recent:
+            role = "assistant" if msg.role == MessageRole.COACH else "user"
+            messages.append({"role": role, "content": msg.content})
+
+        # Add current message
+        messages.append({"role": "user", "content": user_message})
+        return messages
+
+    def _request_kwargs(
+        self, system_prompt: SystemPrompt, message_history: List[Message], user_message: str
+    ) -> Dict:
+        """Provider-specific request parameters, laid out so the static prefix can be cached."""
+        static, summary, dynamic = system_prompt
+        messages = self._build_messages(message_history, user_message)
+        kwargs = dict(
+            model=self.config.llm_model,
+            temperature=self.config.llm_temperature,
+            max_tokens=self.config.llm_max_tokens,
+        )
+        if self.engine == "openai":
+            # OpenAI caches the longest repeated prefix automatically, so the static
+            # prompt and history go first and the per-turn state sits just before
+            # the new message.
+            prefix = [{"role": "system", "content": static}]
+            if summary:
+                prefix.append({"role": "system", "content": summary})
+            kwargs["messages"] = (
+                prefix + messages[:-1] + [{"role": "system", "content": dynamic}, messages[-1]]
+            )
+        else:
+            static_block = {"type": "text", "text": static}
+            if self.config.llm_prompt_caching and self._cacheable(static):
+                static_block["cache_control"] = {"type": "ephemeral"}
+            system = [static_block]
+            if summary:
+                system.append({"type": "text", "text": summary})
+            system.append({"type": "text", "text": dynamic})
+            kwargs["system"] = system
+            kwargs["messages"] = messages
+        return kwargs
+
+    def _cacheable(self, static: str) -> bool:
+        """Whether the static prefix is long enough for the provider to cache.
+
+        The rules alone are well under the minimum, so only sessions with a long
+        enough problem statement get a cache breakpoint. Counted once per prefix.
+        """
+        if static != self._cacheable_prefix:
+            self._cacheable_prefix = static
+            self._prefix_cacheable = count_tokens(static) >= MIN_CACHEABLE_PREFIX_TOKENS
+        return self._prefix_cacheable
+
+    def _take_unsummarized(self, session: SessionState) -> List[Message]:
+        """Claim history that has fallen out of the window and still needs summarizing.
+
+        Claimed turns only count as summarized once the new summary is stored
+        (``_store_summary``); the claim is dropped either way when the call ends.
+        """
+        _, evicted = pack_history(session.messages, self.config.llm_history_token_budget)
+        pending = unsummarized(evicted)
+        for msg in pending:
+            msg._summarizing = True
+        return pending
+
+    @staticmethod
+    def _store_summary(session: SessionState, messages: List[Message], summary: str):
+        session.summary = summary
+        for msg in messages:
+            msg._summarized = True
+
+    @staticmethod
+    def _release_claim(messages: List[Message]):
+        for msg in messages:
+            msg._summarizing = False
+
+    def _summary_kwargs(self, previous_summary: str, messages: List[Message]) -> Dict:
+        return dict(
+            model=self.config.llm_model,
+            temperature=0,
+            max_tokens=self.config.llm_summary_max_tokens,
+            messages=[{"role": "user", "content": summary_prompt(previous_summary, messages)}],
+        )
+
+    def _format_kwargs(self, problem: str) -> Dict:
+        kwargs = dict(model=self.config.llm_model, temperature=0.3, max_tokens=1000)
+        if self.engine == "openai":
+            kwargs["messages"] = [
+                {"role": "system", "content": FORMAT_PROBLEM_PROMPT},
+                {"role": "user", "content": problem},
+            ]
+        else:
+            kwargs["system"] = FORMAT_PROBLEM_PROMPT
+            kwargs["messages"] = [{"role": "user", "content": problem}]
+        return kwargs
+
+    def _record_openai_usage(self, usage):
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.usage.requests += 1
+        self.usage.input_tokens += usage.prompt_tokens
+        self.usage.cached_input_tokens += getattr(details, "cached_tokens", 0) or 0
+        self.usage.output_tokens += usage.completion_tokens
+
+    def _record_anthropic_usage(self, usage):
+        if usage is None:
+            return
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        self.usage.requests += 1
+        self.usage.input_tokens += usage.input_tokens + cache_read + cache_write
+        self.usage.cached_input_tokens += cache_read
+        self.usage.cache_write_tokens += cache_write
+        self.usage.output_tokens += usage.output_tokens
+
+
+class Coach(BaseCoach):
+    """AI interview coach that provides guidance without revealing solutions."""
+
     def _init_client(self):
         """Initialize the LLM client based on configuration."""
-        engine = self.config.llm_engine
+        self._summary_executor: Optional[ThreadPoolExecutor] = None
+        self.engine, options = _client_options(self.config)
 
-        if engine == "openai":
+        if self.engine == "openai":
             from openai import OpenAI
-            self.client = OpenAI()
-            self.engine = "openai"
-        elif engine == "anthropic":
-            from anthropic import Anthropic
-            self.client = Anthropic()
-            self.engine = "anthropic"
+            self.client = OpenAI(**options)
         else:
-            raise ValueError(f"Unsupported LLM engine: {engine}")
+            from anthropic import Anthropic
+            self.client = Anthropic(**options)
 
     def get_response(
         self,
@@ -39,75 +229,407 @@ class Coach:
         state: InterviewState,
         elapsed_min: float = 0,
         helpfulness: str = None,
+        problem_statement: str = "",
+        summary: str = "",
     ) -> str:
         """Get a coaching response, applying safeguards."""
 
         # Check for fishing attempts
-        redirect = self.safeguards.detect_fishing(user_message)
+        with span("safeguards.detect_fishing"):
+            redirect = self.safeguards.detect_fishing(user_message)
         if redirect:
             return redirect
 
         # Build conversation history
-        system_prompt = get_system_prompt(
-            problem_title=problem_title,
-            state=state,
-            helpfulness=helpfulness or self.config.coach_helpfulness,
-            elapsed_min=elapsed_min,
+        system_prompt = self._system_prompt(
+            problem_title, state, elapsed_min, helpfulness, problem_statement, summary
         )
 
         # Get LLM response
-        if self.engine == "openai":
-            response = self._get_openai_response(system_prompt, message_history, user_message)
-        else:
-            response = self._get_anthropic_response(system_prompt, message_history, user_message)
+        with span("llm.response", engine=self.engine, model=self.config.llm_model) as llm_span:
+            input_tokens, output_tokens = self.usage.input_tokens, self.usage.output_tokens
+            if self.engine == "openai":
+                response = self._get_openai_response(system_prompt, message_history, user_message)
+            else:
+                response = self._get_anthropic_response(system_prompt, message_history, user_message)
+            llm_span.set(
+                input_tokens=self.usage.input_tokens - input_tokens,
+                output_tokens=self.usage.output_tokens - output_tokens,
+            )
 
         # Apply safeguards
-        filtered_response = self.safeguards.filter_coach_response(response)
+        with span("safeguards.filter"):
+            filtered_response = self.safeguards.filter_coach_response(response)
         return filtered_response
 
-    def _get_openai_response(
-        self, system_prompt: str, message_history: List[Message], user_message: str
-    ) -> str:
-        """Get response from OpenAI API."""
-        messages = [{"role": "system", "content": system_prompt}]
+    def stream_response(
+        self,
+        user_message: str,
+        message_history: List[Message],
+        problem_title: str,
+        state: InterviewState,
+        elapsed_min: float = 0,
+        helpfulness: str = None,
+        problem_statement: str = "",
+        summary: str = "",
+    ) -> Iterator[str]:
+        """Stream a coaching response as text deltas, applying safeguards on the fly.
 
-        # Add message history
-        for msg in message_history[-10:]:  # Keep last 10 messages for context
-            role = "assistant" if msg.role == MessageRole.COACH else "user"
-            messages.append({"role": role, "content": msg.content})
+        If a forbidden pattern shows up mid-stream, the rest of the completion is
+        dropped and the safeguard's rephrase message is streamed instead.
+        """
+        with span("safeguards.detect_fishing"):
+            redirect = self.safeguards.detect_fishing(user_message)
+        if redirect:
+            yield redirect
+            return
 
-        # Add current message
-        messages.append({"role": "user", "content": user_message})
+        system_prompt = self._system_prompt(
+            problem_title, state, elapsed_min, helpfulness, problem_statement, summary
+        )
+
+        llm_span = span("llm.stream", engine=self.engine, model=self.config.llm_model)
+        input_tokens, output_tokens = self.usage.input_tokens, self.usage.output_tokens
+        started = time.perf_counter()
+        first_delta = True
+        guard_s = 0.0
+
+        if self.engine == "openai":
+            deltas = self._stream_openai_response(system_prompt, message_history, user_message)
+        else:
+            deltas = self._stream_anthropic_response(system_prompt, message_history, user_message)
+
+        guard = self.safeguards.stream_filter()
+        try:
+            for delta in deltas:
+                if first_delta:
+                    llm_span.set(ttft_ms=(time.perf_counter() - started) * 1000)
+                    first_delta = False
+                check_start = time.perf_counter()
+                released = guard.feed(delta)
+                guard_s += time.perf_counter() - check_start
+                if released:
+                    yield released
+                if guard.tripped:
+                    llm_span.set(tripped=True)
+                    return
+        finally:
+            deltas.close()
+            llm_span.set(
+                input_tokens=self.usage.input_tokens - input_tokens,
+                output_tokens=self.usage.output_tokens - output_tokens,
+                safeguards_ms=guard_s * 1000,
+            )
+            llm_span.end()
+
+        rest = guard.finish()
+        if rest:
+            yield rest
 
+    def schedule_summary(self, session: SessionState, on_summary: Optional[Callable[[str, int], None]] = None):
+        """Fold turns that left the context window into ``session.summary`` in the background.
+
+        Args:
+            on_summary: Called from the summary thread with the new summary and
+                the number of leading messages it covers (e.g. to journal it)
+        """
+        pending = self._take_unsummarized(session)
+        if not pending:
+            return
+        if self._summary_executor is None:
+            self._summary_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="mochi-summary"
+            )
+        self._summary_executor.submit(self._fold_summary, session, pending, on_summary)
+
+    def summarize(self, previous_summary: str, messages: List[Message]) -> str:
+        """Return ``previous_summary`` updated with ``messages``."""
+        kwargs = self._summary_kwargs(previous_summary, messages)
+        if self.engine == "openai":
+            response = self.client.chat.completions.create(**kwargs)
+            self._record_openai_usage(response.usage)
+            return response.choices[0].message.content.strip()
+
+        response = self.client.messages.create(**kwargs)
+        self._record_anthropic_usage(response.usage)
+        return response.content[0].text.strip()
+
+    def _fold_summary(
+        self, session: SessionState, messages: List[Message], on_summary: Optional[Callable[[str, int], None]]
+    ):
+        try:
+            self._store_summary(session, messages, self.summarize(session.summary, messages))
+        except Exception:
+            return  # Left unsummarized for the next attempt
+        finally:
+            self._release_claim(messages)
+        if on_summary:
+            on_summary(session.summary, summarized_count(session.messages, messages))
+
+    def _get_openai_response(
+        self, system_prompt: SystemPrompt, message_history: List[Message], user_message: str
+    ) -> str:
+        """Get response from OpenAI API."""
         response = self.client.chat.completions.create(
-            model=self.config.llm_model,
-            messages=messages,
-            temperature=self.config.llm_temperature,
-            max_tokens=self.config.llm_max_tokens,
+            **self._request_kwargs(system_prompt, message_history, user_message)
         )
+        self._record_openai_usage(response.usage)
 
         return response.choices[0].message.content
 
+    def _stream_openai_response(
+        self, system_prompt: SystemPrompt, message_history: List[Message], user_message: str
+    ) -> Iterator[str]:
+        """Stream response deltas from OpenAI API."""
+        stream = self.client.chat.completions.create(
+            **self._request_kwargs(system_prompt, message_history, user_message),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if chunk.usage:
+                    self._record_openai_usage(chunk.usage)
+        finally:
+            stream.close()
+
     def _get_anthropic_response(
-        self, system_prompt: str, message_history: List[Message], user_message: str
+        self, system_prompt: SystemPrompt, message_history: List[Message], user_message: str
     ) -> str:
         """Get response from Anthropic API."""
-        messages = []
+        response = self.client.messages.create(
+            **self._request_kwargs(system_prompt, message_history, user_message)
+        )
+        self._record_anthropic_usage(response.usage)
 
-        # Add message history
-        for msg in message_history[-10:]:
-            role = "assistant" if msg.role == MessageRole.COACH else "user"
-            messages.append({"role": role, "content": msg.content})
+        return response.content[0].text
 
-        # Add current message
-        messages.append({"role": "user", "content": user_message})
+    def _stream_anthropic_response(
+        self, system_prompt: SystemPrompt, message_history: List[Message], user_message: str
+    ) -> Iterator[str]:
+        """Stream response deltas from Anthropic API."""
+        with self.client.messages.stream(
+            **self._request_kwargs(system_prompt, message_history, user_message)
+        ) as stream:
+            yield from stream.text_stream
+            self._record_anthropic_usage(stream.get_final_message().usage)
 
-        response = self.client.messages.create(
-            model=self.config.llm_model,
-            system=system_prompt,
-            messages=messages,
-            temperature=self.config.llm_temperature,
-            max_tokens=self.config.llm_max_tokens,
+
+def _client_options(config: Config) -> Tuple[str, Dict[str, Any]]:
+    """Return the wire protocol ("openai" or "anthropic") and SDK client options for the engine.
+
+    The "mock" engine points the real SDK at the in-process stand-in server
+    (see ``mochi.ai.mock_llm``); ``[llm] base_url`` points a real engine at any
+    compatible endpoint, such as a standalone ``mochi mock-llm``.
+    """
+    engine = config.llm_engine
+    if engine == "mock":
+        from mochi.ai.mock_llm import shared_mock_server
+
+        server = shared_mock_server(config)
+        api = config.mock_llm_api
+        base_url = f"{server.url}/v1" if api == "openai" else server.url
+        return api, {"base_url": base_url, "api_key": "mock", "max_retries": 0}
+
+    if engine not in ("openai", "anthropic"):
+        raise ValueError(f"Unsupported LLM engine: {engine}")
+
+    options: Dict[str, Any] = {}
+    if config.llm_base_url:
+        options["base_url"] = config.llm_base_url
+        key_var = "OPENAI_API_KEY" if engine == "openai" else "ANTHROPIC_API_KEY"
+        if not os.getenv(key_var):
+            options["api_key"] = "local"  # Local endpoints don't check it, but the SDKs require one
+    return engine, options
+
+
+def _shared_async_client(config: Config):
+    """Return the process-wide async client for the configured engine, creating it on first use."""
+    with _async_lock:
+        engine, options = _client_options(config)
+        if engine not in _async_clients:
+            if engine == "openai":
+                from openai import AsyncOpenAI
+                _async_clients[engine] = AsyncOpenAI(timeout=config.llm_timeout_s, **options)
+            else:
+                from anthropic import AsyncAnthropic
+                _async_clients[engine] = AsyncAnthropic(timeout=config.llm_timeout_s, **options)
+        return engine, _async_clients[engine]
+
+
+def _shared_async_limit(engine: str, max_concurrent: int) -> asyncio.Semaphore:
+    """Return the process-wide in-flight request limit for ``engine``."""
+    with _async_lock:
+        if engine not in _async_limits:
+            _async_limits[engine] = asyncio.Semaphore(max_concurrent)
+        return _async_limits[engine]
+
+
+class AsyncCoach(BaseCoach):
+    """Async coach for the web server.
+
+    All instances in a process share one async client (and so one connection
+    pool) per provider, and a per-provider semaphore caps in-flight requests.
+    Safeguards are applied exactly as in ``Coach``.
+    """
+
+    def _init_client(self):
+        """Attach the shared async client for the configured engine."""
+        self._summary_tasks: Set[asyncio.Task] = set()
+        self.engine, self.client = _shared_async_client(self.config)
+        self.limit = _shared_async_limit(self.engine, self.config.llm_max_concurrent_requests)
+
+    async def get_response(
+        self,
+        user_message: str,
+        message_history: List[Message],
+        problem_title: str,
+        state: InterviewState,
+        elapsed_min: float = 0,
+        helpfulness: str = None,
+        problem_statement: str = "",
+        summary: str = "",
+    ) -> str:
+        """Get a coaching response, applying safeguards."""
+        redirect = self.safeguards.detect_fishing(user_message)
+        if redirect:
+            return redirect
+
+        system_prompt = self._system_prompt(
+            problem_title, state, elapsed_min, helpfulness, problem_statement, summary
         )
+        kwargs = self._request_kwargs(system_prompt, message_history, user_message)
 
-        return response.content[0].text
+        async with self.limit:
+            if self.engine == "openai":
+                response = await self.client.chat.completions.create(**kwargs)
+                self._record_openai_usage(response.usage)
+                text = response.choices[0].message.content
+            else:
+                response = await self.client.messages.create(**kwargs)
+                self._record_anthropic_usage(response.usage)
+                text = response.content[0].text
+
+        return self.safeguards.filter_coach_response(text)
+
+    async def stream_response(
+        self,
+        user_message: str,
+        message_history: List[Message],
+        problem_title: str,
+        state: InterviewState,
+        elapsed_min: float = 0,
+        helpfulness: str = None,
+        problem_statement: str = "",
+        summary: str = "",
+    ) -> AsyncIterator[str]:
+        """Stream a coaching response as text deltas, applying safeguards on the fly."""
+        redirect = self.safeguards.detect_fishing(user_message)
+        if redirect:
+            yield redirect
+            return
+
+        system_prompt = self._system_prompt(
+            problem_title, state, elapsed_min, helpfulness, problem_statement, summary
+        )
+        kwargs = self._request_kwargs(system_prompt, message_history, user_message)
+        guard = self.safeguards.stream_filter()
+
+        async with self.limit:
+            deltas = self._stream_deltas(kwargs)
+            try:
+                async for delta in deltas:
+                    released = guard.feed(delta)
+                    if released:
+                        yield released
+                    if guard.tripped:
+                        return
+            finally:
+                await deltas.aclose()
+
+        rest = guard.finish()
+        if rest:
+            yield rest
+
+    def schedule_summary(
+        self, session: SessionState, on_summary: Optional[Callable[[str, int], Awaitable[None]]] = None
+    ):
+        """Fold turns that left the context window into ``session.summary`` in the background.
+
+        Must be called from the event loop.
+
+        Args:
+            on_summary: Awaited with the new summary and the number of leading
+                messages it covers (e.g. to journal and save it)
+        """
+        pending = self._take_unsummarized(session)
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._fold_summary(session, pending, on_summary))
+        self._summary_tasks.add(task)
+        task.add_done_callback(self._summary_tasks.discard)
+
+    async def summarize(self, previous_summary: str, messages: List[Message]) -> str:
+        """Return ``previous_summary`` updated with ``messages``."""
+        kwargs = self._summary_kwargs(previous_summary, messages)
+        async with self.limit:
+            if self.engine == "openai":
+                response = await self.client.chat.completions.create(**kwargs)
+                self._record_openai_usage(response.usage)
+                return response.choices[0].message.content.strip()
+
+            response = await self.client.messages.create(**kwargs)
+            self._record_anthropic_usage(response.usage)
+            return response.content[0].text.strip()
+
+    async def format_problem(self, problem: str) -> str:
+        """Return a pasted problem statement as readable markdown."""
+        kwargs = self._format_kwargs(problem)
+        async with self.limit:
+            if self.engine == "openai":
+                response = await self.client.chat.completions.create(**kwargs)
+                self._record_openai_usage(response.usage)
+                return response.choices[0].message.content
+
+            response = await self.client.messages.create(**kwargs)
+            self._record_anthropic_usage(response.usage)
+            return response.content[0].text
+
+    async def _fold_summary(
+        self,
+        session: SessionState,
+        messages: List[Message],
+        on_summary: Optional[Callable[[str, int], Awaitable[None]]],
+    ):
+        try:
+            self._store_summary(session, messages, await self.summarize(session.summary, messages))
+        except Exception:
+            return  # Left unsummarized for the next attempt
+        finally:
+            # Also on cancellation, so the turns aren't stranded outside the summary
+            self._release_claim(messages)
+        if on_summary:
+            await on_summary(session.summary, summarized_count(session.messages, messages))
+
+    async def _stream_deltas(self, kwargs: Dict) -> AsyncIterator[str]:
+        """Stream raw text deltas from the configured provider."""
+        if self.engine == "openai":
+            stream = await self.client.chat.completions.create(
+                **kwargs, stream=True, stream_options={"include_usage": True}
+            )
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                    if chunk.usage:
+                        self._record_openai_usage(chunk.usage)
+            finally:
+                await stream.close()
+        else:
+            async with self.client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                self._record_anthropic_usage((await stream.get_final_message()).usage)
@@ -0,0 +1,89 @@
+"""Token-budgeted conversation window."""
+
+from typing import List, Tuple
+
+from mochi.schemas import Message, MessageRole
+
+# Per-message overhead for role and formatting tokens
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Providers only cache prompt prefixes of at least this many tokens (Anthropic's
+# minimum for Sonnet/Opus, and where OpenAI's automatic caching starts); a
+# shorter prefix marked cacheable is silently sent uncached
+MIN_CACHEABLE_PREFIX_TOKENS = 1024
+
+_encoder = None
+_encoder_loaded = False
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken when it is installed, otherwise estimate ~4 chars per token."""
+    global _encoder, _encoder_loaded
+    if not _encoder_loaded:
+        _encoder_loaded = True
+        try:
+            import tiktoken
+            _encoder = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            _encoder = None
+
+    if _encoder is not None:
+        return len(_encoder.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def message_tokens(message: Message) -> int:
+    """Token count for a message, computed once and cached on the message."""
+    if message._tokens is None:
+        message._tokens = count_tokens(message.content) + MESSAGE_OVERHEAD_TOKENS
+    return message._tokens
+
+
+def pack_history(messages: List[Message], budget_tokens: int) -> Tuple[List[Message], List[Message]]:
+    """Split history into the newest messages that fit the budget and the older ones.
+
+    Returns:
+        (kept, evicted), both in chronological order
+    """
+    used = 0
+    start = len(messages)
+    while start > 0:
+        cost = message_tokens(messages[start - 1])
+        if used + cost > budget_tokens:
+            break
+        used += cost
+        start -= 1
+    return messages[start:], messages[:start]
+
+
+def unsummarized(evicted: List[Message]) -> List[Message]:
+    """Evicted messages that aren't in the rolling summary or on their way into it."""
+    return [m for m in evicted if not (m._summarized or m._summarizing)]
+
+
+def summarized_count(messages: List[Message], folded: List[Message]) -> int:
+    """Length of the history prefix covered once ``folded`` is in the summary."""
+    last = folded[-1]
+    return next((i + 1 for i, m in enumerate(messages) if m is last), 0)
+
+
+def summary_prompt(previous_summary: str, messages: List[Message]) -> str:
+    """Build the request that folds newly evicted turns into the rolling summary."""
+    transcript = "\n".join(
+        f"{'Interviewer' if m.role == MessageRole.COACH else 'Candidate'}: {m.content}"
+        for m in messages
+    )
+    previous = previous_summary or "(none yet)"
+    return f"""Update the running summary of a mock coding interview.
+
+Keep it under 150 words. Record the candidate's understanding of the problem, approaches
+they proposed, bugs or edge cases discussed, hints already given, and open questions.
+Write plain prose with no markdown.
+
+Current summary:
+{previous}
+
+New turns to fold in:
+{transcript}
+
+Updated summary:"""
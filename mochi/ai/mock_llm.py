@@ -0,0 +1,371 @@
+"""Local stand-in for the OpenAI and Anthropic APIs, for offline profiling and load tests.
+
+``MockLLMServer`` is a small threaded HTTP server on localhost that answers
+``POST /v1/chat/completions`` (OpenAI) and ``POST /v1/messages`` (Anthropic),
+streaming included, in the wire format the official SDKs parse. The coach
+talks to it through the real SDK clients, so everything except the network
+hop to the provider is exercised.
+
+Replies come from a script (or a few built-in coaching lines) and are paced
+by a latency model: time to first token drawn from a configurable
+distribution, then tokens at a fixed rate. Draws are seeded from the request
+content, so the same conversation gets the same timings on every run.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+from mochi.ai.context import MIN_CACHEABLE_PREFIX_TOKENS, count_tokens
+
+DEFAULT_REPLIES = [
+    "Good start. Before you code anything, walk me through how you'd handle the smallest possible input.",
+    "That works. What's the time complexity of that approach, and where does most of the work happen?",
+    "Interesting idea. Is there anything you could remember as you go so you don't repeat work?",
+    "Let's test that against one of the examples. Trace through it step by step for me.",
+    "Nice progress. What edge cases would you want to check before calling this done?",
+]
+
+_TOKEN = re.compile(r"\S+\s*|\s+")
+
+
+class LatencyModel:
+    """Time to first token plus a steady token rate.
+
+    ``distribution`` shapes the time to first token around ``ttft_ms``:
+    "fixed", "uniform" (± ``jitter_ms``), "normal" (σ = ``jitter_ms``) or
+    "lognormal" (median ``ttft_ms``, σ of the log chosen so the spread is
+    roughly ``jitter_ms``), which has the long tail real providers show.
+    """
+
+    DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, ttft_ms: float = 400, jitter_ms: float = 150, distribution: str = "lognormal",
+                 tokens_per_s: float = 60):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.ttft_ms = ttft_ms
+        self.jitter_ms = jitter_ms
+        self.distribution = distribution
+        self.tokens_per_s = tokens_per_s
+
+    def ttft_s(self, rng: random.Random) -> float:
+        if self.distribution == "fixed" or self.jitter_ms <= 0:
+            ms = self.ttft_ms
+        elif self.distribution == "uniform":
+            ms = rng.uniform(self.ttft_ms - self.jitter_ms, self.ttft_ms + self.jitter_ms)
+        elif self.distribution == "normal":
+            ms = rng.gauss(self.ttft_ms, self.jitter_ms)
+        else:
+            ms = rng.lognormvariate(0, self.jitter_ms / max(self.ttft_ms, 1)) * self.ttft_ms
+        return max(ms, 0) / 1000
+
+    def token_interval_s(self) -> float:
+        return 1 / self.tokens_per_s if self.tokens_per_s > 0 else 0
+
+
+class ScriptedReplies:
+    """Pick a reply for the latest user message.
+
+    A script is a YAML/JSON list of ``{match: <regex>, reply: <text>}`` entries;
+    the first entry whose pattern is found (case-insensitively) in the user's
+    message wins. Entries without ``match`` are fallbacks, used in rotation.
+    """
+
+    def __init__(self, entries: Optional[List[Dict[str, str]]] = None):
+        entries = entries or [{"reply": reply} for reply in DEFAULT_REPLIES]
+        self._matched: List[Tuple[re.Pattern, str]] = [
+            (re.compile(entry["match"], re.IGNORECASE), entry["reply"]) for entry in entries if entry.get("match")
+        ]
+        self._fallback = [entry["reply"] for entry in entries if not entry.get("match")] or DEFAULT_REPLIES
+
+    @classmethod
+    def from_file(cls, path: Path) -> "ScriptedReplies":
+        with open(Path(path).expanduser()) as f:
+            return cls(yaml.safe_load(f) or [])
+
+    def reply(self, user_message: str, turn: int) -> str:
+        for pattern, reply in self._matched:
+            if pattern.search(user_message):
+                return reply
+        return self._fallback[turn % len(self._fallback)]
+
+
+class MockLLMServer:
+    """Threaded localhost server speaking the chat-completions and messages APIs."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Optional[LatencyModel] = None,
+        replies: Optional[ScriptedReplies] = None,
+        seed: int = 0,
+    ):
+        self.latency = latency or LatencyModel()
+        self.replies = replies or ScriptedReplies()
+        self.seed = seed
+        self.requests = 0
+        self._cached_prefixes = set()
+        self._lock = threading.Lock()
+        self._httpd = _HTTPServer((host, port), _handler_for(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockLLMServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mochi-mock-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    # Shared by both APIs
+
+    def _plan(self, prompt_text: str, user_message: str, turn: int) -> Tuple[List[str], float, float]:
+        """Reply tokens, time to first token and per-token interval for a request."""
+        digest = hashlib.sha256(f"{self.seed}\0{turn}\0{prompt_text}".encode()).digest()
+        rng = random.Random(digest)
+        with self._lock:
+            self.requests += 1
+        text = self.replies.reply(user_message, turn)
+        return _TOKEN.findall(text), self.latency.ttft_s(rng), self.latency.token_interval_s()
+
+    def _cache_hit(self, prefix: str) -> bool:
+        """Simulate provider prompt caching: a repeated static prefix is a hit."""
+        key = hashlib.sha256(prefix.encode()).digest()
+        with self._lock:
+            hit = key in self._cached_prefixes
+            self._cached_prefixes.add(key)
+        return hit
+
+    # OpenAI chat completions
+
+    def chat_completion(self, body: Dict[str, Any]) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+        messages = body.get("messages", [])
+        prompt_text = "\n".join(_text(m.get("content")) for m in messages)
+        user = next((_text(m.get("content")) for m in reversed(messages) if m.get("role") == "user"), "")
+        turn = sum(1 for m in messages if m.get("role") == "user")
+        tokens, ttft, interval = self._plan(prompt_text, user, turn)
+
+        static = _text(messages[0].get("content")) if messages and messages[0].get("role") == "system" else ""
+        prompt_tokens = count_tokens(prompt_text) + 4 * len(messages)
+        static_tokens = count_tokens(static) if static else 0
+        cacheable = static_tokens >= MIN_CACHEABLE_PREFIX_TOKENS
+        cached = static_tokens if cacheable and self._cache_hit(static) else 0
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(tokens),
+            "total_tokens": prompt_tokens + len(tokens),
+            "prompt_tokens_details": {"cached_tokens": cached},
+        }
+        base = {"id": f"chatcmpl-mock-{uuid.uuid4().hex[:12]}", "created": int(time.time()),
+                "model": body.get("model", "mock")}
+
+        def complete():
+            time.sleep(ttft + interval * len(tokens))
+            return {
+                **base,
+                "object": "chat.completion",
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(tokens)},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            }
+
+        def stream():
+            chunk = {**base, "object": "chat.completion.chunk"}
+            time.sleep(ttft)
+            for i, token in enumerate(tokens):
+                if i:
+                    time.sleep(interval)
+                delta = {"role": "assistant", "content": token} if i == 0 else {"content": token}
+                yield {**chunk, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+            yield {**chunk, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+            if (body.get("stream_options") or {}).get("include_usage"):
+                yield {**chunk, "choices": [], "usage": usage}
+
+        return (None, stream()) if body.get("stream") else (complete(), iter(()))
+
+    # Anthropic messages
+
+    def message(self, body: Dict[str, Any]) -> Tuple[Dict[str, Any], Iterator[Tuple[str, Dict[str, Any]]]]:
+        system = body.get("system") or []
+        if isinstance(system, str):
+            system = [{"type": "text", "text": system}]
+        messages = body.get("messages", [])
+        prompt_text = "\n".join([_text(system)] + [_text(m.get("content")) for m in messages])
+        user = next((_text(m.get("content")) for m in reversed(messages) if m.get("role") == "user"), "")
+        turn = sum(1 for m in messages if m.get("role") == "user")
+        tokens, ttft, interval = self._plan(prompt_text, user, turn)
+
+        # Everything up to the last cache_control breakpoint is cacheable, if it
+        # reaches the provider's minimum prefix length
+        marked = [i for i, block in enumerate(system) if block.get("cache_control")]
+        prefix = _text(system[:marked[-1] + 1]) if marked else ""
+        prefix_tokens = count_tokens(prefix) if prefix else 0
+        if prefix_tokens < MIN_CACHEABLE_PREFIX_TOKENS:
+            prefix, prefix_tokens = "", 0
+        hit = bool(prefix) and self._cache_hit(prefix)
+        usage = {
+            "input_tokens": count_tokens(prompt_text) + 4 * len(messages) - prefix_tokens,
+            "output_tokens": len(tokens),
+            "cache_read_input_tokens": prefix_tokens if hit else 0,
+            "cache_creation_input_tokens": 0 if hit else prefix_tokens,
+        }
+        message = {
+            "id": f"msg_mock_{uuid.uuid4().hex[:12]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "mock"),
+            "content": [],
+            "stop_reason": None,
+            "stop_sequence": None,
+            "usage": {**usage, "output_tokens": 0},
+        }
+
+        def complete():
+            time.sleep(ttft + interval * len(tokens))
+            return {**message, "content": [{"type": "text", "text": "".join(tokens)}],
+                    "stop_reason": "end_turn", "usage": usage}
+
+        def stream():
+            yield "message_start", {"type": "message_start", "message": message}
+            yield "content_block_start", {"type": "content_block_start", "index": 0,
+                                          "content_block": {"type": "text", "text": ""}}
+            time.sleep(ttft)
+            for i, token in enumerate(tokens):
+                if i:
+                    time.sleep(interval)
+                yield "content_block_delta", {"type": "content_block_delta", "index": 0,
+                                              "delta": {"type": "text_delta", "text": token}}
+            yield "content_block_stop", {"type": "content_block_stop", "index": 0}
+            yield "message_delta", {"type": "message_delta",
+                                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                    "usage": {"output_tokens": len(tokens)}}
+            yield "message_stop", {"type": "message_stop"}
+
+        return (None, stream()) if body.get("stream") else (complete(), iter(()))
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # Load tests open many connections at once
+
+
+def _text(content: Any) -> str:
+    """Flatten a message's content (a string or a list of content blocks) to text."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(block.get("text", "") for block in content if isinstance(block, dict))
+    return ""
+
+
+def _handler_for(server: MockLLMServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                return self._send_json(400, {"error": {"type": "invalid_request_error", "message": "Invalid JSON"}})
+
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path.endswith("/chat/completions"):
+                response, events = server.chat_completion(body)
+                if response is not None:
+                    return self._send_json(200, response)
+                self._send_stream((f"data: {json.dumps(chunk)}\n\n" for chunk in events), done="data: [DONE]\n\n")
+            elif path.endswith("/messages"):
+                response, events = server.message(body)
+                if response is not None:
+                    return self._send_json(200, response)
+                self._send_stream(f"event: {name}\ndata: {json.dumps(event)}\n\n" for name, event in events)
+            else:
+                self._send_json(404, {"error": {"type": "not_found_error", "message": f"No route for {path}"}})
+
+        def _send_json(self, status: int, payload: Dict[str, Any]):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _send_stream(self, events: Iterator[str], done: str = ""):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                for event in events:
+                    self._write_chunk(event)
+                if done:
+                    self._write_chunk(done)
+                self.wfile.write(b"0\r\n\r\n")
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                self.close_connection = True  # Client stopped reading (e.g. safeguard tripped)
+
+        def _write_chunk(self, text: str):
+            data = text.encode()
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+    return Handler
+
+
+_server: Optional[MockLLMServer] = None
+_server_lock = threading.Lock()
+
+
+def server_from_config(config, host: str = "127.0.0.1", port: int = 0) -> MockLLMServer:
+    """Build a (not yet started) server from the ``[mock_llm]`` settings."""
+    script = config.mock_llm_script
+    return MockLLMServer(
+        host=host,
+        port=port,
+        latency=LatencyModel(
+            ttft_ms=config.mock_llm_ttft_ms,
+            jitter_ms=config.mock_llm_jitter_ms,
+            distribution=config.mock_llm_distribution,
+            tokens_per_s=config.mock_llm_tokens_per_s,
+        ),
+        replies=ScriptedReplies.from_file(Path(script)) if script else None,
+        seed=config.mock_llm_seed,
+    )
+
+
+def shared_mock_server(config) -> MockLLMServer:
+    """The process-wide in-process mock server used by the "mock" engine, started on first use."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = server_from_config(config).start()
+        return _server
@@ -1,7 +1,107 @@
 """Anti-solution-leak safeguards for coaching."""
 
 import re
-from typing import Optional
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+
+def _compile_alternation(patterns: List[str]) -> re.Pattern:
+    """Compile patterns into a single case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+def _max_match_width(patterns: List[str]) -> Optional[int]:
+    """Longest text any of ``patterns`` can match, or None if one can repeat."""
+    widths = [_pattern_width(p) for p in patterns]
+    if None in widths:
+        return None
+    return max(widths, default=0)
+
+
+def _pattern_width(pattern: str) -> Optional[int]:
+    """Length of the longest literal phrase ``pattern`` can match.
+
+    Understands the subset the forbidden patterns are written in: literals,
+    escapes, character classes, groups, alternation and ``?``. Anything else
+    that could make a match longer (``*``, ``+``, ``{n}``, other ``(?``
+    groups) returns None, so the caller falls back to holding everything.
+    """
+    # One entry per open group: [longest finished alternative, current alternative]
+    stack = [[0, 0]]
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char in "*+{":
+            return None
+        if char == "(":
+            if pattern.startswith("(?", i) and not pattern.startswith("(?:", i):
+                return None
+            stack.append([0, 0])
+            i += 3 if pattern.startswith("(?:", i) else 1
+            continue
+        if char == ")":
+            longest, current = stack.pop()
+            stack[-1][1] += max(longest, current)
+        elif char == "|":
+            stack[-1][0] = max(stack[-1])
+            stack[-1][1] = 0
+        elif char == "?":
+            pass  # Optional: doesn't change the longest match
+        elif char == "\\":
+            stack[-1][1] += 1
+            i += 1
+        elif char == "[":
+            stack[-1][1] += 1
+            i = pattern.index("]", i + 2)
+        else:
+            stack[-1][1] += 1
+        i += 1
+    return max(stack[0])
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton that finds every phrase occurring in a text in one pass."""
+
+    def __init__(self, phrases: List[str]):
+        self.phrases = phrases
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, phrase in enumerate(phrases):
+            state = 0
+            for char in phrase:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._out[state].append(index)
+
+        # Breadth-first pass to link each state to its longest proper suffix state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> List[int]:
+        """Return the indices of all phrases found in ``text``."""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found.update(self._out[state])
+        return sorted(found)
 
 
 class CoachSafeguards:
@@ -28,20 +128,88 @@ class CoachSafeguards:
         "i give up": "Let's try a simpler version first. What if the array had only 2 elements?",
     }
 
-    def filter_coach_response(self, response: str) -> str:
+    REPHRASE_MESSAGE = (
+        "Let me rephrase that more carefully - I want to guide you "
+        "without giving away the solution. What specific part are you stuck on?"
+    )
+
+    def __init__(self):
+        # Compiled once per instance so subclasses can extend the pattern lists
+        self.forbidden = _compile_alternation(self.FORBIDDEN_PATTERNS)
+        self.forbidden_width = _max_match_width(self.FORBIDDEN_PATTERNS)
+        self._fishing_phrases: List[Tuple[str, str]] = list(self.FISHING_ATTEMPTS.items())
+        self._fishing = PhraseMatcher([phrase for phrase, _ in self._fishing_phrases])
+
+    def contains_forbidden(self, response: str) -> bool:
         """Check if response contains forbidden patterns."""
-        for pattern in self.FORBIDDEN_PATTERNS:
-            if re.search(pattern, response, re.IGNORECASE):
-                return (
-                    "Let me rephrase that more carefully - I want to guide you "
-                    "without giving away the solution. What specific part are you stuck on?"
-                )
+        return self.forbidden.search(response) is not None
+
+    def filter_coach_response(self, response: str) -> str:
+        """Replace responses that contain forbidden patterns."""
+        if self.contains_forbidden(response):
+            return self.REPHRASE_MESSAGE
         return response
 
+    def stream_filter(self) -> "ResponseStreamFilter":
+        """Start an incremental check for a streamed response."""
+        return ResponseStreamFilter(self)
+
     def detect_fishing(self, user_text: str) -> Optional[str]:
         """Detect attempts to extract the solution."""
-        lower_text = user_text.lower()
-        for pattern, redirect in self.FISHING_ATTEMPTS.items():
-            if pattern in lower_text:
-                return redirect
-        return None
+        matches = self._fishing.find_all(user_text.lower())
+        if not matches:
+            return None
+        # Earliest-listed phrase wins, as with a scan in list order
+        return self._fishing_phrases[matches[0]][1]
+
+
+class ResponseStreamFilter:
+    """Check a streamed response chunk by chunk.
+
+    Only the new chunk plus a carry-over of the last ``width - 1`` characters
+    is searched, where ``width`` bounds the longest forbidden match, so
+    each chunk costs the same regardless of how long the response has grown.
+    The carry-over is held back from the caller until it can no longer be the
+    start of a match.
+    """
+
+    def __init__(self, safeguards: CoachSafeguards):
+        self.safeguards = safeguards
+        width = safeguards.forbidden_width
+        self.carry_chars = max(width - 1, 0) if width is not None else None
+        self._carry = ""
+        self._released_any = False
+        self.tripped = False
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk and return the text that is now safe to release.
+
+        Once a forbidden pattern is found, returns the rephrase message and
+        sets ``tripped``; the caller should stop streaming.
+        """
+        if self.tripped:
+            return ""
+
+        window = self._carry + chunk
+        if self.safeguards.contains_forbidden(window):
+            self.tripped = True
+            separator = "\n\n" if self._released_any else ""
+            return separator + self.safeguards.REPHRASE_MESSAGE
+
+        if self.carry_chars is None:
+            # Unbounded pattern: hold everything until the end
+            self._carry = window
+            return ""
+
+        cut = max(len(window) - self.carry_chars, 0)
+        released, self._carry = window[:cut], window[cut:]
+        if released:
+            self._released_any = True
+        return released
+
+    def finish(self) -> str:
+        """Release the held-back tail once the stream has ended."""
+        if self.tripped:
+            return ""
+        rest, self._carry = self._carry, ""
+        return rest
@@ -55,11 +55,31 @@ def cli():
     type=click.Choice(["gentle", "balanced", "insistent"], case_sensitive=False),
     help="Override coach helpfulness level for this session",
 )
-def start(file: str, problem: str, config: str, voice: bool, tts_mode: str, helpfulness: str):
+@click.option(
+    "--tests",
+    "-t",
+    type=click.Path(exists=True),
+    help="YAML file of test cases to run on 'test' (see examples/problems/two_sum/tests.yaml)",
+)
+@click.option(
+    "--problem-id",
+    "-i",
+    help="Load a problem (and its tests) from the problem bank, see 'mochi problems'",
+)
+def start(
+    file: str,
+    problem: str,
+    config: str,
+    voice: bool,
+    tts_mode: str,
+    helpfulness: str,
+    tests: str,
+    problem_id: str,
+):
     """Start a new mock interview session.
 
     Copy the problem statement from LeetCode/etc and paste it when prompted,
-    or provide it via --problem flag.
+    provide it via --problem flag, or pick one from the bank with --problem-id.
     """
 
     # Validate inputs
@@ -82,16 +102,26 @@ def start(file: str, problem: str, config: str, voice: bool, tts_mode: str, help
         cfg = Config(str(config_path))
 
         # Check for API keys
-        import os
-        if cfg.llm_engine == "openai" and not os.getenv("OPENAI_API_KEY"):
-            console.print("[red]Error: OPENAI_API_KEY environment variable not set[/red]")
-            console.print("[yellow]Set it with: export OPENAI_API_KEY='your-key'[/yellow]")
-            return
-        elif cfg.llm_engine == "anthropic" and not os.getenv("ANTHROPIC_API_KEY"):
-            console.print("[red]Error: ANTHROPIC_API_KEY environment variable not set[/red]")
-            console.print("[yellow]Set it with: export ANTHROPIC_API_KEY='your-key'[/yellow]")
+        if _missing_api_key(cfg):
             return
 
+        # Load a bank problem, its tests and starter code
+        problem_title = "Interview Problem"
+        test_cases = None
+        if problem_id:
+            bank = _open_bank(cfg)
+            if problem_id not in bank:
+                console.print(f"[red]Error: Unknown problem '{problem_id}' in {bank.problems_dir}[/red]")
+                console.print("[yellow]Tip: List available problems with 'mochi problems'[/yellow]")
+                return
+            bank_problem = bank.get(problem_id)
+            problem = bank_problem.description
+            problem_title = bank_problem.title
+            if not tests:
+                test_cases = [case.model_dump() for case in bank.tests(problem_id)]
+            if not solution_file.read_text().strip():
+                solution_file.write_text(bank.starter_code(problem_id))
+
         # Get problem statement if not provided
         if not problem:
             console.print("\n[bold cyan]Paste your problem statement[/bold cyan]")
@@ -125,7 +155,12 @@ def start(file: str, problem: str, config: str, voice: bool, tts_mode: str, help
             config=cfg,
             voice_mode=voice,
             tts_mode=tts_mode,
-            helpfulness_override=helpfulness
+            helpfulness_override=helpfulness,
+            tests_file=Path(tests) if tests else None,
+            test_cases=test_cases,
+            problem_title=problem_title,
+            problem_id=problem_id or "custom",
+            journal=_new_journal(cfg),
         )
         orchestrator.start()
 
@@ -137,6 +172,194 @@ def start(file: str, problem: str, config: str, voice: bool, tts_mode: str, help
         console.print(f"[dim]{traceback.format_exc()}[/dim]")
 
 
+def _missing_api_key(cfg: Config) -> bool:
+    """Report (and return True) when the configured LLM engine has no API key set."""
+    import os
+    if cfg.llm_base_url:
+        return False  # Local endpoint
+    if cfg.llm_engine == "openai" and not os.getenv("OPENAI_API_KEY"):
+        console.print("[red]Error: OPENAI_API_KEY environment variable not set[/red]")
+        console.print("[yellow]Set it with: export OPENAI_API_KEY='your-key'[/yellow]")
+        return True
+    elif cfg.llm_engine == "anthropic" and not os.getenv("ANTHROPIC_API_KEY"):
+        console.print("[red]Error: ANTHROPIC_API_KEY environment variable not set[/red]")
+        console.print("[yellow]Set it with: export ANTHROPIC_API_KEY='your-key'[/yellow]")
+        return True
+    return False
+
+
+def _new_journal(cfg: Config):
+    if not cfg.journal_dir:
+        return None
+    from mochi.core.journal import SessionJournal
+
+    return SessionJournal.create(Path(cfg.journal_dir), fsync_interval_s=cfg.journal_fsync_interval_s)
+
+
+@cli.command()
+@click.argument("session", required=False)
+@click.option(
+    "--file",
+    "-f",
+    type=click.Path(),
+    help="Solution file (default: the one the session was using)",
+)
+@click.option(
+    "--config",
+    "-c",
+    default="settings.toml",
+    type=click.Path(exists=True),
+    help="Path to configuration file",
+)
+@click.option(
+    "--voice/--no-voice",
+    default=True,
+    help="Enable/disable voice mode (default: enabled)",
+)
+@click.option(
+    "--tts-mode",
+    type=click.Choice(["local", "api"], case_sensitive=False),
+    default="local",
+    help="TTS mode: 'local' for pyttsx3, 'api' for LLM audio",
+)
+@click.option(
+    "--helpfulness",
+    type=click.Choice(["gentle", "balanced", "insistent"], case_sensitive=False),
+    help="Override coach helpfulness level for this session",
+)
+def resume(session: str, file: str, config: str, voice: bool, tts_mode: str, helpfulness: str):
+    """Resume an interrupted session from its journal.
+
+    SESSION is a session id (or a prefix of one) or a journal path; the most
+    recent session is resumed when it is omitted.
+    """
+    from mochi.core.journal import SessionJournal, find_journal, replay
+
+    cfg = Config(config)
+    if not cfg.journal_dir:
+        console.print("[red]Error: Session journaling is off (set [app] journal_dir)[/red]")
+        return
+
+    path = find_journal(Path(cfg.journal_dir), session)
+    if path is None:
+        console.print(f"[red]Error: No session journal found in {cfg.journal_dir}[/red]")
+        return
+
+    try:
+        header, state = replay(path)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error: Could not read {path}: {e}[/red]")
+        return
+
+    solution_file = Path(file or state.solution_file)
+    if not solution_file.is_file():
+        console.print(f"[red]Error: Solution file not found: '{solution_file}' (pass it with --file)[/red]")
+        return
+
+    if _missing_api_key(cfg):
+        return
+
+    orchestrator = Orchestrator(
+        problem_statement=header.get("problem_statement", ""),
+        solution_file=solution_file,
+        config=cfg,
+        voice_mode=voice,
+        tts_mode=tts_mode,
+        helpfulness_override=helpfulness,
+        test_cases=header.get("test_cases"),
+        problem_title=header.get("problem_title", "Interview Problem"),
+        journal=SessionJournal(path, fsync_interval_s=cfg.journal_fsync_interval_s),
+        resume_state=state,
+    )
+    orchestrator.start()
+
+
+@cli.command()
+@click.argument("session", required=False)
+@click.option(
+    "--config",
+    "-c",
+    default="settings.toml",
+    type=click.Path(exists=True),
+    help="Path to configuration file",
+)
+def trace(session: str, config: str):
+    """Show per-stage latency percentiles for a session.
+
+    SESSION is a session id (or a prefix of one) or a trace file; the most
+    recent session is shown when it is omitted.
+    """
+    from rich.table import Table
+    from mochi.core.tracing import find_trace, load_trace, percentiles, stage_durations
+
+    cfg = Config(config)
+    path = find_trace(Path(cfg.trace_dir or "~/.mochi/traces"), session)
+    if path is None:
+        console.print(f"[red]Error: No trace found in {cfg.trace_dir}[/red]")
+        return
+
+    stages = stage_durations(load_trace(path))
+    if not stages:
+        console.print(f"[yellow]No spans recorded in {path}[/yellow]")
+        return
+
+    table = Table(title=f"Stage latency (ms) - {path.name}")
+    table.add_column("Stage", style="cyan", no_wrap=True)
+    for column in ("Count", "p50", "p95", "p99", "Max", "Total"):
+        table.add_column(column, justify="right")
+    for name, durations in sorted(stages.items()):
+        p50, p95, p99 = percentiles(durations)
+        table.add_row(
+            name, str(len(durations)), f"{p50:.1f}", f"{p95:.1f}", f"{p99:.1f}",
+            f"{max(durations):.1f}", f"{sum(durations):.0f}",
+        )
+    console.print(table)
+    console.print(f"[dim]Open {path} in https://ui.perfetto.dev for a timeline[/dim]")
+
+
+def _open_bank(cfg: Config):
+    from mochi.core.problem_bank import ProblemBank
+
+    cache_dir = Path(cfg.problem_cache_dir) if cfg.problem_cache_dir else None
+    return ProblemBank(Path(cfg.problems_dir), cache_dir)
+
+
+@cli.command()
+@click.option(
+    "--config",
+    "-c",
+    default="settings.toml",
+    type=click.Path(exists=True),
+    help="Path to configuration file",
+)
+@click.option(
+    "--difficulty",
+    "-d",
+    type=click.Choice(["easy", "medium", "hard"], case_sensitive=False),
+    help="Only show problems of this difficulty",
+)
+@click.option("--tag", help="Only show problems with this tag")
+def problems(config: str, difficulty: str, tag: str):
+    """List problems in the problem bank."""
+    from rich.table import Table
+
+    bank = _open_bank(Config(config))
+    summaries = bank.list(difficulty=difficulty.lower() if difficulty else None, tag=tag)
+    if not summaries:
+        console.print(f"[yellow]No problems found in {bank.problems_dir}[/yellow]")
+        return
+
+    table = Table(title=f"Problems ({len(summaries)})")
+    table.add_column("ID", style="cyan")
+    table.add_column("Title")
+    table.add_column("Difficulty")
+    table.add_column("Tags", style="dim")
+    for summary in summaries:
+        table.add_row(summary.id, summary.title, summary.difficulty, ", ".join(summary.tags))
+    console.print(table)
+    console.print("[dim]Start one with: mochi start -f solution.py --problem-id <ID>[/dim]")
+
+
 @cli.command()
 @click.option(
     "--host",
@@ -149,7 +372,20 @@ def start(file: str, problem: str, config: str, voice: bool, tts_mode: str, help
     type=int,
     help="Port to run the web server on (default: 8000)",
 )
-def web(host: str, port: int):
+@click.option(
+    "--config",
+    "-c",
+    default="settings.toml",
+    type=click.Path(),
+    help="Path to configuration file",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    help="Worker processes (default: [server] workers; 0 = one per CPU)",
+)
+def web(host: str, port: int, config: str, workers: int):
     """Start the web-based interview interface.
 
     This starts a local web server where you can:
@@ -160,16 +396,250 @@ def web(host: str, port: int):
     """
     from mochi.server import run_server
 
+    cfg = Config(config)
+    if workers is None:
+        workers = cfg.server_workers
+    if workers != 1 and cfg.server_session_store == "memory":
+        console.print("[yellow]Warning: with session_store = \"memory\" each worker keeps its own sessions; "
+                      "set [server] session_store = \"sqlite\" so a reconnect can land on any worker[/yellow]")
+
     console.print(f"[bold cyan]🌐 Starting Mochi web server...[/bold cyan]")
     console.print(f"[green]✓[/green] Server running at: [bold]http://{host}:{port}[/bold]")
     console.print(f"[dim]Press Ctrl+C to stop[/dim]\n")
 
     try:
-        run_server(host=host, port=port)
+        run_server(host=host, port=port, config_path=config, workers=workers)
     except KeyboardInterrupt:
         console.print("\n[yellow]Server stopped[/yellow]")
 
 
+@cli.command()
+@click.option(
+    "--config",
+    "-c",
+    default="settings.toml",
+    type=click.Path(),
+    help="Path to configuration file",
+)
+@click.option(
+    "--engine",
+    "-e",
+    help="Speech-to-text engine to prepare (default: from settings.toml)",
+)
+@click.option(
+    "--model",
+    "-m",
+    help="Model size to prepare (default: from settings.toml)",
+)
+def warmup(config: str, engine: str, model: str):
+    """Download and warm up the speech models.
+
+    Run once after installing so the first interview doesn't wait on a
+    model download, and to pre-render the coach's fixed phrases.
+    """
+    from mochi.io.stt import warmup as warmup_stt
+
+    cfg = Config(config) if Path(config).exists() else None
+    engine = engine or (cfg.stt_engine if cfg else "whisper")
+    model = model or (cfg.stt_model_size if cfg else "base")
+    compute_type = cfg.stt_compute_type if cfg else "int8"
+
+    with console.status(f"[dim]Preparing {engine} {model} model...[/dim]"):
+        warmup_stt(engine, model, compute_type)
+    console.print(f"[green]✓[/green] {engine} {model} model ready")
+
+    cache_dir = cfg.tts_cache_dir if cfg else "~/.cache/mochi/tts"
+    if cache_dir:
+        from mochi.core.orchestrator import canned_phrases
+        from mochi.io.tts import TextToSpeech
+
+        tts = TextToSpeech(rate=cfg.tts_rate_wpm if cfg else 180, cache_dir=Path(cache_dir))
+        with console.status("[dim]Rendering fixed coach phrases...[/dim]"):
+            rendered = tts.prerender(canned_phrases())
+        console.print(f"[green]✓[/green] Phrase audio cache ready ({rendered} new clips in {cache_dir})")
+
+
+@cli.command("mock-llm")
+@click.option("--host", default="127.0.0.1", help="Host to bind to (default: 127.0.0.1)")
+@click.option("--port", default=8765, type=int, help="Port to listen on (default: 8765)")
+@click.option(
+    "--config",
+    "-c",
+    default="settings.toml",
+    type=click.Path(),
+    help="Path to configuration file (latency and script from [mock_llm])",
+)
+def mock_llm(host: str, port: int, config: str):
+    """Run the offline OpenAI/Anthropic stand-in as a standalone server.
+
+    Point any number of 'mochi web' workers or load generators at it with
+    [llm] base_url. No API key or network access is needed.
+    """
+    from mochi.ai.mock_llm import server_from_config
+
+    cfg = Config(config) if Path(config).exists() else None
+    if cfg is None:
+        console.print(f"[yellow]No config at {config}, using default latency and replies[/yellow]")
+        from mochi.ai.mock_llm import MockLLMServer
+        server = MockLLMServer(host=host, port=port)
+    else:
+        server = server_from_config(cfg, host=host, port=port)
+
+    latency = server.latency
+    console.print(f"[bold cyan]🧪 Mock LLM listening on {server.url}[/bold cyan]")
+    console.print(
+        f"[dim]TTFT {latency.ttft_ms:.0f}ms ±{latency.jitter_ms:.0f} ({latency.distribution}), "
+        f"{latency.tokens_per_s:.0f} tokens/s[/dim]"
+    )
+    console.print(f"[dim]OpenAI:    engine = \"openai\", base_url = \"{server.url}/v1\"[/dim]")
+    console.print(f"[dim]Anthropic: engine = \"anthropic\", base_url = \"{server.url}\"[/dim]")
+    console.print("[dim]Press Ctrl+C to stop[/dim]\n")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Mock LLM stopped[/yellow]")
+
+
+@cli.command()
+@click.option(
+    "--url",
+    default="ws://127.0.0.1:8000/ws/interview",
+    help="Interview WebSocket of the server under test",
+)
+@click.option("--clients", "-n", default=10, type=int, help="Concurrent simulated candidates (default: 10)")
+@click.option("--duration", "-d", default=60.0, type=float, help="Seconds to run (default: 60)")
+@click.option("--ramp", default=10.0, type=float, help="Seconds over which clients connect (default: 10)")
+@click.option("--think", default=2.0, type=float, help="Mean think time between steps in seconds (default: 2)")
+@click.option("--think-jitter", default=0.5, type=float, help="Lognormal sigma of think time (0 = fixed)")
+@click.option("--script", type=click.Path(exists=True), help="YAML list of WebSocket steps (default: built-in interview)")
+@click.option("--timeout", default=60.0, type=float, help="Seconds to wait for each coach reply (default: 60)")
+@click.option("--seed", default=0, type=int, help="Seed for think-time sampling")
+@click.option("--json", "json_path", type=click.Path(), help="Also write the full report as JSON")
+@click.option(
+    "--spawn",
+    is_flag=True,
+    help="Start a local 'mochi web' with --config for the run (use a config with engine = \"mock\")",
+)
+@click.option(
+    "--config",
+    "-c",
+    default="settings.toml",
+    type=click.Path(),
+    help="Configuration for the spawned server",
+)
+def loadtest(
+    url: str, clients: int, duration: float, ramp: float, think: float, think_jitter: float,
+    script: str, timeout: float, seed: int, json_path: str, spawn: bool, config: str,
+):
+    """Load-test a web server with concurrent simulated interviews.
+
+    Reports throughput, per-step p50/p95/p99 reply latency and the server's
+    memory over the run. Runs entirely on localhost.
+    """
+    import asyncio
+    import json
+    from rich.table import Table
+    from mochi.loadtest import ThinkTime, load_script, run_load
+
+    server = None
+    if spawn:
+        server, url = _spawn_web_server(config)
+        if server is None:
+            return
+
+    try:
+        console.print(f"[bold cyan]Load test:[/bold cyan] {clients} clients for {duration:.0f}s against {url}")
+        report = asyncio.run(run_load(
+            url=url,
+            clients=clients,
+            duration_s=duration,
+            ramp_s=ramp,
+            think=ThinkTime(think, think_jitter),
+            script=load_script(Path(script) if script else None),
+            timeout_s=timeout,
+            seed=seed,
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    table = Table(title=f"Reply latency ({report['requests']} requests, {report['throughput_rps']:.1f} req/s)")
+    table.add_column("Step", style="cyan")
+    for column in ("Count", "p50 ms", "p95 ms", "p99 ms", "Max ms"):
+        table.add_column(column, justify="right")
+    rows = list(report["latency"].items())
+    if report["latency_all"]:
+        rows.append(("all", report["latency_all"]))
+    for step, stats in rows:
+        table.add_row(
+            step, str(stats["count"]), f"{stats['p50_ms']:.0f}", f"{stats['p95_ms']:.0f}",
+            f"{stats['p99_ms']:.0f}", f"{stats['max_ms']:.0f}",
+        )
+    console.print(table)
+    console.print(f"Sessions completed: {report['sessions_completed']}")
+
+    if report["errors"]:
+        console.print(f"[red]Errors: {sum(report['errors'].values())}[/red]")
+        for kind, count in sorted(report["errors"].items(), key=lambda item: -item[1]):
+            console.print(f"  [red]{count:>5}[/red]  {kind}")
+
+    workers = report["memory"]["workers"]
+    if workers:
+        mb = 1024 * 1024
+        for pid, memory in workers.items():
+            console.print(
+                f"Server memory (pid {pid}, {memory['samples']} samples): "
+                f"{memory['start_rss_bytes'] / mb:.0f} MB → {memory['end_rss_bytes'] / mb:.0f} MB "
+                f"(peak {memory['peak_rss_bytes'] / mb:.0f} MB, growth {memory['growth_bytes'] / mb:+.1f} MB)"
+            )
+    else:
+        console.print("[dim]Server memory unavailable (no /stats or no /proc on the server)[/dim]")
+
+    if json_path:
+        Path(json_path).write_text(json.dumps(report, indent=2) + "\n")
+        console.print(f"[dim]Report written to {json_path}[/dim]")
+
+
+def _spawn_web_server(config: str):
+    """Start 'mochi web' on a free local port and wait for it; returns (process, ws url)."""
+    import socket
+    import subprocess
+    import sys
+    import time
+    import urllib.request
+
+    cfg = Config(config)
+    if cfg.llm_engine != "mock" and not cfg.llm_base_url:
+        console.print(f"[yellow]Warning: {config} uses the real '{cfg.llm_engine}' API; "
+                      "every simulated turn is a paid request[/yellow]")
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "mochi.cli", "web", "--port", str(port), "--config", config],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            console.print("[red]Error: The spawned server exited during startup[/red]")
+            return None, None
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1).close()
+            return process, f"ws://127.0.0.1:{port}/ws/interview"
+        except OSError:
+            time.sleep(0.2)
+
+    process.terminate()
+    console.print("[red]Error: The spawned server did not become healthy within 30s[/red]")
+    return None, None
+
+
 @cli.command()
 def config_example():
     """Show example configuration."""
@@ -181,6 +651,10 @@ workspace_dir = "~/mochi_practice"
 helpfulness = "balanced"
 personality = "supportive"
 
+[stt]
+engine = "whisper"          # or "whisper-int8", "faster-whisper"
+model_size = "base"
+
 [llm]
 engine = "openai"           # or "anthropic"
 model = "gpt-4o-mini"       # or "claude-3-5-sonnet-20241022"
@@ -190,6 +664,7 @@ max_tokens = 600
 [harness]
 timeout_ms = 4000
 memory_mb = 512
+pool_size = 2
 """
     console.print("[cyan]Example settings.toml:[/cyan]")
     console.print(example)
@@ -2,7 +2,7 @@
 
 import tomli
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class Config:
@@ -25,6 +25,26 @@ class Config:
         """Get a configuration value."""
         return self._config.get(section, {}).get(key, default)
 
+    @property
+    def problems_dir(self) -> str:
+        return self.get("app", "problems_dir", "examples/problems")
+
+    @property
+    def problem_cache_dir(self) -> str:
+        return self.get("app", "problem_cache_dir", "~/.cache/mochi/problems")
+
+    @property
+    def journal_dir(self) -> str:
+        return self.get("app", "journal_dir", "~/.mochi/sessions")
+
+    @property
+    def journal_fsync_interval_s(self) -> float:
+        return self.get("app", "journal_fsync_interval_s", 1.0)
+
+    @property
+    def trace_dir(self) -> str:
+        return self.get("app", "trace_dir", "~/.mochi/traces")
+
     @property
     def llm_engine(self) -> str:
         return self.get("llm", "engine", "openai")
@@ -33,6 +53,10 @@ class Config:
     def llm_model(self) -> str:
         return self.get("llm", "model", "gpt-4o-mini")
 
+    @property
+    def llm_base_url(self) -> str:
+        return self.get("llm", "base_url", "")
+
     @property
     def llm_temperature(self) -> float:
         return self.get("llm", "temperature", 0.3)
@@ -41,6 +65,82 @@ class Config:
     def llm_max_tokens(self) -> int:
         return self.get("llm", "max_tokens", 600)
 
+    @property
+    def llm_timeout_s(self) -> float:
+        return self.get("llm", "timeout_s", 10)
+
+    @property
+    def llm_max_concurrent_requests(self) -> int:
+        return self.get("llm", "max_concurrent_requests", 32)
+
+    @property
+    def llm_prompt_caching(self) -> bool:
+        return self.get("llm", "prompt_caching", True)
+
+    @property
+    def llm_history_token_budget(self) -> int:
+        return self.get("llm", "history_token_budget", 2000)
+
+    @property
+    def llm_summary_max_tokens(self) -> int:
+        return self.get("llm", "summary_max_tokens", 250)
+
+    @property
+    def llm_stream(self) -> bool:
+        return self.get("llm", "stream", True)
+
+    @property
+    def mock_llm_api(self) -> str:
+        return self.get("mock_llm", "api", "openai")
+
+    @property
+    def mock_llm_ttft_ms(self) -> float:
+        return self.get("mock_llm", "ttft_ms", 400)
+
+    @property
+    def mock_llm_jitter_ms(self) -> float:
+        return self.get("mock_llm", "jitter_ms", 150)
+
+    @property
+    def mock_llm_distribution(self) -> str:
+        return self.get("mock_llm", "distribution", "lognormal")
+
+    @property
+    def mock_llm_tokens_per_s(self) -> float:
+        return self.get("mock_llm", "tokens_per_s", 60)
+
+    @property
+    def mock_llm_script(self) -> str:
+        return self.get("mock_llm", "script", "")
+
+    @property
+    def mock_llm_seed(self) -> int:
+        return self.get("mock_llm", "seed", 0)
+
+    @property
+    def stt_engine(self) -> str:
+        return self.get("stt", "engine", "whisper")
+
+    @property
+    def stt_model_size(self) -> str:
+        return self.get("stt", "model_size", "base")
+
+    @property
+    def stt_compute_type(self) -> str:
+        return self.get("stt", "compute_type", "int8")
+
+    @property
+    def tts_rate_wpm(self) -> int:
+        return self.get("tts", "rate_wpm", 180)
+
+    @property
+    def tts_barge_in(self) -> bool:
+        return self.get("tts", "barge_in", False)
+
+    @property
+    def tts_cache_dir(self) -> str:
+        return self.get("tts", "cache_dir", "~/.cache/mochi/tts")
+
     @property
     def coach_helpfulness(self) -> str:
         return self.get("coach", "helpfulness", "balanced")
@@ -52,3 +152,55 @@ class Config:
     @property
     def harness_memory_mb(self) -> int:
         return self.get("harness", "memory_mb", 512)
+
+    @property
+    def harness_pool_size(self) -> int:
+        return self.get("harness", "pool_size", 2)
+
+    @property
+    def harness_jobs_per_worker(self) -> int:
+        return self.get("harness", "jobs_per_worker", 50)
+
+    @property
+    def harness_case_timeout_ms(self) -> Optional[int]:
+        return self.get("harness", "case_timeout_ms", None)
+
+    @property
+    def harness_max_parallel_cases(self) -> int:
+        return self.get("harness", "max_parallel_cases", 1)
+
+    @property
+    def harness_cache_size(self) -> int:
+        return self.get("harness", "cache_size", 128)
+
+    @property
+    def harness_cache_dir(self) -> str:
+        return self.get("harness", "cache_dir", "")
+
+    @property
+    def server_max_sessions(self) -> int:
+        return self.get("server", "max_sessions", 1000)
+
+    @property
+    def server_session_idle_timeout_s(self) -> float:
+        return self.get("server", "session_idle_timeout_s", 1800)
+
+    @property
+    def server_max_messages_per_session(self) -> int:
+        return self.get("server", "max_messages_per_session", 200)
+
+    @property
+    def server_max_session_chars(self) -> int:
+        return self.get("server", "max_session_chars", 200_000)
+
+    @property
+    def server_session_store(self) -> str:
+        return self.get("server", "session_store", "memory")
+
+    @property
+    def server_session_db(self) -> str:
+        return self.get("server", "session_db", "~/.mochi/sessions.db")
+
+    @property
+    def server_workers(self) -> int:
+        return self.get("server", "workers", 1)
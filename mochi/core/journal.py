@@ -0,0 +1,267 @@
+"""Append-only JSONL journal of interview sessions, replayable after a crash."""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from mochi.schemas import InterviewState, Message, MessageRole, SessionState
+
+JOURNAL_SUFFIX = ".jsonl"
+
+
+class JournalWriter:
+    """One background thread that appends records for every journal in the process.
+
+    Callers only enqueue a dict, so journaling costs a queue put on the turn
+    path. The thread serializes and writes records as they arrive and fsyncs
+    dirty files at most once per ``fsync_interval_s``, so a crash loses at
+    most that much. At most ``max_open_files`` journals are kept open.
+    """
+
+    def __init__(self, fsync_interval_s: float = 1.0, max_open_files: int = 64):
+        self.fsync_interval_s = fsync_interval_s
+        self.max_open_files = max_open_files
+        self._queue: "queue.Queue[Tuple[Any, Any]]" = queue.Queue()
+        self._files: "OrderedDict[Path, Any]" = OrderedDict()
+        self._dirty = set()
+        self._last_sync = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="mochi-journal", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Path, record: Dict[str, Any]):
+        """Queue a record for ``path``; ``record`` must not be mutated afterwards."""
+        self._queue.put((path, record))
+
+    def flush(self, close: Optional[Path] = None, wait: bool = True):
+        """Write and fsync everything submitted so far.
+
+        Args:
+            close: Also close this journal's file handle
+            wait: Block until done (async callers pass False)
+        """
+        done = threading.Event()
+        self._queue.put((_FLUSH, (done, close)))
+        if wait:
+            done.wait()
+
+    def _run(self):
+        while True:
+            timeout = None
+            if self._dirty:
+                timeout = max(self._last_sync + self.fsync_interval_s - time.monotonic(), 0)
+            try:
+                path, record = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._sync()
+                continue
+
+            if path is _FLUSH:
+                done, close = record
+                self._sync()
+                if close is not None and close in self._files:
+                    self._files.pop(close).close()
+                done.set()
+                continue
+
+            try:
+                self._handle(path).write(json.dumps(record, default=str) + "\n")
+                self._dirty.add(path)
+            except OSError:
+                continue  # Journaling is best-effort; the session carries on
+
+            if time.monotonic() - self._last_sync >= self.fsync_interval_s:
+                self._sync()
+
+    def _handle(self, path: Path):
+        handle = self._files.get(path)
+        if handle is not None:
+            self._files.move_to_end(path)
+            return handle
+
+        while len(self._files) >= self.max_open_files:
+            old_path, old = self._files.popitem(last=False)
+            self._sync_one(old_path, old)
+            old.close()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path, "a", encoding="utf-8")
+        if _ends_torn(path):
+            # A previous process died mid-line; start resumed records on a fresh one
+            handle.write("\n")
+        self._files[path] = handle
+        return handle
+
+    def _sync(self):
+        for path in list(self._dirty):
+            handle = self._files.get(path)
+            if handle is not None:
+                self._sync_one(path, handle)
+        self._dirty.clear()
+        self._last_sync = time.monotonic()
+
+    def _sync_one(self, path: Path, handle):
+        try:
+            handle.flush()
+            os.fsync(handle.fileno())
+        except OSError:
+            pass
+        self._dirty.discard(path)
+
+
+def _ends_torn(path: Path) -> bool:
+    """Whether the file's last line was cut off before its newline."""
+    with open(path, "rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+_FLUSH = object()
+_writer: Optional[JournalWriter] = None
+_writer_lock = threading.Lock()
+
+
+def _shared_writer(fsync_interval_s: float = 1.0) -> JournalWriter:
+    """The process-wide writer, started on first use and flushed at exit."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = JournalWriter(fsync_interval_s)
+            atexit.register(_writer.flush)
+        return _writer
+
+
+def new_session_id() -> str:
+    return f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+
+
+class SessionJournal:
+    """The journal of one session: a header record followed by events."""
+
+    def __init__(self, path: Path, fsync_interval_s: float = 1.0):
+        self.path = Path(path)
+        self.session_id = self.path.stem
+        self._writer = _shared_writer(fsync_interval_s)
+
+    @classmethod
+    def create(cls, journal_dir: Path, session_id: Optional[str] = None, **kwargs) -> "SessionJournal":
+        session_id = session_id or new_session_id()
+        return cls(Path(journal_dir).expanduser() / f"{session_id}{JOURNAL_SUFFIX}", **kwargs)
+
+    def append(self, record_type: str, **fields):
+        self._writer.submit(self.path, {"type": record_type, "at": datetime.now().isoformat(), **fields})
+
+    def record_session(self, state: SessionState, **header):
+        """Write the header: everything needed to restart the session besides its events."""
+        self.append(
+            "session",
+            session_id=self.session_id,
+            problem_id=state.problem_id,
+            solution_file=state.solution_file,
+            start_time=state.start_time.isoformat(),
+            **header,
+        )
+
+    def record_message(self, message: Message):
+        self.append("message", role=message.role.value, content=message.content,
+                    timestamp=message.timestamp.isoformat())
+
+    def record_state(self, state: InterviewState):
+        self.append("state", state=state.value)
+
+    def record_test_run(self, passed: Optional[int] = None, failed: Optional[int] = None,
+                        all_passing: Optional[bool] = None, error: Optional[str] = None):
+        self.append("test_run", passed=passed, failed=failed, all_passing=all_passing, error=error)
+
+    def record_hint(self):
+        self.append("hint")
+
+    def record_summary(self, summary: str, covered: int):
+        """Record the rolling summary, which folds in the first ``covered`` messages."""
+        self.append("summary", summary=summary, covered=covered)
+
+    def flush(self):
+        self._writer.flush()
+
+    def close(self, wait: bool = True):
+        """Write out everything pending and release the file handle."""
+        self._writer.flush(close=self.path, wait=wait)
+
+
+def replay(path: Path) -> Tuple[Dict[str, Any], SessionState]:
+    """Rebuild a session from its journal.
+
+    Torn lines (the process died mid-write, possibly before the session
+    was resumed and appended to) are skipped.
+
+    Returns:
+        (header, state) where header is the "session" record
+    """
+    header: Dict[str, Any] = {}
+    messages: List[Message] = []
+    state: Optional[SessionState] = None
+    summarized = 0
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            kind = record.get("type")
+            if kind == "session":
+                header = record
+                state = SessionState(
+                    problem_id=record.get("problem_id", "custom"),
+                    solution_file=record.get("solution_file", ""),
+                    start_time=datetime.fromisoformat(record["start_time"]),
+                )
+            elif state is None:
+                continue
+            elif kind == "message":
+                messages.append(Message(
+                    role=MessageRole(record["role"]),
+                    content=record["content"],
+                    timestamp=datetime.fromisoformat(record["timestamp"]),
+                ))
+            elif kind == "state":
+                state.state = InterviewState(record["state"])
+            elif kind == "test_run":
+                state.test_runs += 1
+                if record.get("all_passing") is not None:
+                    state.tests_passing = record["all_passing"]
+            elif kind == "hint":
+                state.hints_given += 1
+            elif kind == "summary":
+                state.summary = record["summary"]
+                summarized = record["covered"]
+
+    if state is None:
+        raise ValueError(f"No session header in journal: {path}")
+    # Messages already folded into the summary must not be folded in again
+    for message in messages[:summarized]:
+        message._summarized = True
+    state.messages = messages
+    return header, state
+
+
+def find_journal(journal_dir: Path, session: Optional[str] = None) -> Optional[Path]:
+    """Locate a journal by path, session id or id prefix; the newest one if ``session`` is None."""
+    if session and Path(session).is_file():
+        return Path(session)
+
+    journal_dir = Path(journal_dir).expanduser()
+    if not journal_dir.is_dir():
+        return None
+    candidates = sorted(journal_dir.glob(f"{session or ''}*{JOURNAL_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+    return candidates[-1] if candidates else None
@@ -3,16 +3,22 @@
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.markdown import Markdown
 
 from mochi.core.config import Config
-from mochi.core.prompts import get_intro_message
+from mochi.core.prompts import COMPLEXITY_QUESTION, SESSION_INTRO, get_intro_message
 from mochi.core.file_watcher import FileWatcher
+from mochi.core.journal import SessionJournal, new_session_id
+from mochi.core.speculative import SpeculativeRunner
+from mochi.core.tracing import span, start_tracing, stop_tracing
 from mochi.ai.coach import Coach
+from mochi.ai.safeguards import CoachSafeguards
 from mochi.harness.python_harness import PythonHarness, TestResult
+from mochi.io.utils import SentenceSplitter
 from mochi.schemas import (
     Problem,
     Message,
@@ -22,6 +28,34 @@ from mochi.schemas import (
 )
 
 
+def advance_state(state: InterviewState, user_input: str) -> InterviewState:
+    """Work out the next interview state from what the candidate just said."""
+    lower_input = user_input.lower()
+
+    if state == InterviewState.INTRO:
+        return InterviewState.UNDERSTANDING
+
+    elif state == InterviewState.UNDERSTANDING:
+        if any(word in lower_input for word in ["approach", "strategy", "plan", "use"]):
+            return InterviewState.APPROACH
+
+    elif state == InterviewState.APPROACH:
+        if any(word in lower_input for word in ["code", "implement", "write"]):
+            return InterviewState.CODING
+
+    return state
+
+
+def canned_phrases() -> List[str]:
+    """Fixed coach lines worth pre-rendering into the TTS audio cache."""
+    return [
+        SESSION_INTRO,
+        COMPLEXITY_QUESTION,
+        CoachSafeguards.REPHRASE_MESSAGE,
+        *CoachSafeguards.FISHING_ATTEMPTS.values(),
+    ]
+
+
 class Orchestrator:
     """Orchestrate the interview session."""
 
@@ -32,11 +66,18 @@ class Orchestrator:
         config: Config,
         voice_mode: bool = True,
         tts_mode: str = "local",
-        helpfulness_override: Optional[str] = None
+        helpfulness_override: Optional[str] = None,
+        tests_file: Optional[Path] = None,
+        test_cases: Optional[List[Dict[str, Any]]] = None,
+        problem_title: str = "Interview Problem",
+        problem_id: str = "custom",
+        journal: Optional[SessionJournal] = None,
+        resume_state: Optional[SessionState] = None,
     ):
         self.config = config
         self.console = Console()
         self.problem_statement = problem_statement
+        self.problem_title = problem_title
         self.solution_file = solution_file
         self.coach = Coach(config)
         self.tts_mode = tts_mode
@@ -52,19 +93,54 @@ class Orchestrator:
         if voice_mode:
             from mochi.io.stt import SpeechToText
             from mochi.io.tts import TextToSpeech
-            self.stt = SpeechToText(model_size="base")
+            self.stt = SpeechToText(
+                engine=config.stt_engine,
+                model_size=config.stt_model_size,
+                compute_type=config.stt_compute_type,
+            )
             if tts_mode == "local":
-                self.tts = TextToSpeech(rate=180)
+                self.tts = TextToSpeech(
+                    rate=config.tts_rate_wpm,
+                    cache_dir=Path(config.tts_cache_dir) if config.tts_cache_dir else None,
+                    phrases=canned_phrases(),
+                )
             # API TTS mode will use LLM audio capabilities
 
-        self.state = SessionState(
-            problem_id="custom",  # No predefined ID for pasted problems
+        self.state = resume_state or SessionState(
+            problem_id=problem_id,  # "custom" for pasted problems
             solution_file=str(solution_file),
             state=InterviewState.INIT,
         )
+        self.state.solution_file = str(solution_file)
+        self.resumed = resume_state is not None
+
+        # Durable transcript; appends are handed to a background writer
+        self.journal = journal
 
         self.watcher: Optional[FileWatcher] = None
 
+        # Test harness (only when test cases were provided)
+        self.test_cases: List[Dict[str, Any]] = list(test_cases or [])
+        self.harness: Optional[PythonHarness] = None
+        self.speculative: Optional[SpeculativeRunner] = None
+
+        if tests_file and not self.test_cases:
+            with open(tests_file) as f:
+                self.test_cases = yaml.safe_load(f).get("tests", [])
+
+        if self.test_cases:
+            self.harness = PythonHarness(
+                timeout_ms=config.harness_timeout_ms,
+                memory_mb=config.harness_memory_mb,
+                pool_size=config.harness_pool_size,
+                jobs_per_worker=config.harness_jobs_per_worker,
+                case_timeout_ms=config.harness_case_timeout_ms,
+                max_parallel_cases=config.harness_max_parallel_cases,
+                cache_size=config.harness_cache_size,
+                cache_dir=Path(config.harness_cache_dir) if config.harness_cache_dir else None,
+            )
+            self.speculative = SpeculativeRunner(self.harness, solution_file, self.test_cases)
+
     def start(self):
         """Start the interview session."""
         self.console.print("\n[bold cyan]🎯 Mochi Mock Interview[/bold cyan]\n")
@@ -81,12 +157,54 @@ class Orchestrator:
         self.watcher = FileWatcher(self.solution_file, self._on_file_change)
         self.watcher.start()
 
+        # Have results for the starting file ready before the first "run tests"
+        if self.speculative:
+            self.speculative.schedule()
+
+        # Per-stage latency spans, under the same id as the journal
+        session_id = self.journal.session_id if self.journal else new_session_id()
+        if self.config.trace_dir:
+            start_tracing(Path(self.config.trace_dir), session_id)
+
+        if self.resumed:
+            self._resume()
+        else:
+            self._begin()
+
+        # Main interaction loop
+        try:
+            self._interaction_loop()
+        finally:
+            if self.journal:
+                self.journal.close()
+                self.console.print(f"[dim]Session saved: resume with 'mochi resume {self.journal.session_id}'[/dim]")
+            if self.watcher:
+                self.watcher.stop()
+            self._print_usage()
+            if self.speculative:
+                self.speculative.shutdown()
+            if self.harness:
+                self.harness.close()
+            stop_tracing()
+
+    def _begin(self):
+        """Start the timer and open with the intro."""
         # Start timer
         self.start_time = datetime.now()
+        self.state.start_time = self.start_time
+
+        if self.journal:
+            self.journal.record_session(
+                self.state,
+                problem_title=self.problem_title,
+                problem_statement=self.problem_statement,
+                test_cases=self.test_cases,
+            )
+            self.console.print(f"[dim]Session {self.journal.session_id}[/dim]")
 
         # Start interview with brief intro
-        self.state.state = InterviewState.INTRO
-        intro = "Let's begin the interview. I can see your problem statement on the screen. Take a moment to read through it, and when you're ready, feel free to ask any clarifying questions."
+        self._set_state(InterviewState.INTRO)
+        intro = SESSION_INTRO
 
         # Optionally read the problem aloud
         if self.voice_mode:
@@ -97,12 +215,30 @@ class Orchestrator:
         self._display_coach_message(intro)
         self._add_message(MessageRole.COACH, intro)
 
-        # Main interaction loop
-        try:
-            self._interaction_loop()
-        finally:
-            if self.watcher:
-                self.watcher.stop()
+    def _resume(self):
+        """Pick a replayed session up where it stopped, with the original timer."""
+        self.start_time = self.state.start_time
+        if self.state.state == InterviewState.DONE:
+            self._set_state(InterviewState.REFLECTION)
+
+        self.console.print(
+            f"[dim]Resumed session {self.journal.session_id if self.journal else ''}: "
+            f"{len(self.state.messages)} messages, {self.state.test_runs} test runs, "
+            f"stage '{self.state.state.value}'[/dim]\n"
+        )
+
+        last_coach = next((m for m in reversed(self.state.messages) if m.role == MessageRole.COACH), None)
+        if last_coach:
+            self._display_coach_message(last_coach.content)
+
+    def _print_usage(self):
+        """Report token usage and provider prompt-cache hits for the session."""
+        usage = self.coach.usage
+        if usage.requests:
+            self.console.print(
+                f"[dim]LLM usage: {usage.requests} requests, {usage.input_tokens} input tokens "
+                f"({usage.cache_hit_rate:.0%} from prompt cache), {usage.output_tokens} output tokens[/dim]"
+            )
 
     def _get_elapsed_time(self) -> str:
         """Get formatted elapsed time."""
@@ -129,7 +265,13 @@ class Orchestrator:
                 # Get user input (voice or text)
                 if self.voice_mode:
                     self.console.print(f"{elapsed_display}")
-                    user_input = self.stt.quick_listen(max_silence_sec=2.0)
+                    if self.tts and not self.config.tts_barge_in:
+                        self.tts.wait()
+                    with span("stt.listen"):
+                        user_input = self.stt.quick_listen(
+                            max_silence_sec=2.0,
+                            on_speech_start=self._barge_in,
+                        )
                 else:
                     user_input = self.console.input(f"{elapsed_display} [bold green]You:[/bold green] ").strip()
 
@@ -145,8 +287,8 @@ class Orchestrator:
 
                     # Ask for Big-O analysis if they finished
                     if any(word in lower_input for word in ["done", "finished", "complete"]):
-                        self.state.state = InterviewState.COMPLEXITY
-                        final_question = "Great! Before we wrap up, can you analyze the time and space complexity of your solution?"
+                        self._set_state(InterviewState.COMPLEXITY)
+                        final_question = COMPLEXITY_QUESTION
                         self._add_message(MessageRole.COACH, final_question)
                         self._display_coach_message(final_question)
                         continue
@@ -170,32 +312,43 @@ class Orchestrator:
 
     def _handle_user_message(self, user_input: str):
         """Process user message and get coach response."""
+        with span("turn", state=self.state.state.value):
+            self._respond(user_input)
+
+    def _respond(self, user_input: str):
         self._add_message(MessageRole.CANDIDATE, user_input)
 
         elapsed = (datetime.now() - self.start_time).total_seconds() / 60
 
-        # Include problem context in first exchange
-        context = f"Problem: {self.problem_statement}\n\n" if len(self.state.messages) < 3 else ""
-
-        response = self.coach.get_response(
-            user_message=context + user_input,
+        request = dict(
+            user_message=user_input,
             message_history=self.state.messages,
-            problem_title="Interview Problem",
+            problem_title=self.problem_title,
             state=self.state.state,
             elapsed_min=elapsed,
-            helpfulness=self.helpfulness
+            helpfulness=self.helpfulness,
+            problem_statement=self.problem_statement,
+            summary=self.state.summary
         )
 
-        self._add_message(MessageRole.COACH, response)
-        self._display_coach_message(response)
+        if self.config.llm_stream:
+            response = self._stream_coach_message(self.coach.stream_response(**request))
+            self._add_message(MessageRole.COACH, response)
+        else:
+            response = self.coach.get_response(**request)
+            self._add_message(MessageRole.COACH, response)
+            self._display_coach_message(response)
+
+        # Fold anything that just left the context window into the running summary
+        self.coach.schedule_summary(
+            self.state, on_summary=self.journal.record_summary if self.journal else None
+        )
 
         # Update state based on conversation
         self._update_state(user_input)
 
     def _run_tests(self):
-        """Ask coach to review the current solution."""
-        self.console.print("\n[cyan]Reviewing your solution...[/cyan]")
-
+        """Run the test suite if we have one, otherwise ask coach to review the solution."""
         # Read the current solution
         try:
             with open(self.solution_file, 'r') as f:
@@ -206,11 +359,44 @@ class Orchestrator:
 
         self.state.test_runs += 1
 
+        if self.harness:
+            self._run_test_suite(solution_code)
+            return
+
+        if self.journal:
+            self.journal.record_test_run()
+
+        self.console.print("\n[cyan]Reviewing your solution...[/cyan]")
+
         # Ask coach to review
         review_request = f"Here's my current solution:\n\n```\n{solution_code}\n```\n\nCan you review it and tell me if there are any issues?"
 
         self._handle_user_message(review_request)
 
+    def _run_test_suite(self, solution_code: str):
+        """Run tests, reusing the background run for this exact source when there is one."""
+        self.console.print("\n[cyan]Running tests...[/cyan]")
+
+        with span("tests.run") as run_span:
+            result = self.speculative.result_for(solution_code) if self.speculative else None
+            run_span.set(speculative=result is not None)
+            if result is None:
+                result = self.harness.run_source(solution_code, self.solution_file, self.test_cases)
+
+        if result.error:
+            self.console.print(f"[red]Error: {result.error}[/red]\n")
+        else:
+            color = "green" if result.all_passing else "yellow"
+            self.console.print(f"[{color}]{result.passed}/{result.total} tests passing[/{color}]")
+            for failure in result.failures[:3]:
+                self._display_failure(failure)
+            self.console.print()
+
+        self.state.tests_passing = result.all_passing
+        if self.journal:
+            self.journal.record_test_run(result.passed, result.total - result.passed, result.all_passing, result.error)
+        self._get_test_feedback(result)
+
     def _display_failure(self, failure: Dict[str, Any]):
         """Display a test failure."""
         if "error" in failure:
@@ -223,7 +409,9 @@ class Orchestrator:
 
     def _get_test_feedback(self, result: TestResult):
         """Get coach feedback on test results."""
-        if result.all_passing:
+        if result.error:
+            feedback_msg = f"The solution fails to run: {result.error}. Can you help me find where to look?"
+        elif result.all_passing:
             feedback_msg = "All tests are passing! Let's discuss the time and space complexity of your solution."
         else:
             failures_summary = "; ".join([
@@ -231,41 +419,49 @@ class Orchestrator:
             ])
             feedback_msg = f"Some tests are failing: {failures_summary}. Can you trace through your logic?"
 
-        elapsed = (datetime.now() - self.state.start_time).total_seconds() / 60
+        elapsed = (datetime.now() - self.start_time).total_seconds() / 60
         response = self.coach.get_response(
             user_message=feedback_msg,
             message_history=self.state.messages,
-            problem_title=self.problem.title,
+            problem_title=self.problem_title,
             state=self.state.state,
             elapsed_min=elapsed,
+            helpfulness=self.helpfulness,
+            problem_statement=self.problem_statement,
+            summary=self.state.summary
         )
 
         self._add_message(MessageRole.COACH, response)
         self._display_coach_message(response)
+        self.coach.schedule_summary(
+            self.state, on_summary=self.journal.record_summary if self.journal else None
+        )
 
     def _on_file_change(self):
         """Handle solution file changes."""
         self.console.print("\n[dim]📝 Solution file updated[/dim]\n")
 
+        # Start a quiet background run so "run tests" has results waiting
+        if self.speculative:
+            self.speculative.schedule()
+
     def _update_state(self, user_input: str):
         """Update interview state based on conversation."""
-        lower_input = user_input.lower()
-
-        if self.state.state == InterviewState.INTRO:
-            self.state.state = InterviewState.UNDERSTANDING
-
-        elif self.state.state == InterviewState.UNDERSTANDING:
-            if any(word in lower_input for word in ["approach", "strategy", "plan", "use"]):
-                self.state.state = InterviewState.APPROACH
+        self._set_state(advance_state(self.state.state, user_input))
 
-        elif self.state.state == InterviewState.APPROACH:
-            if any(word in lower_input for word in ["code", "implement", "write"]):
-                self.state.state = InterviewState.CODING
+    def _set_state(self, state: InterviewState):
+        """Move to a new interview stage, journaling the transition."""
+        if state != self.state.state:
+            self.state.state = state
+            if self.journal:
+                self.journal.record_state(state)
 
     def _add_message(self, role: MessageRole, content: str):
         """Add message to history."""
         message = Message(role=role, content=content, timestamp=datetime.now())
         self.state.messages.append(message)
+        if self.journal:
+            self.journal.record_message(message)
 
     def _display_coach_message(self, message: str):
         """Display coach message with formatting."""
@@ -279,3 +475,34 @@ class Orchestrator:
         # Speak the message in voice mode
         if self.voice_mode and self.tts:
             self.tts.speak(message)
+
+    def _stream_coach_message(self, chunks: Iterator[str]) -> str:
+        """Render a streamed coach message live, speaking each sentence as it completes."""
+        speak = self.voice_mode and self.tts is not None
+        splitter = SentenceSplitter()
+        text = ""
+
+        def render() -> Panel:
+            return Panel(Markdown(text), title="[bold blue]Coach[/bold blue]", border_style="blue")
+
+        with Live(render(), console=self.console, refresh_per_second=15) as live:
+            for chunk in chunks:
+                text += chunk
+                live.update(render())
+                if speak:
+                    for sentence in splitter.feed(chunk):
+                        self.tts.enqueue(sentence)
+
+        self.console.print()
+
+        if speak:
+            rest = splitter.flush()
+            if rest:
+                self.tts.enqueue(rest)
+
+        return text
+
+    def _barge_in(self):
+        """The candidate started talking: stop the coach mid-sentence."""
+        if self.tts and self.tts.speaking:
+            self.tts.cancel()
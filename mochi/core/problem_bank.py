@@ -0,0 +1,224 @@
+"""Index and lazy loader for a directory of problems."""
+
+import hashlib
+import os
+import pickle
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from mochi.schemas import Problem, TestCase
+
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without libyaml
+    _YamlLoader = yaml.SafeLoader
+
+PROBLEM_FILE = "problem.yaml"
+TESTS_FILE = "tests.yaml"
+
+# Bump when the cached payload layout changes
+_CACHE_VERSION = 1
+
+
+def _declared_paths(problem_dir: Path, declared: str) -> List[Path]:
+    """Where a file named in problem.yaml may be, nearest the problem first.
+
+    Relative paths resolve against the problem directory, never the process
+    CWD, so a stray ``./solution.py`` can't shadow the problem's own file.
+    """
+    if not declared:
+        return []
+    path = Path(declared)
+    candidates = [problem_dir / path, problem_dir / path.name]
+    if path.is_absolute():
+        candidates.insert(0, path)
+    return candidates
+
+
+@dataclass(frozen=True)
+class ProblemSummary:
+    """What the index knows about a problem without loading it."""
+    id: str
+    title: str
+    difficulty: str
+    tags: Tuple[str, ...]
+    path: str  # Problem directory
+
+
+class ProblemBank:
+    """Problems stored as ``<problems_dir>/<name>/problem.yaml`` (+ ``tests.yaml``).
+
+    Building the index only stats each ``problem.yaml``; files that haven't
+    changed since the last run come from a pickled index in ``cache_dir``.
+    Full problems and test suites are parsed on first use, validated, and
+    kept as pickled dumps keyed by source path and invalidated by mtime and
+    size, so later runs restore them without YAML parsing or re-validation.
+    """
+
+    def __init__(self, problems_dir: Path, cache_dir: Optional[Path] = None):
+        self.problems_dir = Path(problems_dir).expanduser()
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._index: Optional[Dict[str, ProblemSummary]] = None
+        self._problems: Dict[str, Problem] = {}
+        self._tests: Dict[str, List[TestCase]] = {}
+        self._lock = threading.Lock()
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, problem_id: str) -> bool:
+        return problem_id in self.index
+
+    @property
+    def index(self) -> Dict[str, ProblemSummary]:
+        """Problem summaries by id, built on first access."""
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._build_index()
+        return self._index
+
+    def list(self, difficulty: Optional[str] = None, tag: Optional[str] = None) -> List[ProblemSummary]:
+        """Summaries sorted by id, optionally filtered by difficulty or tag."""
+        return [
+            summary for _, summary in sorted(self.index.items())
+            if (difficulty is None or summary.difficulty == difficulty)
+            and (tag is None or tag in summary.tags)
+        ]
+
+    def get(self, problem_id: str) -> Problem:
+        """Load a full problem. Raises KeyError for unknown ids."""
+        problem = self._problems.get(problem_id)
+        if problem is None:
+            path = Path(self.index[problem_id].path) / PROBLEM_FILE
+            problem = self._load(path, self._parse_problem, Problem)
+            self._problems[problem_id] = problem
+        return problem
+
+    def tests(self, problem_id: str) -> List[TestCase]:
+        """Load a problem's test suite (empty if it has none)."""
+        tests = self._tests.get(problem_id)
+        if tests is None:
+            path = self.tests_path(problem_id)
+            tests = self._load(path, self._parse_tests, TestCase) if path else []
+            self._tests[problem_id] = tests
+        return tests
+
+    def tests_path(self, problem_id: str) -> Optional[Path]:
+        """The problem's test file: its ``test_file`` if that exists, else ``tests.yaml`` beside it."""
+        problem_dir = Path(self.index[problem_id].path)
+        candidates = _declared_paths(problem_dir, self.get(problem_id).test_file) + [problem_dir / TESTS_FILE]
+        for candidate in candidates:
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def starter_code(self, problem_id: str) -> str:
+        """Contents of the problem's signature (starter) file, or an empty string."""
+        problem_dir = Path(self.index[problem_id].path)
+        for candidate in _declared_paths(problem_dir, self.get(problem_id).signature_file):
+            if candidate.is_file():
+                return candidate.read_text()
+        return ""
+
+    # Index
+
+    def _build_index(self) -> Dict[str, ProblemSummary]:
+        cached = self._read_cache("index") or {}
+        entries: Dict[str, Tuple[int, int, ProblemSummary]] = {}
+
+        if self.problems_dir.is_dir():
+            for entry in os.scandir(self.problems_dir):
+                if not entry.is_dir():
+                    continue
+                path = os.path.join(entry.path, PROBLEM_FILE)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+
+                previous = cached.get(path)
+                if previous and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                    entries[path] = previous
+                    continue
+
+                problem = self._load(Path(path), self._parse_problem, Problem)
+                summary = ProblemSummary(
+                    id=problem.id,
+                    title=problem.title,
+                    difficulty=problem.difficulty,
+                    tags=tuple(problem.tags),
+                    path=entry.path,
+                )
+                entries[path] = (stat.st_mtime_ns, stat.st_size, summary)
+
+        if entries != cached:
+            self._write_cache("index", entries)
+        return {summary.id: summary for _, _, summary in entries.values()}
+
+    # Parsing
+
+    @staticmethod
+    def _parse_problem(path: Path) -> Tuple[Problem, Dict[str, Any]]:
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        data.setdefault("id", path.parent.name)
+        data.setdefault("signature_file", "solution.py")
+        data.setdefault("test_file", TESTS_FILE)
+        problem = Problem.model_validate(data)
+        return problem, problem.model_dump()
+
+    @staticmethod
+    def _parse_tests(path: Path) -> Tuple[List[TestCase], List[Dict[str, Any]]]:
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        tests = [TestCase.model_validate(case) for case in data.get("tests", [])]
+        return tests, [case.model_dump() for case in tests]
+
+    # Binary cache
+
+    def _load(self, path: Path, parse, model):
+        """Restore validated ``model`` object(s) from the cache, or parse ``path`` and cache them."""
+        stat = path.stat()
+        key = f"{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+        name = hashlib.sha256(key.encode()).hexdigest()[:32]
+
+        cached = self._read_cache(name)
+        if cached is not None:
+            # Dumps were validated before caching, so skip validation on restore
+            if isinstance(cached, list):
+                return [model.model_construct(**item) for item in cached]
+            return model.model_construct(**cached)
+
+        obj, dump = parse(path)
+        self._write_cache(name, dump)
+        return obj
+
+    def _read_cache(self, name: str):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self.cache_dir / f"{name}.pickle", "rb") as f:
+                version, payload = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            return None
+        return payload if version == _CACHE_VERSION else None
+
+    def _write_cache(self, name: str, payload):
+        if not self.cache_dir:
+            return
+        path = self.cache_dir / f"{name}.pickle"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((_CACHE_VERSION, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except (OSError, pickle.PicklingError):
+            pass  # The cache is best-effort
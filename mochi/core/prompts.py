@@ -1,17 +1,15 @@
-"""System prompts for the coach."""
+"""System prompts for the coach.
 
-from mochi.schemas import InterviewState
+The system prompt is split into a static prefix (rules, voice-output rules and
+the session's problem statement) and a small per-turn suffix (phase, time,
+helpfulness). Keeping the prefix byte-identical across turns lets providers
+serve it from their prompt cache.
+"""
 
+from mochi.schemas import InterviewState
 
-def get_system_prompt(
-    problem_title: str,
-    state: InterviewState,
-    helpfulness: str = "balanced",
-    elapsed_min: float = 0,
-) -> str:
-    """Generate system prompt for the coach based on current state."""
 
-    base_rules = """You are a technical interviewer conducting a coding interview. Your role is to assess the candidate's problem-solving abilities, not to solve problems for them.
+BASE_RULES = """You are a technical interviewer conducting a coding interview. Your role is to assess the candidate's problem-solving abilities, not to solve problems for them.
 
 CRITICAL RULES - NEVER VIOLATE:
 1. NEVER provide the solution or write code for the candidate
@@ -45,34 +43,7 @@ RESPONSE PATTERNS TO AVOID:
 ❌ "The optimal approach would be..."
 """
 
-    state_guidance = {
-        InterviewState.INTRO: "\nYou're introducing the problem. Present it clearly and ask if they have clarifying questions.",
-        InterviewState.UNDERSTANDING: "\nThe candidate is clarifying the problem. Answer their questions about requirements, constraints, and examples.",
-        InterviewState.APPROACH: "\nThe candidate is discussing their approach. Ask probing questions about their strategy, edge cases, and complexity.",
-        InterviewState.CODING: "\nThe candidate is implementing. Provide occasional guidance but let them work. Point out issues you notice without fixing them.",
-        InterviewState.TESTING: "\nThe candidate is testing. Encourage them to think about edge cases and trace through failures.",
-        InterviewState.DEBUGGING: "\nHelp locate bugs without fixing them. Ask them to trace through the logic.",
-        InterviewState.COMPLEXITY: "\nDiscuss time and space complexity. Ask them to analyze their solution.",
-        InterviewState.REFLECTION: "\nReflect on trade-offs and alternative approaches. What would they do differently?",
-    }
-
-    helpfulness_guidance = {
-        "gentle": "\nBe patient and wait for them to work through ideas. Offer hints sparingly.",
-        "balanced": "\nBalance guidance with independence. Nudge when stuck for >2 minutes.",
-        "insistent": "\nBe more proactive with hints and suggestions when you see them struggling.",
-    }
-
-    return f"""{base_rules}
-
-Current problem: {problem_title}
-Current phase: {state.value}
-Helpfulness level: {helpfulness}
-Time elapsed: {elapsed_min:.1f} minutes
-
-{state_guidance.get(state, "")}
-{helpfulness_guidance.get(helpfulness, "")}
-
-Keep responses concise (2-4 sentences). Be encouraging but realistic.
+VOICE_RULES = """Keep responses concise (2-4 sentences). Be encouraging but realistic.
 
 IMPORTANT - VOICE OUTPUT:
 Your responses will be spoken aloud via text-to-speech. DO NOT use any markdown formatting:
@@ -83,6 +54,80 @@ Your responses will be spoken aloud via text-to-speech. DO NOT use any markdown
 - Spell out technical terms clearly
 """
 
+STATIC_PROMPT = f"{BASE_RULES}\n{VOICE_RULES}"
+
+STATE_GUIDANCE = {
+    InterviewState.INTRO: "You're introducing the problem. Present it clearly and ask if they have clarifying questions.",
+    InterviewState.UNDERSTANDING: "The candidate is clarifying the problem. Answer their questions about requirements, constraints, and examples.",
+    InterviewState.APPROACH: "The candidate is discussing their approach. Ask probing questions about their strategy, edge cases, and complexity.",
+    InterviewState.CODING: "The candidate is implementing. Provide occasional guidance but let them work. Point out issues you notice without fixing them.",
+    InterviewState.TESTING: "The candidate is testing. Encourage them to think about edge cases and trace through failures.",
+    InterviewState.DEBUGGING: "Help locate bugs without fixing them. Ask them to trace through the logic.",
+    InterviewState.COMPLEXITY: "Discuss time and space complexity. Ask them to analyze their solution.",
+    InterviewState.REFLECTION: "Reflect on trade-offs and alternative approaches. What would they do differently?",
+}
+
+HELPFULNESS_GUIDANCE = {
+    "gentle": "Be patient and wait for them to work through ideas. Offer hints sparingly.",
+    "balanced": "Balance guidance with independence. Nudge when stuck for >2 minutes.",
+    "insistent": "Be more proactive with hints and suggestions when you see them struggling.",
+}
+
+
+def get_static_prompt(problem_statement: str = "") -> str:
+    """Return the cacheable prefix: fixed rules plus the session's problem statement."""
+    if not problem_statement:
+        return STATIC_PROMPT
+    return f"{STATIC_PROMPT}\nPROBLEM STATEMENT:\n{problem_statement}\n"
+
+
+def get_dynamic_prompt(
+    problem_title: str,
+    state: InterviewState,
+    helpfulness: str = "balanced",
+    elapsed_min: float = 0,
+) -> str:
+    """Return the per-turn suffix with the current phase, timing and helpfulness."""
+    return f"""Current problem: {problem_title}
+Current phase: {state.value}
+Helpfulness level: {helpfulness}
+Time elapsed: {elapsed_min:.1f} minutes
+
+{STATE_GUIDANCE.get(state, "")}
+{HELPFULNESS_GUIDANCE.get(helpfulness, "")}
+"""
+
+
+def get_system_prompt(
+    problem_title: str,
+    state: InterviewState,
+    helpfulness: str = "balanced",
+    elapsed_min: float = 0,
+    problem_statement: str = "",
+) -> str:
+    """Generate system prompt for the coach based on current state."""
+    static = get_static_prompt(problem_statement)
+    dynamic = get_dynamic_prompt(problem_title, state, helpfulness, elapsed_min)
+    return f"{static}\n{dynamic}"
+
+
+FORMAT_PROBLEM_PROMPT = """You are a formatting assistant. Convert the given coding problem into clean, readable markdown format.
+
+Rules:
+- Use headings (##) for sections like "Problem", "Examples", "Constraints"
+- Use **bold** for important terms
+- Use code blocks (```) for code examples
+- Use inline code (`) for variable names, arrays, etc.
+- Use lists for constraints and examples
+- Make it easy to read and well-structured
+- DO NOT solve the problem or add explanations
+- Only format what's given"""
+
+
+SESSION_INTRO = "Let's begin the interview. I can see your problem statement on the screen. Take a moment to read through it, and when you're ready, feel free to ask any clarifying questions."
+
+COMPLEXITY_QUESTION = "Great! Before we wrap up, can you analyze the time and space complexity of your solution?"
+
 
 def get_intro_message(problem_title: str, description: str) -> str:
     """Generate the initial problem introduction."""
@@ -0,0 +1,410 @@
+"""Stores for web interview sessions: bounded in-memory, or shared through SQLite.
+
+The in-memory store is for a single worker in development. The SQLite store
+keeps every session in a WAL-mode database file, so several server workers
+(or a restarted server) can pick up any session by id: each worker caches
+the sessions its connections are using and loads others lazily on first use.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from mochi.core.config import Config
+from mochi.core.journal import SessionJournal
+from mochi.schemas import Message, MessageRole, InterviewState, SessionState
+
+
+@dataclass
+class WebSession:
+    """A single interview driven over the WebSocket."""
+    session_id: str
+    state: SessionState
+    problem: str = ""
+    code: str = ""
+    last_active: float = field(default_factory=time.monotonic)
+    journal: Optional[SessionJournal] = None
+    version: int = 0  # Bumped on every save to a shared store
+
+    @property
+    def elapsed_min(self) -> float:
+        return (datetime.now() - self.state.start_time).total_seconds() / 60
+
+
+# One-letter role codes for the serialized transcript
+_ROLE_CODES = {MessageRole.SYSTEM: "s", MessageRole.COACH: "c", MessageRole.CANDIDATE: "u"}
+_ROLES = {code: role for role, code in _ROLE_CODES.items()}
+_FORMAT = 1
+
+
+def dumps_session(session: WebSession) -> bytes:
+    """Serialize a session as zlib-compressed, short-keyed JSON."""
+    state = session.state
+    record: Dict[str, Any] = {
+        "f": _FORMAT,
+        "p": session.problem,
+        "c": session.code,
+        "s": state.state.value,
+        "id": state.problem_id,
+        "sf": state.solution_file,
+        "h": state.hints_given,
+        "t": state.test_runs,
+        "tp": state.tests_passing,
+        "st": round(state.start_time.timestamp(), 3),
+        "sm": state.summary,
+        "ms": _summarized_prefix(state.messages),
+        "m": [[_ROLE_CODES[m.role], round(m.timestamp.timestamp(), 3), m.content] for m in state.messages],
+    }
+    return zlib.compress(json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 1)
+
+
+def _summarized_prefix(messages: List[Message]) -> int:
+    """Leading messages already folded into the rolling summary."""
+    count = 0
+    for message in messages:
+        if not message._summarized:
+            break
+        count += 1
+    return count
+
+
+def loads_session(session_id: str, data: bytes, version: int = 0) -> WebSession:
+    record = json.loads(zlib.decompress(data))
+    if record.get("f") != _FORMAT:
+        raise ValueError(f"Unsupported session format: {record.get('f')}")
+    state = SessionState(
+        state=InterviewState(record["s"]),
+        problem_id=record["id"],
+        solution_file=record["sf"],
+        messages=[
+            Message(role=_ROLES[role], content=content, timestamp=datetime.fromtimestamp(at))
+            for role, at, content in record["m"]
+        ],
+        hints_given=record["h"],
+        test_runs=record["t"],
+        tests_passing=record["tp"],
+        start_time=datetime.fromtimestamp(record["st"]),
+        summary=record["sm"],
+    )
+    # Don't fold turns the summary already covers into it again
+    for message in state.messages[:record.get("ms", 0)]:
+        message._summarized = True
+    return WebSession(session_id=session_id, state=state, problem=record["p"], code=record["c"], version=version)
+
+
+class SessionStore:
+    """Keep at most ``max_sessions`` sessions in memory, evicting idle ones first.
+
+    Sessions are ordered by last activity. Anything idle for longer than
+    ``idle_timeout_s`` is dropped on the next access; if the store is still
+    full, the least recently active session goes. Each session's transcript
+    is capped at ``max_messages`` messages and ``max_chars`` characters.
+    With a ``journal_dir``, every message, stage change, review and hint is
+    also journaled, so transcripts outlive eviction and disconnects. A
+    disconnected client's session is kept until it idles out, so the client
+    can resume it.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        idle_timeout_s: float = 1800,
+        max_messages: int = 200,
+        max_chars: int = 200_000,
+        journal_dir: Optional[Path] = None,
+        journal_fsync_interval_s: float = 1.0,
+    ):
+        self.max_sessions = max_sessions
+        self.idle_timeout_s = idle_timeout_s
+        self.max_messages = max_messages
+        self.max_chars = max_chars
+        self.journal_dir = journal_dir
+        self.journal_fsync_interval_s = journal_fsync_interval_s
+        self._sessions: "OrderedDict[str, WebSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def create(self, problem: str) -> WebSession:
+        """Start a new session for a pasted problem."""
+        return self._create(problem)
+
+    async def get(self, session_id: str) -> Optional[WebSession]:
+        """Return a live session and mark it active, or None if it was evicted."""
+        return self._cached(session_id)
+
+    async def remove(self, session_id: str):
+        self._uncache(session_id)
+
+    async def save(self, session: WebSession):
+        """Persist a session after a turn. Nothing to do when it only lives in memory."""
+
+    async def save_if_unchanged(self, session: WebSession):
+        """Persist a background update (e.g. a new summary) unless another worker saved the session since."""
+
+    async def release(self, session_id: str):
+        """The client disconnected. Keep the session until it idles out, so it can be resumed."""
+
+    async def stored(self) -> int:
+        """Sessions kept by the store, including any not cached in this process."""
+        return len(self._sessions)
+
+    def _create(self, problem: str) -> WebSession:
+        session = WebSession(
+            session_id=uuid.uuid4().hex,
+            state=SessionState(
+                problem_id="custom",
+                solution_file="",
+                state=InterviewState.INTRO,
+                start_time=datetime.now(),
+            ),
+            problem=problem[:self.max_chars],
+        )
+        if self.journal_dir:
+            session.journal = SessionJournal.create(
+                self.journal_dir, session.session_id, fsync_interval_s=self.journal_fsync_interval_s
+            )
+            session.journal.record_session(session.state, problem_statement=session.problem)
+            session.journal.record_state(session.state.state)
+
+        self._cache(session)
+        return session
+
+    def _cache(self, session: WebSession):
+        with self._lock:
+            self._evict_idle()
+            stale = self._sessions.pop(session.session_id, None)
+            while len(self._sessions) >= self.max_sessions:
+                self._drop(self._sessions.popitem(last=False)[1])
+            self._sessions[session.session_id] = session
+        if stale is not None and stale is not session:
+            self._drop(stale)
+
+    def _cached(self, session_id: str) -> Optional[WebSession]:
+        with self._lock:
+            self._evict_idle()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_active = time.monotonic()
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def _uncache(self, session_id: str) -> Optional[WebSession]:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self._drop(session)
+        return session
+
+    def add_message(self, session: WebSession, role: MessageRole, content: str):
+        """Append to a session's transcript, trimming the oldest messages past the caps."""
+        messages = session.state.messages
+        message = Message(role=role, content=content[:self.max_chars], timestamp=datetime.now())
+        messages.append(message)
+        if session.journal:
+            session.journal.record_message(message)
+
+        while len(messages) > self.max_messages:
+            messages.pop(0)
+        while len(messages) > 1 and sum(len(m.content) for m in messages) > self.max_chars:
+            messages.pop(0)
+
+    def set_code(self, session: WebSession, code: str):
+        session.code = code[:self.max_chars]
+
+    def set_state(self, session: WebSession, state: InterviewState):
+        if state != session.state.state:
+            session.state.state = state
+            if session.journal:
+                session.journal.record_state(state)
+
+    def count_review(self, session: WebSession):
+        session.state.test_runs += 1
+        if session.journal:
+            session.journal.record_test_run()
+
+    def count_hint(self, session: WebSession):
+        session.state.hints_given += 1
+        if session.journal:
+            session.journal.record_hint()
+
+    @staticmethod
+    def _drop(session: WebSession):
+        # Don't wait on the writer: this runs on the event loop
+        if session.journal:
+            session.journal.close(wait=False)
+
+    def _evict_idle(self):
+        cutoff = time.monotonic() - self.idle_timeout_s
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.last_active >= cutoff:
+                break
+            self._drop(self._sessions.popitem(last=False)[1])
+
+
+class SQLiteSessionStore(SessionStore):
+    """Sessions shared by every worker through a SQLite database in WAL mode.
+
+    Each session is one row holding its compact serialization and a version
+    number. A worker caches the sessions its connections use (at most
+    ``max_sessions``), checks the row's version on each access and reloads
+    it only when another worker has saved it since, so a client can
+    reconnect to any worker. Rows idle for ``idle_timeout_s`` are purged.
+
+    All database work runs on one dedicated thread, so a busy database
+    (``busy_timeout`` waits on another worker's write) never blocks the
+    event loop.
+    """
+
+    PURGE_INTERVAL_S = 60.0
+
+    def __init__(self, db_path: Path, **kwargs):
+        super().__init__(**kwargs)
+        self.db_path = Path(db_path).expanduser()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mochi-sessions-db")
+        self._db: Optional[sqlite3.Connection] = None
+        self._executor.submit(self._open).result()
+        self._last_purge = 0.0
+
+    def _open(self):
+        self._db = sqlite3.connect(str(self.db_path), isolation_level=None)
+        self._db.execute("PRAGMA busy_timeout = 5000")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "id TEXT PRIMARY KEY, version INTEGER NOT NULL, last_active REAL NOT NULL, data BLOB NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS sessions_last_active ON sessions (last_active)")
+
+    async def _run(self, fn, *args):
+        """Run ``fn`` on the database thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def create(self, problem: str) -> WebSession:
+        session = self._create(problem)
+        await self.save(session)
+        now = time.time()
+        if now - self._last_purge >= self.PURGE_INTERVAL_S:
+            self._last_purge = now
+            await self._run(self._purge_idle, now - self.idle_timeout_s)
+        return session
+
+    async def get(self, session_id: str) -> Optional[WebSession]:
+        """Return a session, loading it from the database if another worker (or run) owns it."""
+        row = await self._run(self._read_version, session_id)
+        if row is None or row[1] < time.time() - self.idle_timeout_s:
+            self._uncache(session_id)
+            return None
+
+        session = self._cached(session_id)
+        if session is not None and session.version == row[0]:
+            return session
+
+        session = await self._run(self._read_session, session_id)
+        if session is None:
+            return None
+        if self.journal_dir:
+            session.journal = SessionJournal.create(
+                self.journal_dir, session_id, fsync_interval_s=self.journal_fsync_interval_s
+            )
+        self._cache(session)
+        return session
+
+    async def remove(self, session_id: str):
+        self._uncache(session_id)
+        await self._run(self._delete, session_id)
+
+    async def save(self, session: WebSession):
+        # Serialize on the loop so the snapshot is consistent; last writer wins
+        # if two workers drive the same session at once
+        data = dumps_session(session)
+        session.version += 1
+        await self._run(self._write, session.session_id, session.version, data)
+
+    async def save_if_unchanged(self, session: WebSession):
+        data, expected = dumps_session(session), session.version
+        if await self._run(self._write_if_version, session.session_id, expected, data):
+            if session.version == expected:  # Not already bumped by a save meanwhile
+                session.version = expected + 1
+
+    async def release(self, session_id: str):
+        """Save and stop caching a disconnected session; it stays resumable from any worker."""
+        session = self._uncache(session_id)
+        if session is not None:
+            await self.save(session)
+
+    async def stored(self) -> int:
+        """Sessions in the database, across all workers."""
+        return await self._run(lambda: self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0])
+
+    def close(self):
+        self._executor.submit(self._db.close).result()
+        self._executor.shutdown()
+
+    # Database thread
+
+    def _read_version(self, session_id: str) -> Optional[Tuple[int, float]]:
+        return self._db.execute(
+            "SELECT version, last_active FROM sessions WHERE id = ?", (session_id,)
+        ).fetchone()
+
+    def _read_session(self, session_id: str) -> Optional[WebSession]:
+        row = self._db.execute("SELECT version, data FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if row is None:
+            return None
+        return loads_session(session_id, row[1], version=row[0])
+
+    def _write(self, session_id: str, version: int, data: bytes):
+        self._db.execute(
+            "INSERT OR REPLACE INTO sessions (id, version, last_active, data) VALUES (?, ?, ?, ?)",
+            (session_id, version, time.time(), data),
+        )
+
+    def _write_if_version(self, session_id: str, version: int, data: bytes) -> bool:
+        cursor = self._db.execute(
+            "UPDATE sessions SET version = ?, last_active = ?, data = ? WHERE id = ? AND version = ?",
+            (version + 1, time.time(), data, session_id, version),
+        )
+        return cursor.rowcount == 1
+
+    def _delete(self, session_id: str):
+        self._db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def _purge_idle(self, cutoff: float):
+        self._db.execute("DELETE FROM sessions WHERE last_active < ?", (cutoff,))
+
+
+STORES = {"memory": SessionStore, "sqlite": SQLiteSessionStore}
+
+
+def create_session_store(config: Config) -> SessionStore:
+    """The session store selected by ``[server] session_store``."""
+    kind = config.server_session_store
+    if kind not in STORES:
+        raise ValueError(f"Unknown session store: {kind} (choose from {', '.join(STORES)})")
+
+    options = dict(
+        max_sessions=config.server_max_sessions,
+        idle_timeout_s=config.server_session_idle_timeout_s,
+        max_messages=config.server_max_messages_per_session,
+        max_chars=config.server_max_session_chars,
+        journal_dir=Path(config.journal_dir).expanduser() if config.journal_dir else None,
+        journal_fsync_interval_s=config.journal_fsync_interval_s,
+    )
+    if kind == "sqlite":
+        return SQLiteSessionStore(config.server_session_db, **options)
+    return SessionStore(**options)
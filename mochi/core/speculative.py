@@ -0,0 +1,85 @@
+"""Speculative background test runs on solution saves."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from mochi.harness.pool import Cancellation
+from mochi.harness.python_harness import PythonHarness, TestResult
+
+
+class SpeculativeRunner:
+    """Run the harness in the background after each save so results are ready on request.
+
+    Only the latest saved source matters: a newer save cancels a queued run and
+    kills the worker of a run already in flight, so the fresh run never waits
+    behind a stale one.
+    """
+
+    def __init__(self, harness: PythonHarness, solution_path: Path, test_cases: List[Dict[str, Any]]):
+        self.harness = harness
+        self.solution_path = solution_path
+        self.test_cases = test_cases
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mochi-speculative")
+        self._lock = threading.Lock()
+        self._source: Optional[str] = None
+        self._future: Optional[Future] = None
+        self._cancel: Optional[Cancellation] = None
+
+    def schedule(self) -> bool:
+        """Start a background run for the current file contents.
+
+        Returns False if the file can't be read or doesn't compile.
+        """
+        try:
+            source = self.solution_path.read_text()
+            compile(source, str(self.solution_path), "exec")
+        except (OSError, SyntaxError, ValueError):
+            self._invalidate()
+            return False
+
+        with self._lock:
+            if source == self._source and self._future is not None:
+                return True  # Save didn't change anything
+            self._abort()
+            self._source = source
+            self._cancel = Cancellation()
+            self._future = self._executor.submit(
+                self.harness.run_source, source, self.solution_path, self.test_cases, self._cancel
+            )
+        return True
+
+    def result_for(self, source: str, timeout: Optional[float] = None) -> Optional[TestResult]:
+        """Return the speculative result for ``source``, waiting if it's still running.
+
+        Returns None when no run matches the given source.
+        """
+        with self._lock:
+            if source != self._source or self._future is None or self._future.cancelled():
+                return None
+            future = self._future
+
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            return None
+
+    def shutdown(self):
+        """Drop queued runs and stop the background thread."""
+        self._invalidate()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _invalidate(self):
+        with self._lock:
+            self._abort()
+            self._source = None
+            self._future = None
+            self._cancel = None
+
+    def _abort(self):
+        """Drop the current run: unstart it if queued, kill its worker if running."""
+        if self._future is not None:
+            self._future.cancel()
+        if self._cancel is not None:
+            self._cancel.cancel()
@@ -0,0 +1,193 @@
+"""Lightweight span tracing for per-turn latency, written as a Chrome trace.
+
+Instrumented code calls ``span(name, **attrs)`` around a stage; it is a no-op
+until a session calls ``start_tracing``. Finished spans are buffered in
+memory and appended to ``<trace_dir>/<session>.trace.json`` in the Chrome
+trace-event JSON array format, one event per line, so a file can be opened
+in chrome://tracing or https://ui.perfetto.dev while still being appendable
+(a resumed session keeps adding to it) and readable after a crash.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+TRACE_SUFFIX = ".trace.json"
+
+
+class Span:
+    """A timed stage. Use as a context manager, or call ``end()`` yourself."""
+
+    __slots__ = ("name", "attrs", "start_ns", "tid", "_tracer")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+        self.tid = threading.get_ident()
+        self._tracer = tracer
+        self.start_ns = time.perf_counter_ns()
+
+    def set(self, **attrs):
+        """Attach attributes, e.g. token counts once a response has arrived."""
+        self.attrs.update(attrs)
+
+    def end(self):
+        if self._tracer is not None:
+            self._tracer._record(self, time.perf_counter_ns())
+            self._tracer = None
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.end()
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def end(self):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Tracer:
+    """Collects spans for one session and appends them to a trace file."""
+
+    def __init__(self, path: Path, flush_every: int = 64):
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        # Chrome trace timestamps are microseconds; anchor the monotonic clock to wall time
+        self._epoch_us = time.time_ns() // 1000 - time.perf_counter_ns() // 1000
+
+    def start(self, name: str, **attrs) -> Span:
+        return Span(self, name, attrs)
+
+    def _record(self, span: Span, end_ns: int):
+        event = {
+            "name": span.name,
+            "cat": span.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": self._epoch_us + span.start_ns // 1000,
+            "dur": (end_ns - span.start_ns) / 1000,
+            "pid": self._pid,
+            "tid": span.tid,
+            "args": span.attrs,
+        }
+        with self._lock:
+            self._events.append(event)
+            full = len(self._events) >= self.flush_every
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            events, self._events = self._events, []
+            if not events:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                new = not self.path.exists() or self.path.stat().st_size == 0
+                with open(self.path, "a", encoding="utf-8") as f:
+                    if new:
+                        f.write("[\n")
+                    f.writelines(json.dumps(e, default=str) + ",\n" for e in events)
+            except OSError:
+                pass  # Tracing is best-effort
+
+
+_tracer: Optional[Tracer] = None
+
+
+def start_tracing(trace_dir: Path, session_id: str) -> Tracer:
+    """Route ``span()`` calls in this process to ``<trace_dir>/<session_id>.trace.json``."""
+    global _tracer
+    stop_tracing()
+    _tracer = Tracer(Path(trace_dir).expanduser() / f"{session_id}{TRACE_SUFFIX}")
+    return _tracer
+
+
+def stop_tracing():
+    """Write out buffered spans and go back to no-op spans."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.flush()
+
+
+def span(name: str, **attrs):
+    """Start a span on the active tracer (a shared no-op when tracing is off)."""
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    return tracer.start(name, **attrs)
+
+
+def load_trace(path: Path) -> List[Dict[str, Any]]:
+    """Read the complete ("X") events from a trace file, skipping a torn last line."""
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip().rstrip(",")
+            if line in ("", "[", "]"):
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if event.get("ph") == "X":
+                events.append(event)
+    return events
+
+
+def stage_durations(events: List[Dict[str, Any]]) -> Dict[str, List[float]]:
+    """Durations in milliseconds by stage.
+
+    Besides each span's own duration, numeric ``*_ms`` attributes (such as
+    ``ttft_ms`` on LLM spans) are reported as ``<span>:<attr>`` stages.
+    """
+    stages: Dict[str, List[float]] = defaultdict(list)
+    for event in events:
+        stages[event["name"]].append(event["dur"] / 1000)
+        for key, value in event.get("args", {}).items():
+            if key.endswith("_ms") and isinstance(value, (int, float)):
+                stages[f"{event['name']}:{key[:-3]}"].append(float(value))
+    return dict(stages)
+
+
+def percentiles(values: List[float], points=(50, 95, 99)) -> List[float]:
+    return [float(v) for v in np.percentile(values, points)]
+
+
+def find_trace(trace_dir: Path, session: Optional[str] = None) -> Optional[Path]:
+    """Locate a trace by path, session id or id prefix; the newest one if ``session`` is None."""
+    if session and Path(session).is_file():
+        return Path(session)
+
+    trace_dir = Path(trace_dir).expanduser()
+    if not trace_dir.is_dir():
+        return None
+    candidates = sorted(trace_dir.glob(f"{session or ''}*{TRACE_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+    return candidates[-1] if candidates else None
@@ -0,0 +1,101 @@
+"""Content-addressed cache of harness results."""
+
+import ast
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+def normalize_source(source: str) -> str:
+    """Normalize solution source so formatting and comment edits hash the same.
+
+    Falls back to the raw source when it doesn't parse.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return source
+    return ast.dump(tree, annotate_fields=False, include_attributes=False)
+
+
+def result_key(source: str, test_cases: List[Dict[str, Any]], limits: Dict[str, Any]) -> str:
+    """Build a cache key from the normalized solution, test suite and limits."""
+    source_hash = hashlib.sha256(normalize_source(source).encode()).hexdigest()
+    suite_hash = hashlib.sha256(
+        json.dumps(test_cases, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    limits_hash = hashlib.sha256(json.dumps(limits, sort_keys=True).encode()).hexdigest()
+    return hashlib.sha256(f"{source_hash}:{suite_hash}:{limits_hash}".encode()).hexdigest()
+
+
+class ResultCache:
+    """Bounded in-memory LRU of raw result dicts, with an optional on-disk tier."""
+
+    def __init__(self, max_entries: int = 128, cache_dir: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of a cached result, checking memory first and then disk."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+
+        if result is None:
+            result = self._read_disk(key)
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, result)
+
+        # Callers get their own copy so they can't mutate the cached entry
+        return json.loads(json.dumps(result))
+
+    def put(self, key: str, result: Dict):
+        """Store a result in memory and, if configured, on disk."""
+        with self._lock:
+            self._remember(key, result)
+        self._write_disk(key, result)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, result: Dict):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Dict]:
+        if not self.cache_dir:
+            return None
+        try:
+            return json.loads((self.cache_dir / f"{key}.json").read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_disk(self, key: str, result: Dict):
+        if not self.cache_dir:
+            return
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(result))
+            tmp_path.replace(path)
+        except (OSError, TypeError, ValueError):
+            pass  # The disk tier is best-effort
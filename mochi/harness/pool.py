@@ -0,0 +1,192 @@
+"""Pool of pre-started harness worker processes."""
+
+import json
+import queue
+import select
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+WORKER_SCRIPT = Path(__file__).parent / "worker.py"
+
+
+class Cancellation:
+    """Lets another thread abort a test run by killing the worker processes running it."""
+
+    def __init__(self):
+        self.cancelled = False
+        self._procs = set()
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        # Kill under the lock: once unregistered, a worker can go back to the
+        # pool and take another job
+        with self._lock:
+            self.cancelled = True
+            for proc in self._procs:
+                _kill(proc)
+
+    def register(self, proc: subprocess.Popen):
+        """Track a process running part of the job (killed at once if already cancelled)."""
+        with self._lock:
+            self._procs.add(proc)
+            if self.cancelled:
+                _kill(proc)
+
+    def unregister(self, proc: subprocess.Popen):
+        with self._lock:
+            self._procs.discard(proc)
+
+
+def _kill(proc: subprocess.Popen):
+    try:
+        proc.kill()
+    except OSError:
+        pass  # Already reaped
+
+
+class _Worker:
+    """A single pre-started worker process."""
+
+    def __init__(self, memory_mb: int, max_jobs: int):
+        self.max_jobs = max_jobs
+        self.jobs_run = 0
+        self.proc = subprocess.Popen(
+            [sys.executable, "-u", str(WORKER_SCRIPT), str(memory_mb), str(max_jobs)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            cwd=tempfile.gettempdir(),
+            env={
+                "PATH": "/usr/bin:/bin",
+                "PYTHONPATH": "",
+                "HOME": tempfile.gettempdir(),
+            },
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    @property
+    def exhausted(self) -> bool:
+        return self.jobs_run >= self.max_jobs
+
+    def run(self, job: Dict[str, Any], timeout_s: float, cancel: Optional[Cancellation] = None) -> Dict:
+        """Send a job and wait for its result line; cancelling kills the worker."""
+        self.jobs_run += 1
+        if cancel is None:
+            return self._run(job, timeout_s)
+        cancel.register(self.proc)
+        try:
+            return self._run(job, timeout_s)
+        finally:
+            cancel.unregister(self.proc)
+
+    def _run(self, job: Dict[str, Any], timeout_s: float) -> Dict:
+        try:
+            self.proc.stdin.write(json.dumps(job) + "\n")
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            self.kill()
+            return {"error": "Worker exited unexpectedly", "passed": 0, "failed": -1}
+
+        ready, _, _ = select.select([self.proc.stdout], [], [], timeout_s)
+        if not ready:
+            self.kill()
+            return {"error": "Timeout", "passed": 0, "failed": -1}
+
+        line = self.proc.stdout.readline()
+        if not line:
+            self.kill()
+            return {"error": "Worker exited unexpectedly", "passed": 0, "failed": -1}
+
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            self.kill()
+            return {"error": f"JSON decode error: {e}", "passed": 0, "failed": -1}
+
+    def kill(self):
+        """Terminate the worker and reap it."""
+        if self.alive:
+            self.proc.kill()
+        self.proc.wait()
+        for stream in (self.proc.stdin, self.proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class WorkerPool:
+    """Keep ``size`` pre-started, pre-limited workers ready to run test jobs.
+
+    Workers are recycled after ``max_jobs`` jobs (after every job by default,
+    so each run gets a fresh interpreter), and replaced at once if one crashes
+    or times out. Replacements are started in the background, keeping
+    interpreter startup off the request path.
+    """
+
+    def __init__(self, size: int, memory_mb: int = 512, max_jobs: int = 1):
+        self.size = size
+        self.memory_mb = memory_mb
+        self.max_jobs = max(1, max_jobs)
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        for _ in range(size):
+            self._idle.put(_Worker(self.memory_mb, self.max_jobs))
+
+    @property
+    def idle(self) -> int:
+        """Warm workers ready to take a job right now."""
+        return self._idle.qsize()
+
+    def run(self, job: Dict[str, Any], timeout_s: float, cancel: Optional[Cancellation] = None) -> Dict:
+        """Run a job on a warm worker (or a fresh one if all are busy)."""
+        worker = self._acquire()
+        try:
+            return worker.run(job, timeout_s, cancel)
+        finally:
+            self._release(worker)
+
+    def _acquire(self) -> _Worker:
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return _Worker(self.memory_mb, self.max_jobs)
+            if worker.alive:
+                return worker
+            worker.kill()
+
+    def _release(self, worker: _Worker):
+        if worker.alive and not worker.exhausted and not self._closed:
+            self._idle.put(worker)
+            return
+
+        # Recycle: reap the old process and warm a replacement off-thread
+        threading.Thread(target=self._replace, args=(worker,), daemon=True).start()
+
+    def _replace(self, worker: _Worker):
+        worker.kill()
+        with self._lock:
+            if self._closed or self._idle.qsize() >= self.size:
+                return
+            self._idle.put(_Worker(self.memory_mb, self.max_jobs))
+
+    def close(self):
+        """Stop all idle workers."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                break
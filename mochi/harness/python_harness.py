@@ -2,11 +2,26 @@
 
 import subprocess
 import json
+import os
 import tempfile
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+
+from mochi.core.tracing import span
+from mochi.harness.cache import ResultCache, result_key
+from mochi.harness.pool import Cancellation, WorkerPool, WORKER_SCRIPT
+
+
+@dataclass
+class CaseResult:
+    """Outcome of a single test case."""
+    name: str
+    status: str  # "passed" | "failed" | "timed_out" | "crashed"
+    duration_ms: float = 0.0
 
 
 @dataclass
@@ -17,106 +32,222 @@ class TestResult:
     total: int
     failures: List[Dict[str, Any]]
     error: str = ""
+    cases: List[CaseResult] = field(default_factory=list)
+    cached: bool = False
 
     @property
     def all_passing(self) -> bool:
         return self.failed == 0 and self.passed > 0
 
+    @property
+    def timed_out(self) -> int:
+        return sum(1 for case in self.cases if case.status == "timed_out")
+
 
 class PythonHarness:
     """Execute Python code with resource limits."""
 
-    def __init__(self, timeout_ms: int = 4000, memory_mb: int = 512):
+    def __init__(
+        self,
+        timeout_ms: int = 4000,
+        memory_mb: int = 512,
+        pool_size: int = 0,
+        jobs_per_worker: int = 1,
+        case_timeout_ms: Optional[int] = None,
+        max_parallel_cases: int = 1,
+        cache_size: int = 0,
+        cache_dir: Optional[Path] = None,
+    ):
+        """
+        Args:
+            timeout_ms: Wall-clock budget for a test run
+            memory_mb: Address-space limit for the solution process
+            pool_size: Number of pre-started workers to keep warm (0 disables the pool)
+            jobs_per_worker: Recycle each pooled worker after this many runs
+            case_timeout_ms: Wall-clock and CPU budget per test case (defaults to an equal share of timeout_ms)
+            max_parallel_cases: Split test cases across up to this many workers (capped at idle pooled workers)
+            cache_size: Keep this many results in an in-memory LRU (0 disables caching)
+            cache_dir: Optional directory for an on-disk result cache tier
+        """
         self.timeout_ms = timeout_ms
         self.memory_mb = memory_mb
+        self.case_timeout_ms = case_timeout_ms
+        self.max_parallel_cases = max(1, max_parallel_cases)
+        self.pool: Optional[WorkerPool] = None
+        self.cache: Optional[ResultCache] = None
+
+        if cache_size > 0:
+            self.cache = ResultCache(max_entries=cache_size, cache_dir=cache_dir)
+
+        # The pool relies on POSIX pipes and rlimits
+        if pool_size > 0 and os.name == "posix":
+            self.pool = WorkerPool(pool_size, memory_mb=memory_mb, max_jobs=jobs_per_worker)
 
     def run_tests(self, solution_path: Path, test_cases: List[Dict[str, Any]]) -> TestResult:
-        """Execute solution against test cases in isolated subprocess."""
+        """Execute solution against test cases in isolated subprocesses."""
+        try:
+            source = Path(solution_path).read_text()
+        except Exception as e:
+            return self._parse_result({"error": f"Failed to load solution: {e}", "passed": 0, "failed": -1})
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test runner script
-            runner_script = self._create_runner_script(solution_path, test_cases)
-            runner_path = Path(tmpdir) / "runner.py"
-            runner_path.write_text(runner_script)
+        return self.run_source(source, solution_path, test_cases)
 
-            # Execute with restrictions
-            result = self._execute_sandboxed(runner_path)
+    def run_source(
+        self,
+        source: str,
+        solution_path: Path,
+        test_cases: List[Dict[str, Any]],
+        cancel: Optional[Cancellation] = None,
+    ) -> TestResult:
+        """Execute a snapshot of the solution source, as if it were saved at solution_path.
 
-        return self._parse_result(result)
+        ``cancel`` lets another thread abort the run; it then reports a "Cancelled" error.
+        """
+        with span("harness.run_tests", cases=len(test_cases)) as run_span:
+            test_result = self._run_source(source, solution_path, test_cases, cancel)
+            run_span.set(cached=test_result.cached, passed=test_result.passed, error=bool(test_result.error))
+        return test_result
 
-    def _create_runner_script(self, solution_path: Path, test_cases: List[Dict[str, Any]]) -> str:
-        """Generate test runner script."""
-        test_cases_json = json.dumps(test_cases)
+    def _run_source(
+        self,
+        source: str,
+        solution_path: Path,
+        test_cases: List[Dict[str, Any]],
+        cancel: Optional[Cancellation] = None,
+    ) -> TestResult:
+        key = None
+        if self.cache is not None:
+            key = result_key(source, test_cases, self._limits(solution_path, len(test_cases)))
+            cached = self.cache.get(key)
+            if cached is not None:
+                test_result = self._parse_result(cached)
+                test_result.cached = True
+                return test_result
 
-        return f'''
-import sys
-import json
-import traceback
-import signal
-import resource
-
-# Set resource limits
-try:
-    resource.setrlimit(resource.RLIMIT_AS, ({self.memory_mb} * 1024 * 1024, -1))
-    resource.setrlimit(resource.RLIMIT_CPU, (10, 10))
-except Exception:
-    pass  # Skip on systems that don't support resource limits
-
-# Timeout handler
-def timeout_handler(signum, frame):
-    print(json.dumps({{"error": "Timeout exceeded", "passed": 0, "failed": -1}}))
-    sys.exit(1)
-
-signal.signal(signal.SIGALRM, timeout_handler)
-signal.alarm({self.timeout_ms // 1000 + 1})
-
-# Load solution
-sys.path.insert(0, "{solution_path.parent}")
-try:
-    exec(open("{solution_path}").read(), globals())
-except Exception as e:
-    print(json.dumps({{"error": f"Failed to load solution: {{e}}", "passed": 0, "failed": -1}}))
-    sys.exit(1)
-
-# Load tests
-test_cases = {test_cases_json}
-
-results = {{"passed": 0, "failed": 0, "failures": []}}
-
-for test in test_cases:
-    try:
-        func = globals()[test["function"]]
-        result = func(**test["input"])
-
-        if result == test["expected"]:
-            results["passed"] += 1
+        job = {
+            "source": source,
+            "filename": str(solution_path),
+            "solution_dir": str(Path(solution_path).parent),
+            "case_timeout_s": self._case_timeout_ms(len(test_cases)) / 1000,
+        }
+
+        width = self._fan_out(len(test_cases))
+        if width > 1:
+            result = self._run_parallel(job, test_cases, width, cancel)
         else:
-            results["failed"] += 1
-            results["failures"].append({{
-                "name": test["name"],
-                "input": test["input"],
-                "expected": test["expected"],
-                "got": result
-            }})
-    except Exception as e:
-        results["failed"] += 1
-        results["failures"].append({{
-            "name": test["name"],
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }})
-
-print(json.dumps(results))
-'''
-
-    def _execute_sandboxed(self, runner_path: Path) -> Dict:
-        """Run with subprocess isolation."""
+            job["test_cases"] = test_cases
+            job["timeout_s"] = self.timeout_ms / 1000
+            result = self._execute_job(job, timeout_s=self.timeout_ms / 1000 + 2, cancel=cancel)
+        if cancel is not None and cancel.cancelled:
+            result = {"error": "Cancelled", "passed": 0, "failed": -1}
+
+        if key is not None and self._is_cacheable(result):
+            self.cache.put(key, result)
+
+        return self._parse_result(result)
+
+    def _case_timeout_ms(self, case_count: int) -> float:
+        """Per-case budget: as configured, or an equal share of the run's so one hung case can't starve the rest."""
+        return self.case_timeout_ms or self.timeout_ms / max(1, case_count)
+
+    def _limits(self, solution_path: Path, case_count: int) -> Dict[str, Any]:
+        """Everything besides source and tests that can change a run's outcome."""
+        return {
+            "timeout_ms": self.timeout_ms,
+            "case_timeout_ms": self._case_timeout_ms(case_count),
+            "memory_mb": self.memory_mb,
+            "solution_dir": str(Path(solution_path).parent),
+        }
+
+    @staticmethod
+    def _is_cacheable(result: Dict) -> bool:
+        """Only cache deterministic outcomes; timeouts and crashes may be load-dependent."""
+        if result.get("failed") == -1:
+            return result.get("error", "").startswith("Failed to load solution")
+        return all(case["status"] not in ("timed_out", "crashed") for case in result.get("cases", []))
+
+    def _fan_out(self, case_count: int) -> int:
+        """How many workers to split a run across.
+
+        Never more than the pool has idle: a job that finds no warm worker
+        cold-spawns one, which costs more than running its cases in series.
+        """
+        width = min(self.max_parallel_cases, case_count)
+        if self.pool is not None:
+            width = min(width, self.pool.idle)
+        return width
+
+    def _run_parallel(
+        self,
+        job: Dict[str, Any],
+        test_cases: List[Dict[str, Any]],
+        width: int,
+        cancel: Optional[Cancellation] = None,
+    ) -> Dict:
+        """Split test cases into ``width`` jobs, one per worker, and merge the per-case results."""
+        size = -(-len(test_cases) // width)
+        chunks = [test_cases[i:i + size] for i in range(0, len(test_cases), size)]
+        timeout_s = self.timeout_ms / 1000
+
+        def run_chunk(chunk: List[Dict[str, Any]]) -> Dict:
+            start = time.perf_counter()
+            result = self._execute_job(
+                {**job, "test_cases": chunk, "timeout_s": timeout_s}, timeout_s=timeout_s + 2, cancel=cancel
+            )
+            result.setdefault("duration_ms", round((time.perf_counter() - start) * 1000, 3))
+            return result
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(run_chunk, chunks))
+
+        merged = {"passed": 0, "failed": 0, "failures": [], "cases": []}
+        for chunk, result in zip(chunks, results):
+            if result.get("failed") != -1:
+                merged["passed"] += result.get("passed", 0)
+                merged["failed"] += result.get("failed", 0)
+                merged["failures"].extend(result.get("failures", []))
+                merged["cases"].extend(result.get("cases", []))
+                continue
+
+            error = result.get("error", "")
+            if error.startswith("Failed to load solution"):
+                return result  # Same for every chunk: report it once for the run
+
+            # The worker died or hung: every case in its chunk is lost
+            for test in chunk:
+                merged["failed"] += 1
+                merged["failures"].append({"name": test["name"], "error": error})
+                merged["cases"].append({
+                    "name": test["name"],
+                    "status": "timed_out" if "Timeout" in error else "crashed",
+                    "duration_ms": result["duration_ms"],
+                })
+
+        return merged
+
+    def _execute_job(self, job: Dict[str, Any], timeout_s: float, cancel: Optional[Cancellation] = None) -> Dict:
+        """Run a job on a warm pooled worker, or a one-shot worker if pooling is off."""
+        if cancel is not None and cancel.cancelled:
+            return {"error": "Cancelled", "passed": 0, "failed": -1}
+        if self.pool is not None:
+            return self.pool.run(job, timeout_s=timeout_s, cancel=cancel)
+        return self._execute_sandboxed(job, timeout_s=timeout_s, cancel=cancel)
+
+    def close(self):
+        """Shut down pooled workers, if any."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+    def _execute_sandboxed(self, job: Dict[str, Any], timeout_s: float, cancel: Optional[Cancellation] = None) -> Dict:
+        """Run a one-shot worker with subprocess isolation."""
         try:
-            result = subprocess.run(
-                [sys.executable, "-u", str(runner_path)],
-                capture_output=True,
+            proc = subprocess.Popen(
+                [sys.executable, "-u", str(WORKER_SCRIPT), str(self.memory_mb), "1"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=self.timeout_ms / 1000 + 2,
                 cwd=tempfile.gettempdir(),
                 env={
                     "PATH": "/usr/bin:/bin",
@@ -124,11 +255,22 @@ print(json.dumps(results))
                     "HOME": tempfile.gettempdir(),
                 },
             )
+            if cancel is not None:
+                cancel.register(proc)
+            try:
+                stdout, stderr = proc.communicate(json.dumps(job) + "\n", timeout=timeout_s)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                raise
+            finally:
+                if cancel is not None:
+                    cancel.unregister(proc)
 
-            if result.stdout:
-                return json.loads(result.stdout.strip().split('\n')[-1])
+            if stdout:
+                return json.loads(stdout.strip().split('\n')[-1])
             else:
-                return {"error": result.stderr or "No output", "passed": 0, "failed": -1}
+                return {"error": stderr or "Worker exited unexpectedly", "passed": 0, "failed": -1}
 
         except subprocess.TimeoutExpired:
             return {"error": "Timeout", "passed": 0, "failed": -1}
@@ -151,10 +293,12 @@ print(json.dumps(results))
         passed = result.get("passed", 0)
         failed = result.get("failed", 0)
         failures = result.get("failures", [])
+        cases = [CaseResult(**case) for case in result.get("cases", [])]
 
         return TestResult(
             passed=passed,
             failed=failed,
             total=passed + failed,
-            failures=failures
+            failures=failures,
+            cases=cases
         )
@@ -0,0 +1,210 @@
+"""Harness worker process.
+
+Launched as a standalone script by ``PythonHarness`` and ``WorkerPool`` (it
+must not import mochi, since workers run with an empty PYTHONPATH). Resource
+limits are applied once at startup; the worker then reads one JSON job per
+line from stdin, runs the solution against the job's test cases and writes
+one JSON result line back. It exits after ``max_jobs`` jobs so the pool can
+recycle it.
+
+Each test case gets its own wall-clock timer and CPU budget, so one slow case
+is reported as timed out without taking the rest of the run down with it.
+
+Usage: python -u worker.py <memory_mb> <max_jobs>
+"""
+
+import json
+import math
+import os
+import resource
+import signal
+import sys
+import time
+import traceback
+
+# Per-job CPU budget; the RLIMIT_CPU hard cap covers the worker's whole lifetime
+CPU_SECONDS_PER_JOB = 10
+
+_cpu_hard_limit = resource.RLIM_INFINITY
+
+
+class JobTimeout(Exception):
+    """Raised when a job or test case exceeds its wall-clock or CPU budget."""
+
+
+def _timeout_handler(signum, frame):
+    raise JobTimeout()
+
+
+def _apply_limits(memory_mb: int, max_jobs: int):
+    """Apply resource limits once for the lifetime of this worker."""
+    global _cpu_hard_limit
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_mb * 1024 * 1024, -1))
+        _cpu_hard_limit = CPU_SECONDS_PER_JOB * max_jobs
+        resource.setrlimit(resource.RLIMIT_CPU, (_cpu_hard_limit, _cpu_hard_limit))
+    except Exception:
+        pass  # Skip on systems that don't support resource limits
+
+
+def _cpu_used() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _arm_budget(seconds: float):
+    """Start the wall-clock timer and CPU soft limit for the next step."""
+    signal.setitimer(signal.ITIMER_REAL, max(seconds, 0.001))
+    try:
+        soft = math.ceil(_cpu_used() + seconds)
+        if _cpu_hard_limit != resource.RLIM_INFINITY:
+            soft = min(soft, _cpu_hard_limit)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, _cpu_hard_limit))
+    except Exception:
+        pass
+
+
+def _disarm_budget():
+    signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def _run_tests(namespace: dict, test_cases: list, case_timeout_s: float, deadline: float) -> dict:
+    """Run test cases against functions defined in ``namespace``."""
+    results = {"passed": 0, "failed": 0, "failures": [], "cases": []}
+
+    for test in test_cases:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            # Run budget is spent: report the rest as timed out without running them
+            results["failed"] += 1
+            results["failures"].append({"name": test["name"], "error": "Timeout exceeded"})
+            results["cases"].append({"name": test["name"], "status": "timed_out", "duration_ms": 0.0})
+            continue
+
+        start = time.perf_counter()
+        try:
+            _arm_budget(min(case_timeout_s, remaining))
+            try:
+                func = namespace[test["function"]]
+                result = func(**test["input"])
+            finally:
+                _disarm_budget()
+
+            if result == test["expected"]:
+                results["passed"] += 1
+                status = "passed"
+            else:
+                results["failed"] += 1
+                results["failures"].append({
+                    "name": test["name"],
+                    "input": test["input"],
+                    "expected": test["expected"],
+                    "got": result
+                })
+                status = "failed"
+        except JobTimeout:
+            results["failed"] += 1
+            results["failures"].append({"name": test["name"], "error": "Timeout exceeded"})
+            status = "timed_out"
+        except Exception as e:
+            results["failed"] += 1
+            results["failures"].append({
+                "name": test["name"],
+                "error": str(e),
+                "traceback": traceback.format_exc()
+            })
+            status = "crashed"
+
+        results["cases"].append({
+            "name": test["name"],
+            "status": status,
+            "duration_ms": _elapsed_ms(start),
+        })
+
+    return results
+
+
+def run_job(job: dict) -> dict:
+    """Execute a single solution+tests job and return the raw result dict."""
+    timeout_s = job.get("timeout_s", 5)
+    case_timeout_s = job.get("case_timeout_s") or timeout_s / max(1, len(job["test_cases"]))
+    deadline = time.monotonic() + timeout_s
+    solution_dir = job.get("solution_dir", "")
+    sys.path.insert(0, solution_dir)
+    modules_before = set(sys.modules)
+
+    try:
+        namespace = {"__name__": "__main__"}
+        try:
+            _arm_budget(timeout_s)
+            exec(compile(job["source"], job.get("filename", "<solution>"), "exec"), namespace)
+        except JobTimeout:
+            return {"error": "Timeout exceeded", "passed": 0, "failed": -1}
+        except Exception as e:
+            return {"error": f"Failed to load solution: {e}", "passed": 0, "failed": -1}
+        finally:
+            _disarm_budget()
+
+        return _run_tests(namespace, job["test_cases"], case_timeout_s, deadline)
+    finally:
+        if solution_dir in sys.path:
+            sys.path.remove(solution_dir)
+        _forget_solution_modules(solution_dir, modules_before)
+
+
+def _forget_solution_modules(solution_dir: str, modules_before: set):
+    """Drop modules the job imported from the solution directory.
+
+    A reused worker would otherwise hand the next run a stale copy of a
+    helper module the candidate has since edited.
+    """
+    if not solution_dir:
+        return
+    root = os.path.abspath(solution_dir) + os.sep
+    for name in set(sys.modules) - modules_before:
+        path = getattr(sys.modules[name], "__file__", None) or ""
+        if os.path.abspath(path).startswith(root):
+            del sys.modules[name]
+
+
+def main():
+    memory_mb = int(sys.argv[1])
+    max_jobs = int(sys.argv[2])
+
+    # Don't let solutions import from the harness package directory
+    if sys.path and sys.path[0] == os.path.dirname(os.path.abspath(__file__)):
+        sys.path.pop(0)
+
+    # Keep private handles on the job pipes, then point the standard streams at
+    # /dev/null so candidate prints or input() calls can't corrupt the protocol.
+    jobs_in = os.fdopen(os.dup(0), "r")
+    results_out = os.fdopen(os.dup(1), "w")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    _apply_limits(memory_mb, max_jobs)
+    signal.signal(signal.SIGALRM, _timeout_handler)
+    signal.signal(signal.SIGXCPU, _timeout_handler)
+
+    for _ in range(max_jobs):
+        line = jobs_in.readline()
+        if not line:
+            break  # Pool closed our stdin
+
+        try:
+            result = run_job(json.loads(line))
+            payload = json.dumps(result)
+        except Exception as e:
+            payload = json.dumps({"error": f"Worker error: {e}", "passed": 0, "failed": -1})
+
+        results_out.write(payload + "\n")
+        results_out.flush()
+
+
+if __name__ == "__main__":
+    main()
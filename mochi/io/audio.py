@@ -0,0 +1,183 @@
+"""Audio capture and preprocessing: ring buffer, voice-activity detector, trim and normalize."""
+
+from typing import Optional
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Preallocated float32 ring buffer addressed by absolute sample index.
+
+    A single writer (the audio callback) appends with ``write``. Readers copy
+    any range that is still within the last ``capacity`` samples with ``read``.
+    ``written`` is only advanced after the samples are in place, so a reader
+    never sees a half-written block.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.float32)
+        self.written = 0
+
+    def write(self, samples: np.ndarray):
+        total = len(samples)
+        n = min(total, self.capacity)
+        samples = samples[total - n:]
+        start = (self.written + total - n) % self.capacity
+        first = min(n, self.capacity - start)
+        self._data[start:start + first] = samples[:first]
+        self._data[:n - first] = samples[first:]
+        self.written += total
+
+    def read(self, start: int, end: Optional[int] = None) -> np.ndarray:
+        """Copy samples ``[start, end)`` (absolute indices) into a new array."""
+        end = self.written if end is None else min(end, self.written)
+        start = max(start, end - self.capacity, 0)
+        if end <= start:
+            return np.zeros(0, dtype=np.float32)
+
+        a, b = start % self.capacity, end % self.capacity
+        if a < b:
+            return self._data[a:b].copy()
+        return np.concatenate((self._data[a:], self._data[:b]))
+
+
+class VoiceActivityDetector:
+    """Frame-level energy VAD with an adaptive noise floor.
+
+    Frame RMS is compared against ``threshold_ratio`` times a running noise
+    floor. The floor falls quickly to quieter frames and rises slowly
+    otherwise, so it follows a fan or a noisy room without tracking speech.
+    The first ``calibration_ms`` only train the floor. Speech starts after
+    ``min_speech_ms`` of consecutive voiced frames, which keeps clicks and
+    bumps from opening an utterance.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 30,
+        threshold_ratio: float = 3.0,
+        min_threshold: float = 0.008,
+        floor_fall: float = 0.2,
+        floor_rise: float = 0.005,
+        min_speech_ms: int = 90,
+        calibration_ms: int = 240,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_samples = int(sample_rate * frame_ms / 1000)
+        self.threshold_ratio = threshold_ratio
+        self.min_threshold = min_threshold
+        self.noise_floor = 0.0
+        self.floor_fall = floor_fall
+        self.floor_rise = floor_rise
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.calibration_frames = calibration_ms // frame_ms
+
+        self.frames_seen = 0
+        self.speech_start: Optional[int] = None  # Absolute sample index
+        self.speech_end: Optional[int] = None    # End of the last voiced frame
+        self._voiced_run = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self.speech_start is not None
+
+    @property
+    def silence_sec(self) -> float:
+        """Time since the last voiced frame, once speech has started."""
+        if self.speech_end is None:
+            return 0.0
+        return (self.frames_seen * self.frame_samples - self.speech_end) / self.sample_rate
+
+    def process(self, samples: np.ndarray):
+        """Feed whole frames (``len(samples)`` must be a multiple of ``frame_samples``)."""
+        frames = samples.reshape(-1, self.frame_samples)
+        rms = np.sqrt(np.mean(np.square(frames), axis=1))
+
+        for level in rms:
+            self.frames_seen += 1
+            if self.frames_seen <= self.calibration_frames:
+                # Running mean of the room before anyone speaks
+                self.noise_floor += (level - self.noise_floor) / self.frames_seen
+                continue
+
+            threshold = max(self.noise_floor * self.threshold_ratio, self.min_threshold)
+            voiced = level > threshold
+
+            rate = self.floor_fall if level < self.noise_floor else self.floor_rise
+            self.noise_floor += rate * (level - self.noise_floor)
+
+            if not voiced:
+                self._voiced_run = 0
+                continue
+
+            self._voiced_run += 1
+            frame_end = self.frames_seen * self.frame_samples
+            if self.speech_start is None and self._voiced_run >= self.min_speech_frames:
+                self.speech_start = frame_end - self._voiced_run * self.frame_samples
+            if self.speech_start is not None:
+                self.speech_end = frame_end
+
+
+def frame_rms(audio: np.ndarray, frame_samples: int) -> np.ndarray:
+    """RMS of each whole frame in ``audio`` (a trailing partial frame is ignored)."""
+    usable = len(audio) // frame_samples * frame_samples
+    frames = audio[:usable].reshape(-1, frame_samples)
+    return np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_samples)
+
+
+def trim_silence(
+    audio: np.ndarray,
+    sample_rate: int,
+    threshold: float = 0.02,
+    frame_ms: int = 30,
+    pad_sec: float = 0.3,
+    block_sec: float = 1.0,
+) -> np.ndarray:
+    """Drop leading and trailing silence, keeping ``pad_sec`` either side of the speech.
+
+    Frames are voiced when their RMS exceeds ``threshold``. Each end is scanned
+    inward one block at a time, so the cost follows the length of the silence
+    rather than the length of the recording. Returns an empty array if nothing
+    is voiced.
+    """
+    audio = audio.reshape(-1)
+    frame = int(sample_rate * frame_ms / 1000)
+    block = max(frame, int(block_sec * sample_rate) // frame * frame)
+    end = len(audio) // frame * frame
+
+    first = None
+    for start in range(0, end, block):
+        voiced = np.flatnonzero(frame_rms(audio[start:min(start + block, end)], frame) > threshold)
+        if voiced.size:
+            first = start + int(voiced[0]) * frame
+            break
+    if first is None:
+        return audio[:0]
+
+    last = first + frame
+    for stop in range(end, first, -block):
+        start = max(stop - block, first)
+        voiced = np.flatnonzero(frame_rms(audio[start:stop], frame) > threshold)
+        if voiced.size:
+            last = start + (int(voiced[-1]) + 1) * frame
+            break
+
+    pad = int(pad_sec * sample_rate)
+    return audio[max(first - pad, 0):min(last + pad, len(audio))]
+
+
+def normalize(audio: np.ndarray, peak: float = 0.9, max_gain: float = 10.0) -> np.ndarray:
+    """Scale so the loudest sample reaches ``peak``, boosting quiet input by at most ``max_gain``."""
+    if len(audio) == 0:
+        return audio
+    current = max(float(audio.max()), -float(audio.min()))
+    if current == 0.0:
+        return audio
+    return audio * np.float32(min(peak / current, max_gain))
+
+
+def preprocess(audio: np.ndarray, sample_rate: int, threshold: float = 0.02) -> np.ndarray:
+    """Trim surrounding silence and normalize a float32 recording for transcription."""
+    return normalize(trim_silence(audio, sample_rate, threshold))
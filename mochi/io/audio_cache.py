@@ -0,0 +1,73 @@
+"""Disk-backed cache of pre-rendered speech for fixed coach phrases."""
+
+import hashlib
+import wave
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class PhraseAudioCache:
+    """Rendered audio for known phrases, keyed by (text, voice, rate).
+
+    Clips are rendered once with pyttsx3's ``save_to_file`` into ``cache_dir``
+    and loaded into memory, so speaking a cached phrase is a playback call
+    with no synthesis. Changing the voice or rate simply misses the old files.
+    """
+
+    def __init__(self, cache_dir: Path, voice: str, rate: int):
+        self.cache_dir = cache_dir.expanduser()
+        self.voice = voice
+        self.rate = rate
+        self._clips: Dict[str, Tuple[np.ndarray, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._clips)
+
+    def path_for(self, text: str) -> Path:
+        digest = hashlib.sha256(f"{self.voice}\0{self.rate}\0{text}".encode()).hexdigest()
+        return self.cache_dir / f"{digest[:32]}.wav"
+
+    def get(self, text: str) -> Optional[Tuple[np.ndarray, int]]:
+        """Return (samples, sample_rate) for a cached phrase, or None."""
+        return self._clips.get(text)
+
+    def load(self, phrases: Iterable[str]):
+        """Read whatever phrases are already on disk into memory."""
+        for text in phrases:
+            path = self.path_for(text)
+            if text not in self._clips and path.exists():
+                clip = _read_wav(path)
+                if clip is not None:
+                    self._clips[text] = clip
+
+    def render(self, engine, phrases: Iterable[str]) -> int:
+        """Render missing phrases with a pyttsx3 engine and load them.
+
+        The engine must already be set to this cache's voice and rate.
+        Returns the number of phrases rendered.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        missing: List[str] = [text for text in dict.fromkeys(phrases) if not self.path_for(text).exists()]
+        for text in missing:
+            engine.save_to_file(text, str(self.path_for(text)))
+        if missing:
+            engine.runAndWait()
+        self.load(missing)
+        return len(missing)
+
+
+def _read_wav(path: Path) -> Optional[Tuple[np.ndarray, int]]:
+    """Load a PCM WAV as float32, or None if the driver wrote another format (e.g. AIFF)."""
+    try:
+        with wave.open(str(path), "rb") as f:
+            rate, channels, width = f.getframerate(), f.getnchannels(), f.getsampwidth()
+            raw = f.readframes(f.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    if width != 2:
+        return None
+    audio = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    return audio.reshape(-1, channels), rate
@@ -1,30 +1,152 @@
-"""Speech-to-text using Whisper."""
+"""Speech-to-text using Whisper (see stt_backends for the available engines)."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Optional
 
-import whisper
 import sounddevice as sd
 import numpy as np
-from pathlib import Path
-import tempfile
-import wave
 from rich.console import Console
+from rich.live import Live
+from rich.text import Text
+
+from mochi.core.tracing import span
+from mochi.io.audio import AudioRingBuffer, VoiceActivityDetector, normalize, preprocess
+from mochi.io.stt_backends import STTBackend, load_backend_async
+
+
+def warmup(engine: str = "whisper", model_size: str = "base", compute_type: str = "int8"):
+    """Download the model if needed and run one inference so later calls start hot."""
+    load_backend_async(engine, model_size, compute_type).result().warmup()
+
+
+class StreamingTranscriber:
+    """Transcribe a growing recording in overlapping windows while it is captured.
+
+    Each decode covers only the audio after the last committed point. Segments
+    that end well before the end of that window are committed, and the rest is
+    re-decoded next time with more context. When the speaker stops, only the
+    short uncommitted tail needs a final decode.
+    """
+
+    def __init__(
+        self,
+        backend: STTBackend,
+        sample_rate: int = 16000,
+        step_sec: float = 1.0,
+        commit_margin_sec: float = 1.0,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Args:
+            backend: Loaded speech-to-text backend
+            sample_rate: Sample rate of the audio passed to update()
+            step_sec: Decode again after this much new audio
+            commit_margin_sec: Only commit segments ending this far before the window end
+            on_partial: Called from the decode thread with each partial hypothesis
+        """
+        self.backend = backend
+        self.sample_rate = sample_rate
+        self.step_samples = int(step_sec * sample_rate)
+        self.commit_margin_sec = commit_margin_sec
+        self.on_partial = on_partial
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mochi-stt")
+        self._pending: Optional[Future] = None
+        self._lock = threading.Lock()
+        self._committed_text = ""
+        self._committed_samples = 0
+        self._last_decoded_len = 0
+
+    def due(self, num_samples: int) -> bool:
+        """Whether enough new audio has arrived and the decode thread is idle."""
+        if num_samples - self._last_decoded_len < self.step_samples:
+            return False
+        return self._pending is None or self._pending.done()
+
+    def update(self, audio: np.ndarray):
+        """Start a background decode of the recording so far if one is due.
+
+        Takes ownership of ``audio``; pass a copy if the caller keeps writing to it.
+        """
+        if not self.due(len(audio)):
+            return
+
+        self._last_decoded_len = len(audio)
+        self._pending = self._executor.submit(self._decode, audio, False)
+
+    def finish(self, audio: np.ndarray) -> str:
+        """Decode whatever hasn't been committed yet and return the full transcript."""
+        if self._pending is not None:
+            self._pending.result()
+        self._decode(audio, True)
+        self._executor.shutdown(wait=False)
+        return self._committed_text.strip()
+
+    def _decode(self, audio: np.ndarray, final: bool):
+        with self._lock:
+            window = audio[self._committed_samples:].flatten()
+            if len(window) < self.sample_rate * 0.3:
+                return
+
+            segments = self.backend.transcribe(
+                window.astype(np.float32, copy=False),
+                initial_prompt=self._committed_text[-200:] or None,
+            )
+
+            if final:
+                self._committed_text += "".join(s.text for s in segments)
+                return
+
+            # Keep the last segment open; it may still change as more audio arrives
+            horizon = len(window) / self.sample_rate - self.commit_margin_sec
+            stable = [s for s in segments[:-1] if s.end <= horizon]
+            if stable:
+                self._committed_text += "".join(s.text for s in stable)
+                self._committed_samples += int(stable[-1].end * self.sample_rate)
+
+            if self.on_partial:
+                pending = "".join(s.text for s in segments[len(stable):])
+                self.on_partial((self._committed_text + pending).strip())
 
 
 class SpeechToText:
-    """Convert speech to text using OpenAI Whisper."""
+    """Convert speech to text using a Whisper backend."""
 
-    def __init__(self, model_size: str = "base"):
+    def __init__(self, engine: str = "whisper", model_size: str = "base", compute_type: str = "int8"):
         """
-        Initialize Whisper model.
+        Start loading the speech-to-text backend in the background.
+
+        The backend is shared process-wide and only waited for on first use,
+        so the session can start while it loads.
 
         Args:
+            engine: "whisper", "whisper-int8" or "faster-whisper"
             model_size: Model size - "tiny", "base", "small", "medium", "large"
                        "base" is good balance of speed/accuracy
+            compute_type: Weight precision for faster-whisper ("int8", "float32", ...)
         """
         self.console = Console()
-        self.console.print(f"[dim]Loading Whisper {model_size} model...[/dim]")
-        self.model = whisper.load_model(model_size)
+        self.engine = engine
+        self.model_size = model_size
+        self._backend = load_backend_async(engine, model_size, compute_type)
         self.sample_rate = 16000
-        self.console.print("[dim]✓ Whisper ready[/dim]")
+
+    @property
+    def backend(self) -> STTBackend:
+        """The loaded backend, waiting for the background load if needed."""
+        if not self._backend.done():
+            with self.console.status(f"[dim]Loading {self.engine} {self.model_size} model...[/dim]"):
+                return self._backend.result()
+        return self._backend.result()
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        """Transcribe an in-memory float32 recording (no temp files, no ffmpeg)."""
+        audio = audio.flatten().astype(np.float32, copy=False)
+        if len(audio) == 0:
+            return ""
+        return "".join(s.text for s in self.backend.transcribe(audio)).strip()
 
     def listen(self, duration: float = 10.0, silence_threshold: float = 0.02) -> str:
         """
@@ -51,21 +173,12 @@ class SpeechToText:
             # Wait for recording (but allow interrupt)
             sd.wait()
 
-            # Detect actual speech end (simple energy-based)
-            recording = self._trim_silence(recording, silence_threshold)
-
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                temp_path = Path(f.name)
-                self._save_wav(temp_path, recording)
+            # Drop the silence around the speech
+            recording = preprocess(recording, self.sample_rate, silence_threshold)
 
             # Transcribe
             self.console.print("[dim]Transcribing...[/dim]")
-            result = self.model.transcribe(str(temp_path), fp16=False)
-            text = result["text"].strip()
-
-            # Cleanup
-            temp_path.unlink()
+            text = self.transcribe(recording)
 
             if text:
                 self.console.print(f"[dim]You said:[/dim] {text}")
@@ -82,15 +195,10 @@ class SpeechToText:
             recording = recording[:sd.get_stream().write_available]
 
             if len(recording) > 0:
-                recording = self._trim_silence(recording, silence_threshold)
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                    temp_path = Path(f.name)
-                    self._save_wav(temp_path, recording)
+                recording = preprocess(recording, self.sample_rate, silence_threshold)
 
                 self.console.print("[dim]Transcribing...[/dim]")
-                result = self.model.transcribe(str(temp_path), fp16=False)
-                text = result["text"].strip()
-                temp_path.unlink()
+                text = self.transcribe(recording)
 
                 if text:
                     self.console.print(f"[dim]You said:[/dim] {text}")
@@ -98,90 +206,91 @@ class SpeechToText:
 
             return ""
 
-    def _trim_silence(self, audio: np.ndarray, threshold: float) -> np.ndarray:
-        """Trim silence from end of audio."""
-        # Find where audio drops below threshold for extended period
-        energy = np.abs(audio).flatten()
-
-        # Find last point above threshold
-        for i in range(len(energy) - 1, 0, -1):
-            if energy[i] > threshold:
-                return audio[:i + self.sample_rate]  # Keep 1 second after last sound
-
-        return audio
-
-    def _save_wav(self, path: Path, audio: np.ndarray):
-        """Save audio as WAV file."""
-        # Convert to int16
-        audio_int16 = (audio * 32767).astype(np.int16)
-
-        with wave.open(str(path), 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)  # 2 bytes for int16
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_int16.tobytes())
-
-    def quick_listen(self, max_silence_sec: float = 2.0) -> str:
+    def quick_listen(
+        self,
+        max_silence_sec: float = 2.0,
+        on_speech_start: Optional[Callable[[], None]] = None,
+    ) -> str:
         """
         Listen and auto-stop after silence.
 
+        Audio is captured by a single input stream into a preallocated ring
+        buffer, and a frame-level VAD with an adaptive noise floor decides when
+        the candidate has stopped. Transcription runs in overlapping windows
+        while they speak, with the partial hypothesis shown live, so the final
+        text is ready shortly after the silence is detected.
+
         Args:
             max_silence_sec: Stop after this many seconds of silence
+            on_speech_start: Called once when the VAD first detects speech,
+                             e.g. to stop the coach talking (barge-in)
 
         Returns:
             Transcribed text
         """
         self.console.print("\n[bold cyan]🎤 Listening... (speak now)[/bold cyan]")
 
-        silence_threshold = 0.02
-        chunk_duration = 0.5  # Check for silence every 0.5 seconds
         max_duration = 30.0  # Absolute maximum
+        poll_sec = 0.05
+        preroll = int(0.3 * self.sample_rate)  # Keep the onset of the first word
+        tail = int(0.3 * self.sample_rate)     # Keep the decay of the last word
 
-        chunks = []
-        silence_chunks = 0
-        max_silence_chunks = int(max_silence_sec / chunk_duration)
+        vad = VoiceActivityDetector(self.sample_rate)
+        ring = AudioRingBuffer(int((max_duration + 1) * self.sample_rate))
+        processed = 0
+
+        def on_audio(indata, frames, time_info, status):
+            ring.write(indata[:, 0])
+
+        live = Live(Text(""), console=self.console, transient=True, refresh_per_second=8)
+        transcriber = StreamingTranscriber(
+            self.backend,
+            sample_rate=self.sample_rate,
+            on_partial=lambda text: live.update(Text(f"… {text}", style="dim")),
+        )
 
         try:
-            for _ in range(int(max_duration / chunk_duration)):
-                chunk = sd.rec(
-                    int(chunk_duration * self.sample_rate),
+            with live:
+                with sd.InputStream(
                     samplerate=self.sample_rate,
                     channels=1,
-                    dtype=np.float32
-                )
-                sd.wait()
-
-                chunks.append(chunk)
-
-                # Check if chunk is silence
-                if np.max(np.abs(chunk)) < silence_threshold:
-                    silence_chunks += 1
-                    if silence_chunks >= max_silence_chunks:
-                        self.console.print("[dim]Silence detected, processing...[/dim]")
-                        break
-                else:
-                    silence_chunks = 0
-
-            # Combine all chunks
-            if chunks:
-                recording = np.concatenate(chunks)
-                recording = self._trim_silence(recording, silence_threshold)
-
-                # Transcribe
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                    temp_path = Path(f.name)
-                    self._save_wav(temp_path, recording)
-
-                result = self.model.transcribe(str(temp_path), fp16=False)
-                text = result["text"].strip()
-                temp_path.unlink()
+                    dtype=np.float32,
+                    blocksize=vad.frame_samples,
+                    callback=on_audio,
+                ):
+                    while ring.written < max_duration * self.sample_rate:
+                        time.sleep(poll_sec)
+
+                        ready = (ring.written - processed) // vad.frame_samples * vad.frame_samples
+                        if ready:
+                            vad.process(ring.read(processed, processed + ready))
+                            processed += ready
+
+                        if not vad.in_speech:
+                            continue
+                        if on_speech_start is not None:
+                            on_speech_start()
+                            on_speech_start = None
+                        if vad.silence_sec >= max_silence_sec:
+                            self.console.print("[dim]Silence detected, processing...[/dim]")
+                            break
+
+                        start = max(vad.speech_start - preroll, 0)
+                        if transcriber.due(processed - start):
+                            transcriber.update(ring.read(start, processed))
+
+                if not vad.in_speech:
+                    return ""
+                start = max(vad.speech_start - preroll, 0)
+                audio = normalize(ring.read(start, vad.speech_end + tail))
+                with span("stt.transcribe", audio_s=len(audio) / self.sample_rate):
+                    text = transcriber.finish(audio)
 
-                if text:
-                    self.console.print(f"[dim]You said:[/dim] {text}")
-                    return text
+            if text:
+                self.console.print(f"[dim]You said:[/dim] {text}")
+                return text
 
             return ""
 
         except KeyboardInterrupt:
-            sd.stop()
             return ""
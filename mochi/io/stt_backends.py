@@ -0,0 +1,147 @@
+"""Speech-to-text engines behind a common interface.
+
+Every backend takes 16 kHz mono float32 audio and returns timed segments, so
+the streaming transcriber and benchmarks don't care which engine is loaded.
+Engine packages are imported lazily; only the one selected in settings.toml
+needs to be installed.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class Segment(NamedTuple):
+    start: float
+    end: float
+    text: str
+
+
+class STTBackend:
+    """Base class for speech-to-text engines."""
+
+    name = "base"
+
+    def __init__(self, model_size: str = "base", compute_type: str = "int8"):
+        self.model_size = model_size
+        self.compute_type = compute_type
+
+    def transcribe(self, audio: np.ndarray, initial_prompt: Optional[str] = None) -> List[Segment]:
+        """Transcribe 16 kHz mono float32 audio into timed segments."""
+        raise NotImplementedError
+
+    def warmup(self):
+        """Run one inference so kernels and caches are initialized."""
+        self.transcribe(np.zeros(16000, dtype=np.float32))
+
+
+class WhisperBackend(STTBackend):
+    """openai-whisper on torch, in fp32 on CPU and fp16 on GPU."""
+
+    name = "whisper"
+
+    def __init__(self, model_size: str = "base", compute_type: str = "int8"):
+        super().__init__(model_size, compute_type)
+        import whisper
+        self.model = whisper.load_model(model_size)
+        self.fp16 = self.model.device.type == "cuda"
+
+    def transcribe(self, audio: np.ndarray, initial_prompt: Optional[str] = None) -> List[Segment]:
+        result = self.model.transcribe(
+            audio,
+            fp16=self.fp16,
+            condition_on_previous_text=False,
+            initial_prompt=initial_prompt,
+        )
+        return [Segment(s["start"], s["end"], s["text"]) for s in result.get("segments", [])]
+
+
+class QuantizedWhisperBackend(WhisperBackend):
+    """openai-whisper with its Linear layers dynamically quantized to int8 (CPU only)."""
+
+    name = "whisper-int8"
+
+    def __init__(self, model_size: str = "base", compute_type: str = "int8"):
+        STTBackend.__init__(self, model_size, compute_type)
+        import torch
+        import whisper
+
+        model = whisper.load_model(model_size, device="cpu")
+        # Whisper subclasses nn.Linear only to cast dtypes, which is a no-op in
+        # fp32; quantize_dynamic matches exact types, so present them as nn.Linear
+        for module in model.modules():
+            if isinstance(module, torch.nn.Linear):
+                module.__class__ = torch.nn.Linear
+        self.model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.fp16 = False
+
+
+class FasterWhisperBackend(STTBackend):
+    """CTranslate2 Whisper via faster-whisper, int8 by default."""
+
+    name = "faster-whisper"
+
+    def __init__(self, model_size: str = "base", compute_type: str = "int8"):
+        super().__init__(model_size, compute_type)
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise ImportError(
+                "The faster-whisper engine needs the faster-whisper package: "
+                "pip install 'mochi[faster-whisper]'"
+            )
+        self.model = WhisperModel(model_size, device="auto", compute_type=compute_type)
+
+    def transcribe(self, audio: np.ndarray, initial_prompt: Optional[str] = None) -> List[Segment]:
+        segments, _ = self.model.transcribe(
+            audio,
+            beam_size=1,
+            condition_on_previous_text=False,
+            initial_prompt=initial_prompt,
+        )
+        return [Segment(s.start, s.end, s.text) for s in segments]
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (WhisperBackend, QuantizedWhisperBackend, FasterWhisperBackend)
+}
+
+# Backends shared by everything in the process, keyed by (engine, model size, compute type)
+_backends: Dict[Tuple[str, str, str], Future] = {}
+_backends_lock = threading.Lock()
+
+
+def load_backend_async(engine: str = "whisper", model_size: str = "base", compute_type: str = "int8") -> Future:
+    """Start loading a backend on a background thread, once per process.
+
+    Returns a future for the backend. Later calls with the same settings
+    share it; a failed load is retried on the next call.
+    """
+    if engine not in BACKENDS:
+        raise ValueError(f"Unknown STT engine: {engine} (choose from {', '.join(BACKENDS)})")
+
+    key = (engine, model_size, compute_type)
+    with _backends_lock:
+        future = _backends.get(key)
+        if future is None or (future.done() and future.exception() is not None):
+            future = Future()
+            threading.Thread(
+                target=_load_backend,
+                args=(key, future),
+                name=f"mochi-stt-{engine}-{model_size}",
+                daemon=True,
+            ).start()
+            _backends[key] = future
+        return future
+
+
+def _load_backend(key: Tuple[str, str, str], future: Future):
+    engine, model_size, compute_type = key
+    try:
+        # Engine imports happen here so torch/ctranslate2 load off the main thread
+        future.set_result(BACKENDS[engine](model_size, compute_type))
+    except BaseException as e:
+        future.set_exception(e)
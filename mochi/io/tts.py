@@ -1,35 +1,120 @@
 """Text-to-speech for coach responses."""
 
+import queue
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
 import pyttsx3
 from rich.console import Console
-from mochi.io.utils import strip_markdown
+from mochi.core.tracing import span
+from mochi.io.audio_cache import PhraseAudioCache
+from mochi.io.utils import SentenceSplitter, strip_markdown
+
+
+def _sentences(text: str) -> List[str]:
+    """Split text into the units the TTS queue speaks one at a time."""
+    splitter = SentenceSplitter()
+    sentences = splitter.feed(text)
+    rest = splitter.flush()
+    if rest:
+        sentences.append(rest)
+    return sentences
 
 
 class TextToSpeech:
-    """Convert text to speech."""
+    """Convert text to speech.
+
+    All speech goes through a sentence queue drained by one worker thread,
+    so callers never block while the coach talks. ``cancel`` stops the
+    current sentence and drops the rest, for when the candidate barges in.
+    Sentences found in the phrase audio cache are played from memory
+    instead of being synthesized.
+
+    pyttsx3 engines are not thread-safe (SAPI5 binds its COM objects to the
+    creating thread), so the worker creates the engine and is the only
+    thread that touches it; other methods post work to its queue.
+    """
 
-    def __init__(self, rate: int = 180, voice_id: int = 0):
+    def __init__(
+        self,
+        rate: int = 180,
+        voice_id: int = 0,
+        cache_dir: Optional[Path] = None,
+        phrases: Iterable[str] = (),
+    ):
         """
         Initialize TTS engine.
 
         Args:
             rate: Speaking rate in words per minute (default 180)
             voice_id: Voice index (0 for first available voice)
+            cache_dir: Directory of pre-rendered phrase audio (None = no cache)
+            phrases: Fixed phrases to load from the cache
         """
         self.console = Console()
-        self.engine = pyttsx3.init()
+        self.engine = None  # Created and used only on the worker thread
 
-        # Set properties
-        self.engine.setProperty('rate', rate)
+        # Work queue drained by the worker: queued sentences and engine calls.
+        # Each sentence carries the generation it was queued in; cancel()
+        # bumps the generation so anything older is skipped, and sets
+        # _interrupt so the worker stops the sentence it is playing.
+        self._queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._generation = 0
+        self._interrupt = threading.Event()
+        self._pending = 0  # Sentences queued or playing
+        self._pending_lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._worker = threading.Thread(target=self._drain_queue, name="mochi-tts", daemon=True)
+        self._worker.start()
+
+        voice = self._on_engine(self._init_engine, rate, voice_id)
 
-        # Set voice
+        self.audio_cache: Optional[PhraseAudioCache] = None
+        self._phrases = list(phrases)
+        if cache_dir is not None:
+            self.audio_cache = PhraseAudioCache(cache_dir, voice, rate)
+            self.audio_cache.load(self._cache_keys(self._phrases))
+
+    def _init_engine(self, rate: int, voice_id: int) -> str:
+        self.engine = pyttsx3.init()
+        self.engine.setProperty('rate', rate)
         voices = self.engine.getProperty('voices')
         if voices and voice_id < len(voices):
             self.engine.setProperty('voice', voices[voice_id].id)
+        # Stop mid-sentence on cancel(); word callbacks run on this thread
+        self.engine.connect('started-word', self._on_word)
+        return str(self.engine.getProperty('voice'))
+
+    def _on_word(self, name, location, length):
+        if self._interrupt.is_set():
+            self.engine.stop()
+
+    def _on_engine(self, fn: Callable, *args):
+        """Run ``fn`` on the worker thread, after anything already queued, and return its result."""
+        future: Future = Future()
+
+        def call():
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        self._queue.put(call)
+        return future.result()
+
+    @property
+    def speaking(self) -> bool:
+        """Whether anything is being spoken or waiting to be spoken."""
+        return not self._idle.is_set()
 
     def speak(self, text: str):
         """
-        Speak the given text.
+        Speak the given text in the background, one sentence at a time.
+
+        Returns as soon as the sentences are queued; the first one starts
+        playing while the rest wait.
 
         Args:
             text: Text to speak (will be cleaned of markdown)
@@ -37,25 +122,125 @@ class TextToSpeech:
         if not text:
             return
 
-        # Strip markdown formatting for clean speech
+        self.console.print(f"[dim]🔊 Coach speaking...[/dim]")
+        for sentence in _sentences(text):
+            self.enqueue(sentence)
+
+    def prerender(self, phrases: Iterable[str]) -> int:
+        """
+        Render fixed phrases into the audio cache so they play instantly.
+
+        Call before any speech is queued; it uses the same engine. Returns
+        the number of clips rendered (already cached ones are skipped).
+        """
+        if self.audio_cache is None:
+            return 0
+        keys = self._cache_keys(phrases)
+        return self._on_engine(lambda: self.audio_cache.render(self.engine, keys))
+
+    @staticmethod
+    def _cache_keys(phrases: Iterable[str]) -> List[str]:
+        """Cached clips are per sentence, matching what the queue speaks."""
+        return [strip_markdown(sentence) for phrase in phrases for sentence in _sentences(phrase)]
+
+    def enqueue(self, text: str):
+        """
+        Queue text to be spoken in the background, in order.
+
+        Lets the first sentence of a streamed response play while later
+        sentences are still being generated.
+
+        Args:
+            text: Text to speak (will be cleaned of markdown)
+        """
         clean_text = strip_markdown(text)
+        if not clean_text:
+            return
 
-        self.console.print(f"[dim]🔊 Coach speaking...[/dim]")
+        with self._pending_lock:
+            self._pending += 1
+            self._idle.clear()
+        generation = self._generation
+        self._queue.put(lambda: self._speak_queued(generation, clean_text))
+
+    def wait(self):
+        """Block until everything queued has been spoken (or cancelled)."""
+        self._idle.wait()
 
+    def cancel(self):
+        """Stop the current sentence and drop everything queued (barge-in).
+
+        Only signals the worker, which stops its own playback.
+        """
+        self._generation += 1
+        self._interrupt.set()
+
+    def _drain_queue(self):
+        while True:
+            self._queue.get()()
+
+    def _speak_queued(self, generation: int, text: str):
         try:
-            self.engine.say(clean_text)
-            self.engine.runAndWait()
+            # Clear before checking the generation so a cancel() in between is still seen
+            self._interrupt.clear()
+            if generation == self._generation:
+                self._say(text)
+        finally:
+            with self._pending_lock:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.set()
+
+    def _say(self, clean_text: str):
+        clip = self.audio_cache.get(clean_text) if self.audio_cache is not None else None
+        if clip is not None:
+            with span("tts.say", chars=len(clean_text), cached=True):
+                self._play(*clip)
+            return
+
+        try:
+            with span("tts.say", chars=len(clean_text), cached=False):
+                self.engine.say(clean_text)
+                self.engine.runAndWait()
         except Exception as e:
             self.console.print(f"[yellow]TTS error: {e}[/yellow]")
             # Fall back to just showing text
             pass
 
+    def _play(self, samples, sample_rate: int):
+        try:
+            import sounddevice as sd
+            sd.play(samples, sample_rate)
+            if self._interrupt.wait(len(samples) / sample_rate):
+                sd.stop()
+            else:
+                sd.wait()
+        except Exception as e:
+            self.console.print(f"[yellow]TTS playback error: {e}[/yellow]")
+
     def set_rate(self, rate: int):
         """Set speaking rate."""
-        self.engine.setProperty('rate', rate)
+        self._on_engine(lambda: self.engine.setProperty('rate', rate))
+        self._reload_cache()
 
     def set_voice(self, voice_id: int):
         """Set voice by index."""
-        voices = self.engine.getProperty('voices')
-        if voices and voice_id < len(voices):
-            self.engine.setProperty('voice', voices[voice_id].id)
+        def select() -> bool:
+            voices = self.engine.getProperty('voices')
+            if voices and voice_id < len(voices):
+                self.engine.setProperty('voice', voices[voice_id].id)
+                return True
+            return False
+
+        if self._on_engine(select):
+            self._reload_cache()
+
+    def _reload_cache(self):
+        """Clips are keyed by voice and rate, so switch to the matching set."""
+        if self.audio_cache is None:
+            return
+        voice, rate = self._on_engine(
+            lambda: (str(self.engine.getProperty('voice')), self.engine.getProperty('rate'))
+        )
+        self.audio_cache = PhraseAudioCache(self.audio_cache.cache_dir, voice, rate)
+        self.audio_cache.load(self._cache_keys(self._phrases))
@@ -1,47 +1,116 @@
 """Utilities for voice I/O."""
 
 import re
+import unicodedata
+from typing import List
+
+# End of a sentence: terminal punctuation (plus closing quotes/brackets) followed
+# by whitespace, or a paragraph break
+_SENTENCE_BOUNDARY = re.compile(r'[.!?]+["\')\]]*\s+|\n{2,}')
+
+
+# One pass over the text: each alternative is a markdown construct and
+# _speak_markdown decides what it becomes. Earlier alternatives win when two
+# could start at the same position. Every alternative begins with a literal
+# character (line-start and word-boundary checks come after it), which lets
+# the regex engine skip ahead to the next ` * _ [ or # instead of trying
+# each alternative at every position.
+_MARKDOWN = re.compile(
+    r"(?P<block>```[^\n]*\n.*?```)"              # fenced code block
+    r"|`(?P<code>[^`]+)`"                         # inline code
+    r"|\*\*(?P<bold>[^*]+)\*\*"                   # **bold**
+    r"|\*(?P<italic>[^*]+)\*"                     # *italic*
+    r"|__(?P<ubold>[^_]+)__"                      # __bold__
+    r"|_(?<!\w_)(?P<uitalic>[^_]+)_(?!\w)"        # _italic_ (not snake_case)
+    r"|\[(?P<link>[^\]]+)\]\([^)]+\)"             # [text](url)
+    r"|#(?<![^\n]#)(?P<header>#{0,5})\s+",        # ## Header at line start
+    re.DOTALL,
+)
+
+# Characters deleted before speaking: pictographs, dingbats and other symbols
+# (✅, ❌, 🎯, 🔊, ...) plus the joiners and variation selectors used in emoji.
+# Only runs of non-ASCII text are translated; ASCII never needs it.
+_SYMBOL_RANGES = [(0x2190, 0x2BFF), (0x1F000, 0x1FAFF)]
+_UNSPOKEN = str.maketrans(
+    {
+        **{
+            chr(cp): None
+            for start, end in _SYMBOL_RANGES
+            for cp in range(start, end + 1)
+            if unicodedata.category(chr(cp)) == "So"
+        },
+        "\u200d": None,  # zero-width joiner
+        "\ufe0f": None,  # emoji variation selector
+    }
+)
+_NON_ASCII = re.compile(r"[^\x00-\x7f]+")
+
+
+def _drop_symbols(match: re.Match) -> str:
+    return match.group().translate(_UNSPOKEN)
+
+
+def _speak_markdown(match: re.Match) -> str:
+    kind = match.lastgroup
+    if kind == "block":
+        return "[code block]"
+    if kind == "header":
+        return ""
+    # Emphasis and link text can contain other inline markup
+    return _MARKDOWN.sub(_speak_markdown, match.group(kind))
 
 
 def strip_markdown(text: str) -> str:
     """
     Remove markdown formatting for clean TTS output.
 
+    Symbols are dropped with a translate table, a single compiled pass
+    rewrites code, emphasis, links and headers, and whitespace is collapsed.
+    Used for both the CLI voice and the web client's speech text.
+
     Args:
         text: Text with potential markdown formatting
 
     Returns:
         Plain text suitable for speech
     """
-    # Remove bold/italic (**text**, *text*, __text__, _text_)
-    text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)  # **bold**
-    text = re.sub(r'\*([^\*]+)\*', r'\1', text)      # *italic*
-    text = re.sub(r'__([^_]+)__', r'\1', text)       # __bold__
-    text = re.sub(r'_([^_]+)_', r'\1', text)         # _italic_
-
-    # Remove code blocks (```code```)
-    text = re.sub(r'```[^\n]*\n.*?```', '[code block]', text, flags=re.DOTALL)
-
-    # Remove inline code (`code`)
-    text = re.sub(r'`([^`]+)`', r'\1', text)
-
-    # Remove links [text](url)
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-
-    # Remove headers (##, ###, etc.)
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-
-    # Remove special symbols
-    text = text.replace('✅', '')
-    text = text.replace('❌', '')
-    text = text.replace('🎯', '')
-    text = text.replace('🔊', '')
-    text = text.replace('🎤', '')
-    text = text.replace('⌨️', '')
-    text = text.replace('🔄', '')
-
-    # Clean up extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-
-    return text
+    if not text.isascii():
+        text = _NON_ASCII.sub(_drop_symbols, text)
+    text = _MARKDOWN.sub(_speak_markdown, text)
+    return " ".join(text.split())
+
+
+class SentenceSplitter:
+    """Accumulate streamed text and hand back sentences as they complete."""
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, text: str) -> List[str]:
+        """
+        Add streamed text.
+
+        Args:
+            text: Next chunk of streamed text
+
+        Returns:
+            Sentences completed by this chunk, in order
+        """
+        self._buffer += text
+        sentences = []
+
+        while True:
+            match = _SENTENCE_BOUNDARY.search(self._buffer)
+            if not match:
+                break
+            sentence = self._buffer[:match.end()].strip()
+            self._buffer = self._buffer[match.end():]
+            if sentence:
+                sentences.append(sentence)
+
+        return sentences
+
+    def flush(self) -> str:
+        """Return whatever text is left once the stream has ended."""
+        rest, self._buffer = self._buffer.strip(), ""
+        return rest
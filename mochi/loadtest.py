@@ -0,0 +1,234 @@
+"""Concurrent WebSocket session generator for load-testing ``mochi web``.
+
+Each simulated client opens ``/ws/interview`` and plays a script of
+``start`` / ``user_message`` / ``review_code`` / ``hint`` / ``finish`` steps,
+pausing between steps for a sampled think time, and measures how long each
+step takes to get its coach reply. The server's ``/stats`` endpoint is polled
+throughout to track its memory over time.
+
+Point it at a server using the "mock" LLM engine (or ``[llm] base_url`` at
+``mochi mock-llm``) to measure the server itself without API costs.
+"""
+
+import asyncio
+import json
+import random
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import yaml
+
+PROBLEM = (
+    "Given an array of integers nums and an integer target, return indices of the two numbers "
+    "such that they add up to target. You may assume that each input has exactly one solution."
+)
+
+CODE = """def two_sum(nums, target):
+    for i in range(len(nums)):
+        for j in range(i + 1, len(nums)):
+            if nums[i] + nums[j] == target:
+                return [i, j]
+"""
+
+DEFAULT_SCRIPT: List[Dict[str, Any]] = [
+    {"type": "start", "problem": PROBLEM},
+    {"type": "user_message", "text": "So I need to find two numbers that add up to the target, and return their indices?"},
+    {"type": "user_message", "text": "My first approach would be to check every pair with two loops."},
+    {"type": "user_message", "text": "Okay, I'll write the brute force version first and then improve it."},
+    {"type": "review_code", "code": CODE},
+    {"type": "hint"},
+    {"type": "user_message", "text": "I could remember the numbers I've seen so far so each lookup is fast."},
+    {"type": "finish"},
+]
+
+
+@dataclass
+class ThinkTime:
+    """Pause between steps: lognormal around ``mean_s`` (or fixed when ``jitter`` is 0)."""
+    mean_s: float = 2.0
+    jitter: float = 0.5  # Sigma of the underlying normal
+
+    def sample(self, rng: random.Random) -> float:
+        if self.mean_s <= 0:
+            return 0.0
+        if self.jitter <= 0:
+            return self.mean_s
+        # Scale so the distribution's mean (not its median) is mean_s
+        return self.mean_s * rng.lognormvariate(-self.jitter ** 2 / 2, self.jitter)
+
+
+@dataclass
+class LoadStats:
+    latencies: Dict[str, List[float]] = field(default_factory=dict)  # Seconds, by step type
+    errors: Dict[str, int] = field(default_factory=dict)
+    sessions_completed: int = 0
+    memory: List[Dict[str, Any]] = field(default_factory=list)  # Samples from /stats
+
+    def record(self, step: str, seconds: float):
+        self.latencies.setdefault(step, []).append(seconds)
+
+    def error(self, kind: str):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    @property
+    def requests(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+
+
+def load_script(path: Optional[Path]) -> List[Dict[str, Any]]:
+    """A YAML list of steps (the same messages the browser sends), or the built-in interview."""
+    if path is None:
+        return DEFAULT_SCRIPT
+    with open(path) as f:
+        script = yaml.safe_load(f) or []
+    if not script or script[0].get("type") != "start":
+        raise ValueError("A load-test script must begin with a 'start' step")
+    return script
+
+
+async def run_client(
+    url: str,
+    script: List[Dict[str, Any]],
+    think: ThinkTime,
+    deadline: float,
+    stats: LoadStats,
+    rng: random.Random,
+    timeout_s: float,
+):
+    """Play the script over one connection until the deadline, one interview after another."""
+    import websockets
+
+    while time.monotonic() < deadline:
+        try:
+            async with websockets.connect(url, max_size=None, open_timeout=timeout_s) as ws:
+                for step in script:
+                    if time.monotonic() >= deadline:
+                        return
+                    start = time.perf_counter()
+                    await ws.send(json.dumps(step))
+                    reply = await asyncio.wait_for(_coach_reply(ws), timeout_s)
+                    if reply.get("type") == "error":
+                        stats.error(f"{step['type']}: {reply.get('message', 'error')}")
+                    else:
+                        stats.record(step["type"], time.perf_counter() - start)
+                    await asyncio.sleep(think.sample(rng))
+                stats.sessions_completed += 1
+        except asyncio.TimeoutError:
+            stats.error("timeout")
+        except Exception as e:  # Connection refused/reset, protocol errors
+            stats.error(type(e).__name__)
+            await asyncio.sleep(1.0)
+
+
+async def _coach_reply(ws) -> Dict[str, Any]:
+    """Wait for the coach's reply (or an error), skipping session bookkeeping messages."""
+    while True:
+        message = json.loads(await ws.recv())
+        if message.get("type") in ("coach", "error"):
+            return message
+
+
+def fetch_stats(stats_url: str) -> Optional[Dict[str, Any]]:
+    try:
+        with urllib.request.urlopen(stats_url, timeout=5) as response:
+            return json.loads(response.read())
+    except (OSError, ValueError):
+        return None
+
+
+async def sample_memory(stats_url: str, interval_s: float, stats: LoadStats, started: float, stop: asyncio.Event):
+    while not stop.is_set():
+        sample = await asyncio.to_thread(fetch_stats, stats_url)
+        if sample is not None:
+            stats.memory.append({
+                "t": round(time.monotonic() - started, 2),
+                "pid": sample.get("pid"),
+                "rss_bytes": sample.get("rss_bytes"),
+                "sessions": sample.get("sessions"),
+            })
+        try:
+            await asyncio.wait_for(stop.wait(), interval_s)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_load(
+    url: str,
+    clients: int,
+    duration_s: float,
+    ramp_s: float = 10.0,
+    think: Optional[ThinkTime] = None,
+    script: Optional[List[Dict[str, Any]]] = None,
+    timeout_s: float = 60.0,
+    memory_interval_s: float = 2.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Run ``clients`` concurrent sessions for ``duration_s`` and summarize them."""
+    think = think or ThinkTime()
+    script = script or DEFAULT_SCRIPT
+    stats = LoadStats()
+    started = time.monotonic()
+    deadline = started + duration_s
+    stats_url = url.replace("ws://", "http://").replace("wss://", "https://").rsplit("/ws/", 1)[0] + "/stats"
+
+    async def delayed_client(i: int):
+        await asyncio.sleep(ramp_s * i / max(clients, 1))
+        await run_client(url, script, think, deadline, stats, random.Random(seed * 100_003 + i), timeout_s)
+
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_memory(stats_url, memory_interval_s, stats, started, stop))
+    await asyncio.gather(*(delayed_client(i) for i in range(clients)))
+    elapsed = time.monotonic() - started
+    stop.set()
+    await sampler
+
+    return summarize(stats, clients, elapsed)
+
+
+def summarize(stats: LoadStats, clients: int, elapsed_s: float) -> Dict[str, Any]:
+    def latency(values: List[float]) -> Dict[str, float]:
+        p50, p95, p99 = np.percentile(values, [50, 95, 99]) * 1000
+        return {"count": len(values), "p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99),
+                "max_ms": float(max(values)) * 1000}
+
+    everything = [v for values in stats.latencies.values() for v in values]
+    return {
+        "clients": clients,
+        "elapsed_s": elapsed_s,
+        "requests": stats.requests,
+        "throughput_rps": stats.requests / elapsed_s if elapsed_s else 0.0,
+        "sessions_completed": stats.sessions_completed,
+        "errors": dict(stats.errors),
+        "latency": {step: latency(values) for step, values in sorted(stats.latencies.items())},
+        "latency_all": latency(everything) if everything else None,
+        "memory": {
+            "workers": memory_by_worker(stats.memory),
+            "samples": stats.memory,
+        },
+    }
+
+
+def memory_by_worker(samples: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """RSS start/peak/end/growth per server process.
+
+    With several workers, each /stats poll lands on whichever one accepts it,
+    so samples are grouped by pid rather than compared across processes.
+    """
+    by_pid: Dict[str, List[int]] = {}
+    for sample in samples:
+        if sample.get("rss_bytes"):
+            by_pid.setdefault(str(sample.get("pid")), []).append(sample["rss_bytes"])
+    return {
+        pid: {
+            "samples": len(rss),
+            "start_rss_bytes": rss[0],
+            "peak_rss_bytes": max(rss),
+            "end_rss_bytes": rss[-1],
+            "growth_bytes": rss[-1] - rss[0],
+        }
+        for pid, rss in by_pid.items()
+    }
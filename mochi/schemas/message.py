@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from enum import Enum
 
 
@@ -19,6 +19,11 @@ class Message(BaseModel):
     content: str
     timestamp: datetime = datetime.now()
 
+    # Context-window bookkeeping, not serialized
+    _tokens: Optional[int] = PrivateAttr(default=None)
+    _summarized: bool = PrivateAttr(default=False)  # Folded into the stored rolling summary
+    _summarizing: bool = PrivateAttr(default=False)  # Claimed by a summary call in flight
+
 
 class InterviewState(str, Enum):
     """States of the interview process."""
@@ -44,3 +49,4 @@ class SessionState(BaseModel):
     test_runs: int = 0
     tests_passing: bool = False
     start_time: datetime = datetime.now()
+    summary: str = ""  # Rolling summary of turns that fell out of the context window
@@ -18,6 +18,7 @@ class Problem(BaseModel):
     title: str
     description: str
     difficulty: str  # "easy" | "medium" | "hard"
+    tags: List[str] = []
     signature_file: str  # Path to starter code
     test_file: str  # Path to test cases
     hints_file: Optional[str] = None  # Path to progressive hints
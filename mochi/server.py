@@ -3,11 +3,20 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
+from pydantic import BaseModel
 from pathlib import Path
-import json
-import asyncio
+import multiprocessing
+import os
+import socket
 from typing import Optional
 
+from mochi.ai.coach import AsyncCoach
+from mochi.core.config import Config
+from mochi.core.orchestrator import advance_state
+from mochi.core.session_store import SessionStore, WebSession, create_session_store
+from mochi.io.utils import strip_markdown
+from mochi.schemas import MessageRole, InterviewState
+
 app = FastAPI(title="Mochi Interview Coach")
 
 # Serve static files (HTML, JS, CSS)
@@ -39,21 +48,101 @@ async def home():
     """)
 
 
-# Session storage for active interviews
-active_sessions = {}
+# Fixed prompts for the structured message types
+SESSION_START = "Let's begin. I see your problem. Take a moment to read it, then start thinking out loud. What's your initial approach?"
+HINT_REQUEST = "I'm stuck. Can you give me a hint?"
+FINISH_REQUEST = "I've finished my solution. Can you ask me about the time and space complexity?"
+FALLBACK_REPLY = "I'm having trouble responding right now. Please continue with your approach."
+
+_config: Optional[Config] = None
+_coach: Optional[AsyncCoach] = None
+_sessions: Optional[SessionStore] = None
+
+
+def get_config() -> Config:
+    """Load settings once per process (path from MOCHI_CONFIG, set by run_server)."""
+    global _config
+    if _config is None:
+        _config = Config(os.environ.get("MOCHI_CONFIG", "settings.toml"))
+    return _config
+
+
+def get_coach() -> AsyncCoach:
+    """One coach per process; it shares the async client across all sessions."""
+    global _coach
+    if _coach is None:
+        _coach = AsyncCoach(get_config())
+    return _coach
+
+
+def get_sessions() -> SessionStore:
+    """Session storage for active interviews (``[server] session_store``)."""
+    global _sessions
+    if _sessions is None:
+        _sessions = create_session_store(get_config())
+    return _sessions
+
+
+async def coach_reply(session: WebSession, user_text: str) -> str:
+    """Run one candidate turn through the coach and record both sides."""
+    sessions = get_sessions()
+    sessions.add_message(session, MessageRole.CANDIDATE, user_text)
+
+    try:
+        response = await get_coach().get_response(
+            user_message=user_text,
+            message_history=session.state.messages[:-1],
+            problem_title="Interview Problem",
+            state=session.state.state,
+            elapsed_min=session.elapsed_min,
+            problem_statement=session.problem,
+            summary=session.state.summary,
+        )
+    except Exception as e:
+        print(f"Coach error in session {session.session_id}: {e}")
+        return FALLBACK_REPLY
+
+    sessions.add_message(session, MessageRole.COACH, response)
+    sessions.set_state(session, advance_state(session.state.state, user_text))
+
+    async def summary_stored(summary: str, covered: int):
+        if session.journal:
+            session.journal.record_summary(summary, covered)
+        # The turn was saved before the summary landed
+        await sessions.save_if_unchanged(session)
+
+    get_coach().schedule_summary(session.state, on_summary=summary_stored)
+    return response
+
+
+class FormatRequest(BaseModel):
+    problem: str
+
+
+@app.post("/format_problem")
+async def format_problem(request: FormatRequest):
+    """Format a pasted problem as markdown with the server's LLM (the original text on failure)."""
+    problem = request.problem[:get_config().server_max_session_chars]
+    try:
+        markdown = await get_coach().format_problem(problem)
+    except Exception as e:
+        print(f"Problem formatting failed: {e}")
+        markdown = problem
+    return {"markdown": markdown}
+
+
+async def send_coach(websocket: WebSocket, message: str):
+    """Send a coach reply with its speech-ready text, so the client doesn't parse markdown."""
+    await websocket.send_json({"type": "coach", "message": message, "speech": strip_markdown(message)})
+
 
 @app.websocket("/ws/interview")
 async def interview_websocket(websocket: WebSocket):
     """WebSocket endpoint for real-time interview interaction."""
     await websocket.accept()
 
-    session_id = id(websocket)
-    session_data = {
-        "problem": None,
-        "conversation": [],
-        "code": None
-    }
-    active_sessions[session_id] = session_data
+    sessions = get_sessions()
+    session_id: Optional[str] = None
 
     try:
         while True:
@@ -64,65 +153,74 @@ async def interview_websocket(websocket: WebSocket):
 
             if message_type == "start":
                 # Interview started
-                problem = data.get("problem", "")
-                session_data["problem"] = problem
+                if session_id:
+                    await sessions.remove(session_id)
+                session = await sessions.create(data.get("problem", ""))
+                session_id = session.session_id
 
-                # Store problem in conversation context
-                session_data["conversation"].append({
-                    "role": "system",
-                    "content": f"The user is working on this problem:\n\n{problem}\n\nCoach them without revealing the solution."
-                })
-
-                await websocket.send_json({
-                    "type": "coach",
-                    "message": "Let's begin. I see your problem. Take a moment to read it, then start thinking out loud. What's your initial approach?"
-                })
+                await websocket.send_json({"type": "session", "session_id": session_id})
+                await send_coach(websocket, SESSION_START)
+                continue
 
-            elif message_type == "user_message":
-                # User spoke or typed
-                user_text = data.get("text", "")
+            if message_type == "resume":
+                # Reconnected, possibly to another worker: pick the session up where it was
+                session = await sessions.get(data.get("session_id", ""))
+                if session is None:
+                    await websocket.send_json({
+                        "type": "error",
+                        "message": "Session expired. Please start a new interview."
+                    })
+                    continue
+                if session_id and session_id != session.session_id:
+                    await sessions.release(session_id)
+                session_id = session.session_id
 
-                # Add to conversation
-                session_data["conversation"].append({
-                    "role": "user",
-                    "content": user_text
-                })
+                await websocket.send_json({"type": "session", "session_id": session_id})
+                continue
 
-                # Get coach response (client will call OpenAI directly)
-                # For now, send back a placeholder
+            session = await sessions.get(session_id) if session_id else None
+            if session is None:
                 await websocket.send_json({
-                    "type": "coach",
-                    "message": "I understand. Can you explain your reasoning for that approach? What trade-offs are you considering?"
+                    "type": "error",
+                    "message": "Session expired. Please start a new interview."
                 })
+                continue
+
+            if message_type == "user_message":
+                # User spoke or typed
+                reply = await coach_reply(session, data.get("text", ""))
 
             elif message_type == "review_code":
                 # User wants code reviewed
                 code = data.get("code", "")
-                session_data["code"] = code
-
-                await websocket.send_json({
-                    "type": "coach",
-                    "message": "I see your code. Let me analyze it... One thing to consider: have you thought about edge cases like empty inputs?"
-                })
+                sessions.set_code(session, code)
+                sessions.count_review(session)
+                reply = await coach_reply(
+                    session,
+                    f"Here's my current solution:\n\n```\n{session.code}\n```\n\n"
+                    "Can you review it and tell me if there are any issues?",
+                )
 
             elif message_type == "hint":
                 # User requested a hint
-                await websocket.send_json({
-                    "type": "coach",
-                    "message": "Think about what data structure would help you track elements you've already seen. How could you avoid checking the same pairs repeatedly?"
-                })
+                sessions.count_hint(session)
+                reply = await coach_reply(session, HINT_REQUEST)
 
             elif message_type == "finish":
                 # User finished the problem
-                await websocket.send_json({
-                    "type": "coach",
-                    "message": "Great work! Let's discuss complexity. What's the time complexity of your solution? And what about space complexity?"
-                })
+                sessions.set_state(session, InterviewState.COMPLEXITY)
+                reply = await coach_reply(session, FINISH_REQUEST)
+
+            else:
+                continue
+
+            await sessions.save(session)
+            await send_coach(websocket, reply)
 
     except WebSocketDisconnect:
         print(f"Client {session_id} disconnected")
-        if session_id in active_sessions:
-            del active_sessions[session_id]
+        if session_id:
+            await sessions.release(session_id)
 
 
 @app.get("/health")
@@ -131,7 +229,66 @@ async def health():
     return {"status": "ok"}
 
 
-def run_server(host: str = "127.0.0.1", port: int = 8000):
-    """Run the web server."""
+def _rss_bytes() -> Optional[int]:
+    """Resident memory of this process (Linux), or None where /proc isn't available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+@app.get("/stats")
+async def stats():
+    """Token usage, prompt-cache hit stats and memory for this worker process."""
+    return {
+        "pid": os.getpid(),
+        "sessions": len(get_sessions()),
+        "stored_sessions": await get_sessions().stored(),
+        "rss_bytes": _rss_bytes(),
+        "llm": _coach.usage.as_dict() if _coach else None,
+    }
+
+
+def _serve_worker(sock: socket.socket):
+    """One worker process: imports the app itself, so it builds its own coach and session store."""
     import uvicorn
-    uvicorn.run(app, host=host, port=port)
+    try:
+        uvicorn.Server(uvicorn.Config("mochi.server:app")).run(sockets=[sock])
+    except KeyboardInterrupt:
+        pass
+
+
+def run_server(host: str = "127.0.0.1", port: int = 8000, config_path: str = "settings.toml", workers: int = 1):
+    """Run the web server, in ``workers`` processes sharing the port (0 = one per CPU)."""
+    import uvicorn
+    os.environ["MOCHI_CONFIG"] = str(Path(config_path).resolve())
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        uvicorn.run(app, host=host, port=port)
+        return
+
+    # Bind the shared socket ourselves rather than via uvicorn's workers option: its
+    # socket has proto 0, so asyncio never sets TCP_NODELAY on accepted connections
+    # and back-to-back messages (session + coach on start) wait ~40ms on delayed ACKs.
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_serve_worker, args=(sock,)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        # SIGTERM makes uvicorn shut a worker down gracefully
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+    finally:
+        sock.close()
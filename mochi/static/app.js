@@ -1,13 +1,13 @@
 // Mochi Interview Coach - Client-side JavaScript
 
 let ws = null;
-let apiKey = null;
 let elevenLabsKey = null;
 let timerInterval = null;
 let startTime = null;
 let isListening = false;
 let recognition = null;
 let problemText = '';
+let sessionId = null;
 
 // Convert mathematical symbols to spoken text
 function symbolsToSpeech(text) {
@@ -48,22 +48,17 @@ function symbolsToSpeech(text) {
 
 // Initialize on page load
 document.addEventListener('DOMContentLoaded', () => {
-    // Load API keys from localStorage
-    apiKey = localStorage.getItem('mochi_api_key');
+    // The coach and problem formatting use the server's key; forget any OpenAI key older versions stored
+    localStorage.removeItem('mochi_api_key');
+
+    // Load the optional Eleven Labs key from localStorage
     elevenLabsKey = localStorage.getItem('mochi_elevenlabs_key');
 
-    console.log('Page loaded. API keys check:');
-    console.log('  OpenAI key exists:', !!apiKey);
-    console.log('  Eleven Labs key exists:', !!elevenLabsKey);
+    console.log('Page loaded. Eleven Labs key exists:', !!elevenLabsKey);
     if (elevenLabsKey) {
         console.log('  Eleven Labs key preview:', elevenLabsKey.substring(0, 10) + '...');
     }
 
-    if (apiKey) {
-        document.getElementById('api-key-input').value = apiKey;
-        enableStartButton();
-    }
-
     if (elevenLabsKey) {
         document.getElementById('elevenlabs-key-input').value = elevenLabsKey;
     }
@@ -165,33 +160,22 @@ async function testElevenLabs() {
 }
 
 function saveApiKeys() {
-    const openaiInput = document.getElementById('api-key-input');
     const elevenLabsInput = document.getElementById('elevenlabs-key-input');
 
-    apiKey = openaiInput.value.trim();
     elevenLabsKey = elevenLabsInput.value.trim();
 
-    if (!apiKey.startsWith('sk-')) {
-        alert('Please enter a valid OpenAI API key (starts with sk-)');
-        return;
-    }
-
     // Store in localStorage
-    localStorage.setItem('mochi_api_key', apiKey);
-
     if (elevenLabsKey) {
         localStorage.setItem('mochi_elevenlabs_key', elevenLabsKey);
         console.log('Eleven Labs key saved:', elevenLabsKey.substring(0, 10) + '...');
     } else {
+        localStorage.removeItem('mochi_elevenlabs_key');
         console.log('No Eleven Labs key provided');
     }
 
-    // Enable start button
-    enableStartButton();
-
     const message = elevenLabsKey
-        ? 'API keys saved securely in your browser! Eleven Labs TTS enabled.'
-        : 'OpenAI API key saved! Using browser TTS (add Eleven Labs key for better voice).';
+        ? 'Eleven Labs key saved in your browser! Eleven Labs TTS enabled.'
+        : 'No Eleven Labs key saved. Using browser TTS.';
 
     alert(message);
 }
@@ -200,7 +184,7 @@ function enableStartButton() {
     const problemInput = document.getElementById('problem-input');
     const startBtn = document.getElementById('start-btn');
 
-    if (apiKey && problemInput.value.trim()) {
+    if (problemInput.value.trim()) {
         startBtn.disabled = false;
     } else {
         startBtn.disabled = true;
@@ -211,42 +195,18 @@ function enableStartButton() {
 document.getElementById('problem-input')?.addEventListener('input', enableStartButton);
 
 async function formatProblemWithAI(problemText) {
+    // Formatted by the server's LLM; no API key is needed in the browser
     try {
-        const response = await fetch('https://api.openai.com/v1/chat/completions', {
+        const response = await fetch('/format_problem', {
             method: 'POST',
             headers: {
-                'Authorization': `Bearer ${apiKey}`,
                 'Content-Type': 'application/json'
             },
-            body: JSON.stringify({
-                model: 'gpt-4o-mini',
-                messages: [
-                    {
-                        role: 'system',
-                        content: `You are a formatting assistant. Convert the given coding problem into clean, readable markdown format.
-
-Rules:
-- Use headings (##) for sections like "Problem", "Examples", "Constraints"
-- Use **bold** for important terms
-- Use code blocks (\`\`\`) for code examples
-- Use inline code (\`) for variable names, arrays, etc.
-- Use lists for constraints and examples
-- Make it easy to read and well-structured
-- DO NOT solve the problem or add explanations
-- Only format what's given`
-                    },
-                    {
-                        role: 'user',
-                        content: problemText
-                    }
-                ],
-                temperature: 0.3,
-                max_tokens: 1000
-            })
+            body: JSON.stringify({ problem: problemText })
         });
 
         const data = await response.json();
-        return data.choices[0].message.content;
+        return data.markdown || problemText;
     } catch (error) {
         console.error('Error formatting problem:', error);
         return problemText; // Fallback to original text
@@ -257,11 +217,6 @@ async function startInterview() {
     const problemInput = document.getElementById('problem-input');
     const problem = problemInput.value.trim();
 
-    if (!apiKey) {
-        alert('Please save your API key first!');
-        return;
-    }
-
     if (!problem) {
         alert('Please paste a coding problem!');
         return;
@@ -288,27 +243,6 @@ async function startInterview() {
     // Start timer
     startTimer();
 
-    // Initialize conversation with system prompt
-    conversationHistory = [
-        {
-            role: 'system',
-            content: `You are a helpful coding interview coach. The candidate is working on this problem:
-
-${problem}
-
-Your role:
-- Ask clarifying questions about their approach
-- Encourage them to think out loud
-- Guide them with hints, but NEVER give away the solution
-- Help them consider edge cases and complexity
-- Be encouraging and supportive
-- Keep responses concise (2-3 sentences max)
-- Don't use markdown formatting in responses (it will be spoken aloud)
-
-The candidate will explain their thinking. Coach them through the problem-solving process.`
-        }
-    ];
-
     // Send problem to server and trigger coach to read it
     ws.onopen = () => {
         updateStatus('connected');
@@ -340,11 +274,17 @@ function connectWebSocket() {
     ws.onmessage = (event) => {
         const data = JSON.parse(event.data);
 
-        if (data.type === 'coach') {
+        if (data.type === 'session') {
+            // Kept so a dropped connection can resume on any server worker
+            sessionId = data.session_id;
+        } else if (data.type === 'coach') {
             console.log('Received coach message:', data.message);
             displayCoachMessage(data.message);
             console.log('Calling speakText with Eleven Labs key:', !!elevenLabsKey);
-            speakText(data.message);
+            // The server sends speech-ready text alongside the markdown
+            speakText(data.speech || data.message);
+        } else if (data.type === 'error') {
+            displayCoachMessage(data.message);
         }
     };
 
@@ -355,6 +295,20 @@ function connectWebSocket() {
 
     ws.onclose = () => {
         updateStatus('disconnected');
+        if (sessionId) {
+            setTimeout(resumeSession, 2000);
+        }
+    };
+}
+
+function resumeSession() {
+    connectWebSocket();
+    ws.onopen = () => {
+        updateStatus('connected');
+        ws.send(JSON.stringify({
+            type: 'resume',
+            session_id: sessionId
+        }));
     };
 }
 
@@ -534,52 +488,17 @@ function handleUserSpeech(transcript) {
     }
 }
 
-let conversationHistory = [];
-
-async function sendToCoach(userMessage) {
-    // Add user message to conversation history
-    conversationHistory.push({
-        role: 'user',
-        content: userMessage
-    });
-
-    try {
-        // Call OpenAI API directly from browser
-        const response = await fetch('https://api.openai.com/v1/chat/completions', {
-            method: 'POST',
-            headers: {
-                'Authorization': `Bearer ${apiKey}`,
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                model: 'gpt-4o-mini',
-                messages: conversationHistory,
-                temperature: 0.7,
-                max_tokens: 300
-            })
-        });
-
-        if (!response.ok) {
-            throw new Error(`OpenAI API error: ${response.status}`);
-        }
-
-        const data = await response.json();
-        const coachResponse = data.choices[0].message.content;
-
-        // Add coach response to history
-        conversationHistory.push({
-            role: 'assistant',
-            content: coachResponse
-        });
-
-        // Display and speak the response
-        displayCoachMessage(coachResponse);
-        await speakText(coachResponse);
-
-    } catch (error) {
-        console.error('Error getting coach response:', error);
+function sendToServer(message) {
+    if (!ws || ws.readyState !== WebSocket.OPEN) {
         displayCoachMessage("I'm having trouble responding right now. Please continue with your approach.");
+        return;
     }
+    ws.send(JSON.stringify(message));
+}
+
+function sendToCoach(userMessage) {
+    // Coaching runs server-side; the reply arrives as a 'coach' message
+    sendToServer({ type: 'user_message', text: userMessage });
 }
 
 async function reviewCode() {
@@ -593,19 +512,18 @@ async function reviewCode() {
 
     displayUserMessage('Review my code');
 
-    const reviewPrompt = `Here's my current code:\n\n${code}\n\nCan you review it and give me feedback?`;
-    await sendToCoach(reviewPrompt);
+    sendToServer({ type: 'review_code', code: code });
 }
 
 async function getHint() {
     displayUserMessage('Give me a hint');
-    await sendToCoach("I'm stuck. Can you give me a hint without revealing the solution?");
+    sendToServer({ type: 'hint' });
 }
 
 async function finishInterview() {
     displayUserMessage("I'm done");
 
-    await sendToCoach("I've finished my solution. Can you ask me about the time and space complexity?");
+    sendToServer({ type: 'finish' });
 
     // Stop timer
     if (timerInterval) {
@@ -0,0 +1,141 @@
+"""Audio capture and preprocessing: ring buffer, VAD, silence trimming and normalization."""
+
+import numpy as np
+
+from mochi.io.audio import AudioRingBuffer, VoiceActivityDetector, normalize, preprocess, trim_silence
+
+RATE = 16000
+
+
+def _recording(silence_before, speech, silence_after, level=0.3):
+    """Silence, a constant-amplitude "voice", then silence, in seconds (whole 30 ms frames)."""
+    parts = [
+        np.zeros(int(silence_before * RATE), dtype=np.float32),
+        np.full(int(speech * RATE), level, dtype=np.float32),
+        np.zeros(int(silence_after * RATE), dtype=np.float32),
+    ]
+    return np.concatenate(parts)
+
+
+def _frames(levels, frame=480):
+    """One constant-amplitude 30 ms frame per level."""
+    return np.repeat(np.asarray(levels, dtype=np.float32), frame)
+
+
+def test_ring_buffer_reads_across_the_wrap():
+    ring = AudioRingBuffer(8)
+    ring.write(np.arange(6, dtype=np.float32))
+    ring.write(np.arange(6, 11, dtype=np.float32))
+
+    assert ring.written == 11
+    assert ring.read(5, 9).tolist() == [5, 6, 7, 8]
+    # Overwritten samples are clipped to what is still held
+    assert ring.read(0).tolist() == [3, 4, 5, 6, 7, 8, 9, 10]
+    assert len(ring.read(9, 9)) == 0
+
+
+def test_ring_buffer_keeps_the_tail_of_an_oversized_write():
+    ring = AudioRingBuffer(4)
+    ring.write(np.arange(3, dtype=np.float32))
+    ring.write(np.arange(3, 13, dtype=np.float32))
+
+    assert ring.written == 13
+    assert ring.read(0).tolist() == [9, 10, 11, 12]
+    assert ring.read(10, 12).tolist() == [10, 11]
+
+
+def test_vad_calibrates_the_noise_floor():
+    vad = VoiceActivityDetector(RATE)
+    vad.process(_frames([0.01, 0.03] * 4))
+    assert np.isclose(vad.noise_floor, 0.02)
+    assert not vad.in_speech
+
+
+def test_vad_starts_speech_after_min_speech_frames():
+    vad = VoiceActivityDetector(RATE, min_speech_ms=90)
+    vad.process(_frames([0.002] * 8 + [0.2] * 2 + [0.002]))
+    assert not vad.in_speech  # A two-frame click
+
+    vad.process(_frames([0.2] * 3))
+    assert vad.in_speech
+    assert vad.speech_start == 11 * vad.frame_samples
+    assert vad.speech_end == 14 * vad.frame_samples
+
+
+def test_vad_measures_silence_since_the_last_voiced_frame():
+    vad = VoiceActivityDetector(RATE)
+    assert vad.silence_sec == 0.0
+
+    vad.process(_frames([0.002] * 8 + [0.2] * 5 + [0.002] * 10))
+    assert np.isclose(vad.silence_sec, 0.3)
+
+    vad.process(_frames([0.2]))
+    assert vad.silence_sec == 0.0
+
+
+def test_vad_floor_follows_rising_noise_without_tracking_speech():
+    vad = VoiceActivityDetector(RATE)
+    vad.process(_frames([0.005] * 8))
+
+    # A fan switches on and is slowly absorbed into the floor
+    vad.process(_frames([0.02] * 2000))
+    assert np.isclose(vad.noise_floor, 0.02, rtol=0.01)
+
+    # Speech over the fan is still detected, and barely moves the floor
+    vad.speech_start = vad.speech_end = None
+    vad.process(_frames([0.1] * 10))
+    assert vad.in_speech
+    assert vad.noise_floor < 0.03
+
+
+def test_trim_keeps_padding_around_speech():
+    audio = _recording(2.4, 1.2, 2.4)
+    trimmed = trim_silence(audio, RATE, pad_sec=0.3)
+
+    voiced = np.flatnonzero(trimmed)
+    assert len(trimmed) - len(voiced) == int(0.6 * RATE)
+    assert voiced[0] == int(0.3 * RATE)
+
+
+def test_trim_clamps_padding_at_the_edges():
+    audio = _recording(0.0, 1.2, 0.1)
+    assert len(trim_silence(audio, RATE, pad_sec=0.3)) == len(audio)
+
+
+def test_trim_of_silence_is_empty():
+    assert len(trim_silence(np.zeros(3 * RATE, dtype=np.float32), RATE)) == 0
+    assert len(trim_silence(np.full(RATE, 0.01, dtype=np.float32), RATE)) == 0
+
+
+def test_trim_scans_long_recordings_block_by_block():
+    audio = _recording(24.0, 0.9, 30.0)
+    trimmed = trim_silence(audio, RATE, pad_sec=0.0, block_sec=1.0)
+    assert len(trimmed) == int(0.9 * RATE)
+    assert np.all(trimmed == np.float32(0.3))
+
+
+def test_trim_accepts_a_column_recording():
+    audio = _recording(1.2, 0.6, 1.2).reshape(-1, 1)
+    assert trim_silence(audio, RATE, pad_sec=0.0).shape == (int(0.6 * RATE),)
+
+
+def test_normalize_scales_to_the_peak():
+    audio = np.array([0.1, -0.45, 0.2], dtype=np.float32)
+    out = normalize(audio, peak=0.9)
+    assert out.dtype == np.float32
+    assert np.isclose(out.min(), -0.9)
+
+
+def test_normalize_limits_gain_and_passes_silence_through():
+    quiet = np.array([0.01, -0.02], dtype=np.float32)
+    assert np.isclose(np.abs(normalize(quiet, max_gain=10.0)).max(), 0.2)
+
+    silent = np.zeros(4, dtype=np.float32)
+    assert normalize(silent) is silent
+
+
+def test_preprocess_trims_then_normalizes():
+    audio = _recording(1.2, 0.6, 1.2, level=0.1)
+    out = preprocess(audio, RATE)
+    assert len(out) == int(1.2 * RATE)
+    assert np.isclose(out.max(), 0.9)
@@ -0,0 +1,73 @@
+"""Pre-rendered phrase audio is keyed by text, voice and rate and survives restarts."""
+
+import wave
+
+import numpy as np
+
+from mochi.io.audio_cache import PhraseAudioCache
+
+
+def write_wav(path, samples, rate=22050):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes((np.asarray(samples) * 32767).astype(np.int16).tobytes())
+
+
+class RenderEngine:
+    """Writes a short tone per phrase, like pyttsx3's save_to_file."""
+
+    def __init__(self):
+        self.saved = []
+        self.runs = 0
+
+    def save_to_file(self, text, path):
+        self.saved.append(text)
+        write_wav(path, np.full(100, 0.5))
+
+    def runAndWait(self):
+        self.runs += 1
+
+
+def test_keys_depend_on_text_voice_and_rate(tmp_path):
+    cache = PhraseAudioCache(tmp_path, "v0", 180)
+    path = cache.path_for("Nice work.")
+
+    assert path.parent == tmp_path and path.suffix == ".wav"
+    assert path == PhraseAudioCache(tmp_path, "v0", 180).path_for("Nice work.")
+    assert path != cache.path_for("Good work.")
+    assert path != PhraseAudioCache(tmp_path, "v1", 180).path_for("Nice work.")
+    assert path != PhraseAudioCache(tmp_path, "v0", 200).path_for("Nice work.")
+
+
+def test_render_skips_phrases_already_on_disk(tmp_path):
+    engine = RenderEngine()
+    cache = PhraseAudioCache(tmp_path / "clips", "v0", 180)
+
+    assert cache.render(engine, ["Hi.", "Bye.", "Hi."]) == 2
+    assert engine.saved == ["Hi.", "Bye."] and engine.runs == 1
+    assert len(cache) == 2
+
+    assert cache.render(engine, ["Hi.", "Bye."]) == 0
+    assert engine.runs == 1
+
+
+def test_load_reads_clips_from_a_previous_run(tmp_path):
+    PhraseAudioCache(tmp_path, "v0", 180).render(RenderEngine(), ["Hi."])
+
+    cache = PhraseAudioCache(tmp_path, "v0", 180)
+    cache.load(["Hi.", "Never rendered."])
+    samples, rate = cache.get("Hi.")
+
+    assert rate == 22050
+    assert samples.shape == (100, 1) and samples.dtype == np.float32
+    assert np.allclose(samples, 0.5, atol=1e-3)
+    assert cache.get("Never rendered.") is None
+
+
+def test_unreadable_clips_are_skipped(tmp_path):
+    cache = PhraseAudioCache(tmp_path, "v0", 180)
+    cache.path_for("Hi.").write_bytes(b"FORM\0\0\0\0AIFF")
+    cache.load(["Hi."])
+    assert cache.get("Hi.") is None
@@ -0,0 +1,73 @@
+"""Content-addressed harness result cache: key normalization and tiers."""
+
+from pathlib import Path
+
+from mochi.harness.cache import ResultCache, normalize_source, result_key
+from mochi.harness.python_harness import PythonHarness
+
+SOURCE = "def add(a, b):\n    return a + b\n"
+CASES = [{"name": "small", "function": "add", "input": {"a": 1, "b": 2}, "expected": 3}]
+LIMITS = {"timeout_ms": 4000, "memory_mb": 512}
+
+
+def test_formatting_and_comment_edits_share_a_key():
+    reformatted = "# Adds two numbers\ndef add(a,b):   # inline\n\n    return (a + b)\n"
+
+    assert normalize_source(reformatted) == normalize_source(SOURCE)
+    assert result_key(reformatted, CASES, LIMITS) == result_key(SOURCE, CASES, LIMITS)
+
+
+def test_code_tests_and_limits_all_change_the_key():
+    key = result_key(SOURCE, CASES, LIMITS)
+
+    assert result_key(SOURCE.replace("a + b", "a - b"), CASES, LIMITS) != key
+    assert result_key(SOURCE, [dict(CASES[0], expected=4)], LIMITS) != key
+    assert result_key(SOURCE, CASES, dict(LIMITS, timeout_ms=1000)) != key
+
+
+def test_unparsable_source_is_keyed_verbatim():
+    broken = "def add(a, b:\n    return a + b\n"
+
+    assert normalize_source(broken) == broken
+    assert result_key(broken, CASES, LIMITS) != result_key(broken + " ", CASES, LIMITS)
+
+
+def test_lru_evicts_the_least_recently_used_entry():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", {"passed": 1})
+    cache.put("b", {"passed": 2})
+    assert cache.get("a") == {"passed": 1}
+    cache.put("c", {"passed": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"passed": 1}
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cached_results_are_copies():
+    cache = ResultCache()
+    cache.put("a", {"failures": []})
+    cache.get("a")["failures"].append("mutated")
+
+    assert cache.get("a") == {"failures": []}
+
+
+def test_disk_tier_survives_a_new_process(tmp_path: Path):
+    ResultCache(cache_dir=tmp_path).put("a", {"passed": 1})
+
+    fresh = ResultCache(cache_dir=tmp_path)
+    assert fresh.get("a") == {"passed": 1}
+
+    (tmp_path / "b.json").write_text("{not json")
+    assert fresh.get("b") is None
+
+
+def test_harness_serves_reformatted_source_from_cache(tmp_path: Path):
+    solution = tmp_path / "solution.py"
+    harness = PythonHarness(cache_size=8)
+
+    first = harness.run_source(SOURCE, solution, CASES)
+    second = harness.run_source("def add(a, b):\n    # same code\n    return a + b\n", solution, CASES)
+
+    assert first.all_passing and not first.cached
+    assert second.all_passing and second.cached
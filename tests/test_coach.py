@@ -0,0 +1,191 @@
+"""Coach requests: prompt caching, the rolling summary, and the shared async client."""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from mochi.ai.coach import AsyncCoach, Coach, SystemPrompt
+from mochi.ai.context import MIN_CACHEABLE_PREFIX_TOKENS, count_tokens
+from mochi.core.config import Config
+from mochi.core.prompts import get_static_prompt
+from mochi.schemas import InterviewState, Message, MessageRole, SessionState
+
+
+def _coach(tmp_path) -> Coach:
+    settings = tmp_path / "settings.toml"
+    settings.write_text('[llm]\nengine = "mock"\nprompt_caching = true\n\n[mock_llm]\napi = "anthropic"\n')
+    return Coach(Config(str(settings)))
+
+
+def _static_block(coach: Coach, problem: str) -> dict:
+    prompt = SystemPrompt(get_static_prompt(problem), "", "Current phase: intro")
+    return coach._request_kwargs(prompt, [], "Hi")["system"][0]
+
+
+def test_short_prefix_is_not_marked_cacheable(tmp_path):
+    coach = _coach(tmp_path)
+    assert count_tokens(get_static_prompt("Add two numbers.")) < MIN_CACHEABLE_PREFIX_TOKENS
+
+    assert "cache_control" not in _static_block(coach, "Add two numbers.")
+
+
+def test_long_prefix_is_marked_cacheable(tmp_path):
+    coach = _coach(tmp_path)
+    problem = "Given an array of integers, return the indices of two that sum to target. " * 80
+    assert count_tokens(get_static_prompt(problem)) >= MIN_CACHEABLE_PREFIX_TOKENS
+
+    assert _static_block(coach, problem)["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in _static_block(coach, "Add two numbers.")
+
+
+def _async_coach(tmp_path, budget: int = 60):
+    settings = tmp_path / "settings.toml"
+    settings.write_text(f'[llm]\nengine = "mock"\nhistory_token_budget = {budget}\n')
+    return AsyncCoach(Config(str(settings)))
+
+
+def _session(turns: int) -> SessionState:
+    messages = [
+        Message(role=MessageRole.CANDIDATE if i % 2 else MessageRole.COACH,
+                content=f"turn {i}: " + "detail " * 20, timestamp=datetime.now())
+        for i in range(turns)
+    ]
+    return SessionState(problem_id="custom", solution_file="", messages=messages)
+
+
+def test_summary_marks_turns_only_once_stored(tmp_path):
+    coach = _async_coach(tmp_path)
+    session = _session(6)
+    calls = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def summarize(previous, messages):
+            calls.append([m.content for m in messages])
+            await release.wait()
+            return "summary of the early turns"
+
+        coach.summarize = summarize
+        coach.schedule_summary(session)
+        await asyncio.sleep(0)
+        claimed = [m for m in session.messages if m._summarizing]
+
+        # In flight: claimed, not yet summarized, and not claimed twice
+        assert claimed and not any(m._summarized for m in session.messages)
+        coach.schedule_summary(session)
+        await asyncio.sleep(0)
+        assert len(calls) == 1
+
+        release.set()
+        await asyncio.gather(*coach._summary_tasks)
+        return claimed
+
+    claimed = asyncio.run(scenario())
+
+    assert session.summary == "summary of the early turns"
+    assert all(m._summarized and not m._summarizing for m in claimed)
+    assert not any(m._summarized for m in session.messages[len(claimed):])
+
+
+def test_failed_summary_leaves_turns_for_the_next_attempt(tmp_path):
+    coach = _async_coach(tmp_path)
+    session = _session(6)
+    attempts = []
+
+    async def scenario():
+        async def summarize(previous, messages):
+            attempts.append(len(messages))
+            if len(attempts) == 1:
+                raise RuntimeError("provider down")
+            return "recovered summary"
+
+        coach.summarize = summarize
+        coach.schedule_summary(session)
+        await asyncio.gather(*coach._summary_tasks)
+        assert session.summary == ""
+        assert not any(m._summarized or m._summarizing for m in session.messages)
+
+        coach.schedule_summary(session)
+        await asyncio.gather(*coach._summary_tasks)
+
+    asyncio.run(scenario())
+
+    assert attempts[0] == attempts[1] > 0
+    assert session.summary == "recovered summary"
+
+
+def test_folded_summary_is_reported_with_its_coverage(tmp_path):
+    coach = _async_coach(tmp_path)
+    session = _session(6)
+    reported = []
+
+    async def scenario():
+        async def summarize(previous, messages):
+            return "summary"
+
+        coach.summarize = summarize
+        async def on_summary(summary, covered):
+            reported.append((summary, covered))
+
+        coach.schedule_summary(session, on_summary=on_summary)
+        await asyncio.gather(*coach._summary_tasks)
+
+    asyncio.run(scenario())
+
+    covered = sum(m._summarized for m in session.messages)
+    assert reported == [("summary", covered)]
+    assert all(m._summarized for m in session.messages[:covered])
+
+
+class _FakeCompletions:
+    """Stands in for ``client.chat.completions``, recording peak concurrency."""
+
+    def __init__(self, reply: str):
+        self.reply = reply
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        usage = SimpleNamespace(prompt_tokens=100, completion_tokens=5, prompt_tokens_details=None)
+        return SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=SimpleNamespace(content=self.reply))])
+
+
+def test_async_coaches_share_one_client_and_limit(tmp_path):
+    first, second = _async_coach(tmp_path), _async_coach(tmp_path)
+
+    assert first.client is second.client
+    assert first.limit is second.limit
+
+
+def test_async_requests_respect_the_in_flight_limit(tmp_path):
+    coach = _async_coach(tmp_path)
+    completions = _FakeCompletions("Here's the solution: use a hash map.")
+    coach.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    async def scenario():
+        coach.limit = asyncio.Semaphore(2)
+        return await asyncio.gather(*(
+            coach.get_response(f"Attempt {i}", [], "Two Sum", InterviewState.APPROACH) for i in range(6)
+        ))
+
+    replies = asyncio.run(scenario())
+
+    assert completions.peak == 2
+    assert replies == [coach.safeguards.REPHRASE_MESSAGE] * 6
+    assert coach.usage.requests == 6
+
+
+def test_async_coach_replies_through_the_mock_provider(tmp_path):
+    settings = tmp_path / "settings.toml"
+    settings.write_text('[llm]\nengine = "mock"\n\n[mock_llm]\nttft_ms = 0\njitter_ms = 0\ntokens_per_s = 10000\n')
+    coach = AsyncCoach(Config(str(settings)))
+
+    reply = asyncio.run(coach.get_response("I'd sort first.", [], "Two Sum", InterviewState.APPROACH))
+
+    assert reply.strip()
+    assert coach.usage.requests == 1
@@ -0,0 +1,41 @@
+"""Token-budgeted history window."""
+
+from datetime import datetime
+
+from mochi.ai.context import MESSAGE_OVERHEAD_TOKENS, message_tokens, pack_history, unsummarized
+from mochi.schemas import Message, MessageRole
+
+
+def _messages(count: int, words: int = 20):
+    return [
+        Message(role=MessageRole.CANDIDATE if i % 2 else MessageRole.COACH,
+                content=" ".join(f"w{i}" for _ in range(words)), timestamp=datetime.now())
+        for i in range(count)
+    ]
+
+
+def test_pack_history_keeps_the_newest_messages_that_fit():
+    messages = _messages(10)
+    cost = message_tokens(messages[0])
+    assert cost > MESSAGE_OVERHEAD_TOKENS
+
+    kept, evicted = pack_history(messages, budget_tokens=3 * cost + cost // 2)
+
+    assert kept == messages[-3:]
+    assert evicted == messages[:-3]
+
+
+def test_pack_history_edges():
+    messages = _messages(4)
+
+    assert pack_history(messages, budget_tokens=10_000) == (messages, [])
+    assert pack_history(messages, budget_tokens=0) == ([], messages)
+    assert pack_history([], budget_tokens=100) == ([], [])
+
+
+def test_unsummarized_skips_folded_and_in_flight_turns():
+    messages = _messages(4)
+    messages[0]._summarized = True
+    messages[1]._summarizing = True
+
+    assert unsummarized(messages) == messages[2:]
@@ -0,0 +1,60 @@
+"""PythonHarness run and per-case budgets."""
+
+from pathlib import Path
+
+import pytest
+
+from mochi.harness.python_harness import PythonHarness
+
+SOLUTION = """
+def add(a, b):
+    if a < 0:
+        while True:
+            pass
+    return a + b
+"""
+
+CASES = [
+    {"name": "hangs", "function": "add", "input": {"a": -1, "b": 1}, "expected": 0},
+    {"name": "small", "function": "add", "input": {"a": 1, "b": 2}, "expected": 3},
+    {"name": "large", "function": "add", "input": {"a": 10, "b": 20}, "expected": 30},
+]
+
+
+@pytest.fixture
+def solution(tmp_path: Path) -> Path:
+    path = tmp_path / "solution.py"
+    path.write_text(SOLUTION)
+    return path
+
+
+def test_hung_case_does_not_starve_later_cases(solution):
+    harness = PythonHarness(timeout_ms=1500)
+    result = harness.run_tests(solution, CASES)
+
+    statuses = {case.name: case.status for case in result.cases}
+    assert statuses == {"hangs": "timed_out", "small": "passed", "large": "passed"}
+    assert result.passed == 2
+
+
+def test_explicit_case_timeout_is_used(solution):
+    harness = PythonHarness(timeout_ms=1500, case_timeout_ms=300)
+    result = harness.run_tests(solution, CASES)
+
+    hung = next(case for case in result.cases if case.name == "hangs")
+    assert hung.status == "timed_out"
+    assert hung.duration_ms < 1000
+
+
+def test_crashes_and_timeouts_are_not_cached(solution):
+    harness = PythonHarness(timeout_ms=1500, cache_size=4)
+    harness.run_tests(solution, CASES)
+    assert not harness.run_tests(solution, CASES).cached
+
+    crashing = [{"name": "typo", "function": "add", "input": {"a": 1}, "expected": 1}]
+    harness.run_tests(solution, crashing)
+    assert not harness.run_tests(solution, crashing).cached
+
+    passing = CASES[1:]
+    harness.run_tests(solution, passing)
+    assert harness.run_tests(solution, passing).cached
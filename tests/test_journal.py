@@ -0,0 +1,92 @@
+"""Session journals: replay after crashes, torn lines and resumes."""
+
+import subprocess
+import sys
+import textwrap
+from datetime import datetime
+from pathlib import Path
+
+from mochi.core.journal import SessionJournal, replay
+from mochi.schemas import InterviewState, Message, MessageRole, SessionState
+
+
+def _journal(tmp_path) -> SessionJournal:
+    journal = SessionJournal.create(tmp_path, session_id="s1")
+    journal.record_session(SessionState(problem_id="two_sum", solution_file="solution.py"))
+    return journal
+
+
+def _message(content: str, role: MessageRole = MessageRole.CANDIDATE) -> Message:
+    return Message(role=role, content=content, timestamp=datetime.now())
+
+
+def test_torn_final_line_is_skipped(tmp_path):
+    journal = _journal(tmp_path)
+    journal.record_message(_message("hash map?"))
+    journal.record_state(InterviewState.APPROACH)
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"type": "message", "role": "candidate", "cont')
+
+    header, state = replay(journal.path)
+
+    assert header["problem_id"] == "two_sum"
+    assert [m.content for m in state.messages] == ["hash map?"]
+    assert state.state == InterviewState.APPROACH
+
+
+def test_resume_appends_after_a_torn_line(tmp_path):
+    journal = _journal(tmp_path)
+    journal.record_message(_message("before the crash"))
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"type": "hint", "at": "2026-')
+
+    resumed = SessionJournal(journal.path)
+    resumed.record_message(_message("after resuming"))
+    resumed.record_hint()
+    resumed.close()
+
+    _, state = replay(journal.path)
+
+    assert [m.content for m in state.messages] == ["before the crash", "after resuming"]
+    assert state.hints_given == 1
+
+
+def test_writer_dying_mid_batch_leaves_a_replayable_prefix(tmp_path):
+    # The writer thread buffers records between fsyncs; exiting without a
+    # flush drops the unsynced batch and can cut a line anywhere in it.
+    script = textwrap.dedent(f"""
+        import os
+        from datetime import datetime
+        from mochi.core.journal import SessionJournal
+        from mochi.schemas import Message, MessageRole, SessionState
+
+        journal = SessionJournal.create({str(tmp_path)!r}, session_id="s1", fsync_interval_s=60)
+        journal.record_session(SessionState(problem_id="two_sum", solution_file="solution.py"))
+        journal.flush()
+        for i in range(2000):
+            journal.record_message(Message(role=MessageRole.CANDIDATE, content=f"turn {{i}} " + "x" * 50,
+                                           timestamp=datetime.now()))
+        os._exit(0)
+    """)
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=Path(__file__).parent.parent)
+
+    _, state = replay(tmp_path / "s1.jsonl")
+
+    contents = [m.content for m in state.messages]
+    assert len(contents) < 2000
+    assert contents == [f"turn {i} " + "x" * 50 for i in range(len(contents))]
+
+
+def test_summary_survives_replay(tmp_path):
+    journal = _journal(tmp_path)
+    for i in range(4):
+        journal.record_message(_message(f"turn {i}"))
+    journal.record_summary("Candidate proposed brute force, then a hash map.", covered=3)
+    journal.close()
+
+    _, state = replay(journal.path)
+
+    assert state.summary == "Candidate proposed brute force, then a hash map."
+    assert [m._summarized for m in state.messages] == [True, True, True, False]
@@ -0,0 +1,86 @@
+"""Load-test generator: think times, scripts, the client loop and per-worker memory summaries."""
+
+import asyncio
+import json
+import random
+import statistics
+
+import pytest
+
+from mochi.loadtest import DEFAULT_SCRIPT, ThinkTime, load_script, memory_by_worker, run_load
+
+
+def test_memory_growth_is_per_worker():
+    samples = [
+        {"t": 0.0, "pid": 1, "rss_bytes": 100},
+        {"t": 1.0, "pid": 2, "rss_bytes": 500},
+        {"t": 2.0, "pid": 1, "rss_bytes": 130},
+        {"t": 3.0, "pid": 2, "rss_bytes": 450},
+        {"t": 4.0, "pid": 2, "rss_bytes": None},
+    ]
+
+    workers = memory_by_worker(samples)
+
+    assert workers["1"] == {
+        "samples": 2, "start_rss_bytes": 100, "peak_rss_bytes": 130,
+        "end_rss_bytes": 130, "growth_bytes": 30,
+    }
+    assert workers["2"]["growth_bytes"] == -50
+    assert workers["2"]["peak_rss_bytes"] == 500
+
+
+def test_think_time_mean_and_fixed():
+    rng = random.Random(0)
+    samples = [ThinkTime(2.0, 0.5).sample(rng) for _ in range(20000)]
+    assert statistics.mean(samples) == pytest.approx(2.0, rel=0.03)
+    assert ThinkTime(1.5, 0).sample(rng) == 1.5
+    assert ThinkTime(0, 0.5).sample(rng) == 0.0
+
+
+def test_script_must_begin_with_start(tmp_path):
+    assert load_script(None) is DEFAULT_SCRIPT
+
+    script = tmp_path / "script.yaml"
+    script.write_text("- type: user_message\n  text: hi\n")
+    with pytest.raises(ValueError, match="start"):
+        load_script(script)
+
+    script.write_text("- type: start\n  problem: p\n- type: finish\n")
+    assert [step["type"] for step in load_script(script)] == ["start", "finish"]
+
+
+def test_run_load_replays_the_script_and_reports():
+    serve = pytest.importorskip("websockets.asyncio.server").serve
+
+    async def interview(ws):
+        async for raw in ws:
+            step = json.loads(raw)
+            if step["type"] == "start":
+                await ws.send(json.dumps({"type": "session", "id": "s"}))
+            if step["type"] == "hint":
+                await ws.send(json.dumps({"type": "error", "message": "no hints"}))
+            else:
+                await ws.send(json.dumps({"type": "coach", "text": "ok"}))
+
+    def stats(connection, request):
+        if request.path == "/stats":
+            return connection.respond(200, json.dumps({"pid": 7, "rss_bytes": 1000, "sessions": 1}))
+
+    async def main():
+        async with serve(interview, "127.0.0.1", 0, process_request=stats) as server:
+            port = server.sockets[0].getsockname()[1]
+            return await run_load(
+                f"ws://127.0.0.1:{port}/ws/interview", clients=2, duration_s=0.5, ramp_s=0.1,
+                think=ThinkTime(0.01, 0), script=[{"type": "start"}, {"type": "hint"}, {"type": "finish"}],
+                timeout_s=5, memory_interval_s=0.1,
+            )
+
+    report = asyncio.run(main())
+
+    assert report["clients"] == 2 and report["sessions_completed"] >= 2
+    assert set(report["latency"]) == {"start", "finish"}
+    # The deadline may cut the last interview short after its hint
+    assert set(report["errors"]) == {"hint: no hints"}
+    assert report["errors"]["hint: no hints"] >= report["latency"]["finish"]["count"] >= report["sessions_completed"]
+    assert report["requests"] == sum(step["count"] for step in report["latency"].values())
+    assert report["memory"]["workers"]["7"]["peak_rss_bytes"] == 1000
@@ -0,0 +1,107 @@
+"""Mock LLM provider: latency distributions, seeded timings and paced streaming."""
+
+import json
+import random
+import statistics
+import time
+import urllib.request
+
+import pytest
+
+from mochi.ai.mock_llm import LatencyModel, MockLLMServer, ScriptedReplies
+
+
+def _ttfts_ms(model, n=4000):
+    rng = random.Random(1)
+    return [model.ttft_s(rng) * 1000 for _ in range(n)]
+
+
+def _body(user="How should I start?", stream=False):
+    return {"model": "mock", "stream": stream,
+            "messages": [{"role": "system", "content": "Coach."}, {"role": "user", "content": user}]}
+
+
+def test_fixed_latency_ignores_jitter():
+    assert set(_ttfts_ms(LatencyModel(250, 100, "fixed"), n=10)) == {250}
+    assert set(_ttfts_ms(LatencyModel(250, 0, "normal"), n=10)) == {250}
+
+
+def test_uniform_latency_stays_within_jitter():
+    samples = _ttfts_ms(LatencyModel(400, 100, "uniform"))
+    assert 300 <= min(samples) and max(samples) <= 500
+    assert statistics.mean(samples) == pytest.approx(400, abs=10)
+
+
+def test_normal_latency_is_centred_and_clamped():
+    samples = _ttfts_ms(LatencyModel(400, 100, "normal"))
+    assert statistics.mean(samples) == pytest.approx(400, abs=10)
+    assert statistics.stdev(samples) == pytest.approx(100, rel=0.1)
+    assert min(_ttfts_ms(LatencyModel(10, 100, "normal"))) == 0
+
+
+def test_lognormal_latency_has_the_median_and_a_long_tail():
+    samples = sorted(_ttfts_ms(LatencyModel(400, 150, "lognormal")))
+    median, p99 = samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+    assert median == pytest.approx(400, rel=0.05)
+    assert p99 - median > median - samples[int(len(samples) * 0.01)]
+
+
+def test_latency_model_validation_and_token_rate():
+    with pytest.raises(ValueError, match="pareto"):
+        LatencyModel(distribution="pareto")
+    assert LatencyModel(tokens_per_s=50).token_interval_s() == 0.02
+    assert LatencyModel(tokens_per_s=0).token_interval_s() == 0
+
+
+def test_timings_are_seeded_from_the_request():
+    def plan(seed, user):
+        server = MockLLMServer(seed=seed, latency=LatencyModel(400, 150, "lognormal")).start()
+        try:
+            return server._plan(f"Coach.\n{user}", user, 1)
+        finally:
+            server.stop()
+
+    assert plan(0, "hi") == plan(0, "hi")
+    assert plan(0, "hi")[1] != plan(1, "hi")[1]
+    assert plan(0, "hi")[1] != plan(0, "hello")[1]
+
+
+def test_scripted_replies_match_then_rotate():
+    replies = ScriptedReplies([{"match": "complexity", "reply": "O(n)?"}, {"reply": "A"}, {"reply": "B"}])
+    assert replies.reply("What is the Complexity here?", 0) == "O(n)?"
+    assert [replies.reply("hmm", turn) for turn in range(3)] == ["A", "B", "A"]
+
+
+def test_stream_is_paced_by_ttft_and_token_rate():
+    server = MockLLMServer(latency=LatencyModel(80, 0, "fixed", tokens_per_s=100),
+                           replies=ScriptedReplies([{"reply": "one two three four five"}])).start()
+    try:
+        start = time.perf_counter()
+        _, chunks = server.chat_completion(_body(stream=True))
+        arrivals = [time.perf_counter() - start for _ in chunks]
+    finally:
+        server.stop()
+
+    # Five tokens and the finish chunk: first after the TTFT, then one per 10 ms
+    assert len(arrivals) == 6
+    assert arrivals[0] >= 0.08
+    assert arrivals[4] - arrivals[0] >= 0.04
+    assert arrivals[-1] < 0.5
+
+
+def test_http_completion_matches_the_openai_shape():
+    server = MockLLMServer(latency=LatencyModel(0, 0, "fixed", tokens_per_s=0),
+                           replies=ScriptedReplies([{"reply": "Try a hash map."}])).start()
+    try:
+        request = urllib.request.Request(
+            f"{server.url}/v1/chat/completions", data=json.dumps(_body()).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            payload = json.load(response)
+    finally:
+        server.stop()
+
+    assert payload["choices"][0]["message"]["content"] == "Try a hash map."
+    assert payload["usage"]["completion_tokens"] == 4
+    assert server.requests == 1
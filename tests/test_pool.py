@@ -0,0 +1,98 @@
+"""Pre-started harness workers: reuse, recycling and replacement."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from mochi.harness.pool import WorkerPool
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="the worker pool needs POSIX pipes and rlimits")
+
+JOB = {
+    "source": "import os\n\ndef pid():\n    return os.getpid()\n",
+    "filename": "solution.py",
+    "solution_dir": "",
+    "timeout_s": 2,
+    "test_cases": [{"name": "pid", "function": "pid", "input": {}, "expected": -1}],
+}
+
+HANG = dict(JOB, source="def pid():\n    while True:\n        pass\n", timeout_s=30)
+
+
+def _pid(pool: WorkerPool, job=JOB, timeout_s: float = 5) -> int:
+    result = pool.run(job, timeout_s=timeout_s)
+    return result["failures"][0]["got"]
+
+
+def _wait_for_idle(pool: WorkerPool, count: int):
+    deadline = time.monotonic() + 10
+    while pool.idle < count:
+        assert time.monotonic() < deadline, "pool never refilled"
+        time.sleep(0.01)
+
+
+def test_worker_is_reused_then_recycled_after_max_jobs():
+    pool = WorkerPool(1, max_jobs=3)
+    try:
+        pids = [_pid(pool) for _ in range(3)]
+        _wait_for_idle(pool, 1)
+        after = _pid(pool)
+    finally:
+        pool.close()
+
+    assert len(set(pids)) == 1
+    assert after != pids[0]
+
+
+def test_crashed_worker_is_replaced():
+    pool = WorkerPool(1, max_jobs=10)
+    try:
+        first = _pid(pool)
+        crash = dict(JOB, source="import os\n\ndef pid():\n    os._exit(1)\n")
+        result = pool.run(crash, timeout_s=5)
+        _wait_for_idle(pool, 1)
+        after = _pid(pool)
+    finally:
+        pool.close()
+
+    assert result["error"] == "Worker exited unexpectedly"
+    assert after != first
+
+
+def test_timed_out_worker_is_killed_and_replaced():
+    pool = WorkerPool(1, max_jobs=10)
+    try:
+        first = _pid(pool)
+        start = time.perf_counter()
+        result = pool.run(HANG, timeout_s=0.5)
+        waited = time.perf_counter() - start
+        _wait_for_idle(pool, 1)
+        after = _pid(pool)
+    finally:
+        pool.close()
+
+    assert result["error"] == "Timeout"
+    assert waited < 2
+    assert after != first
+
+
+def test_reused_worker_reloads_edited_helper_modules(tmp_path: Path):
+    (tmp_path / "helper.py").write_text("VALUE = 1\n")
+    job = dict(
+        JOB,
+        source="import helper\n\ndef value():\n    return helper.VALUE\n",
+        solution_dir=str(tmp_path),
+        test_cases=[{"name": "value", "function": "value", "input": {}, "expected": 22}],
+    )
+    pool = WorkerPool(1, max_jobs=10)
+    try:
+        before = pool.run(job, timeout_s=5)
+        (tmp_path / "helper.py").write_text("VALUE = 22\n")
+        after = pool.run(job, timeout_s=5)
+    finally:
+        pool.close()
+
+    assert before["failures"][0]["got"] == 1
+    assert after["passed"] == 1
@@ -0,0 +1,63 @@
+"""ProblemBank resolves a problem's declared files against its own directory."""
+
+from pathlib import Path
+
+import pytest
+
+from mochi.core.problem_bank import ProblemBank
+
+PROBLEM_YAML = """id: add
+title: Add
+difficulty: easy
+description: Add two numbers.
+signature_file: {signature}
+test_file: {tests}
+"""
+
+TESTS_YAML = """tests:
+  - name: small
+    function: add
+    input: {a: 1, b: 2}
+    expected: 3
+"""
+
+
+def make_problem(root: Path, signature: str = "solution.py", tests: str = "tests.yaml") -> Path:
+    problem_dir = root / "problems" / "add"
+    problem_dir.mkdir(parents=True)
+    (problem_dir / "problem.yaml").write_text(PROBLEM_YAML.format(signature=signature, tests=tests))
+    (problem_dir / "solution.py").write_text("def add(a, b):\n    pass\n")
+    (problem_dir / "tests.yaml").write_text(TESTS_YAML)
+    return problem_dir
+
+
+@pytest.mark.parametrize("signature", ["solution.py", "examples/problems/add/solution.py"])
+def test_relative_declared_path_beats_cwd(tmp_path, monkeypatch, signature):
+    problem_dir = make_problem(tmp_path, signature=signature)
+    # An empty solution.py in the CWD, as when launched from a repo root
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "solution.py").write_text("")
+    (tmp_path / "examples" / "problems" / "add").mkdir(parents=True)
+    (tmp_path / "examples" / "problems" / "add" / "solution.py").write_text("")
+
+    bank = ProblemBank(problem_dir.parent)
+    assert bank.starter_code("add").startswith("def add")
+    assert bank.tests_path("add") == problem_dir / "tests.yaml"
+
+
+def test_absolute_declared_path_is_used(tmp_path):
+    elsewhere = tmp_path / "shared" / "starter.py"
+    elsewhere.parent.mkdir()
+    elsewhere.write_text("# shared starter\n")
+    problem_dir = make_problem(tmp_path, signature=str(elsewhere))
+
+    bank = ProblemBank(problem_dir.parent)
+    assert bank.starter_code("add") == "# shared starter\n"
+
+
+def test_missing_test_file_falls_back_to_tests_yaml(tmp_path):
+    problem_dir = make_problem(tmp_path, tests="missing.yaml")
+
+    bank = ProblemBank(problem_dir.parent)
+    assert bank.tests_path("add") == problem_dir / "tests.yaml"
+    assert [t.name for t in bank.tests("add")] == ["small"]
@@ -0,0 +1,99 @@
+"""Solution-leak safeguards: fishing detection and streamed-response filtering."""
+
+import pytest
+
+from mochi.ai.safeguards import CoachSafeguards, PhraseMatcher, _pattern_width
+
+
+def test_phrase_matcher_finds_overlapping_phrases():
+    matcher = PhraseMatcher(["he", "she", "hers", "his"])
+
+    assert matcher.find_all("ushers") == [0, 1, 2]
+    assert matcher.find_all("this") == [3]
+    assert matcher.find_all("nothing here") == [0]
+    assert matcher.find_all("xyz") == []
+
+
+def test_detect_fishing_prefers_earliest_listed_phrase():
+    safeguards = CoachSafeguards()
+
+    reply = safeguards.detect_fishing("Ugh, I GIVE UP, just tell me")
+
+    assert reply == safeguards.FISHING_ATTEMPTS["just tell me"]
+    assert safeguards.detect_fishing("I think a sliding window works") is None
+
+
+def _stream(chunks):
+    safeguards = CoachSafeguards()
+    stream = safeguards.stream_filter()
+    out = "".join(stream.feed(chunk) for chunk in chunks) + stream.finish()
+    return safeguards, stream, out
+
+
+def test_stream_filter_catches_phrase_split_across_chunks():
+    chunks = ["Good progress so far. Honestly, ", "the ans", "wer i", "s to sort first."]
+
+    safeguards, stream, out = _stream(chunks)
+
+    assert stream.tripped
+    assert "answer" not in out
+    assert out.endswith(safeguards.REPHRASE_MESSAGE)
+
+
+def test_stream_filter_releases_clean_text_unchanged():
+    text = "What happens to your loop when the array is empty? " * 5
+    chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+
+    _, stream, out = _stream(chunks)
+
+    assert not stream.tripped
+    assert out == text
+
+
+def test_unbounded_pattern_holds_the_stream_until_finish():
+    class Strict(CoachSafeguards):
+        FORBIDDEN_PATTERNS = CoachSafeguards.FORBIDDEN_PATTERNS + [r"o\(n\) +time"]
+
+    stream = Strict().stream_filter()
+
+    assert stream.carry_chars is None
+    assert stream.feed("Think about ") == ""
+    assert stream.finish() == "Think about "
+
+
+@pytest.mark.parametrize("pattern, width", [
+    (r"copy this code", 14),
+    (r"(here's|this is|the) (the )?solution", 20),
+    (r"a(b|cd(e|fgh))?x", 7),
+    (r"[xyz]\.q", 3),
+    (r"o\(n\) +time", None),
+    (r"(?=lookahead)", None),
+])
+def test_pattern_width_is_the_longest_literal_match(pattern, width):
+    assert _pattern_width(pattern) == width
+
+
+def test_stream_filter_holds_back_exactly_width_minus_one_characters():
+    safeguards = CoachSafeguards()
+    stream = safeguards.stream_filter()
+    text = "Walk me through your loop invariant before we go on. " * 3
+
+    released = stream.feed(text)
+
+    assert stream.carry_chars == safeguards.forbidden_width - 1
+    assert released == text[:len(text) - stream.carry_chars]
+    assert stream.finish() == text[len(released):]
+
+
+def test_longest_forbidden_phrase_is_caught_by_its_last_character():
+    safeguards = CoachSafeguards()
+    phrase = "the optimal approach is to use"
+    assert len(phrase) == safeguards.forbidden_width
+    stream = safeguards.stream_filter()
+
+    released = stream.feed("Nice. " + phrase[:-1])
+    tripped = stream.feed(phrase[-1])
+
+    assert "the optimal" not in released
+    assert stream.tripped
+    assert tripped.endswith(safeguards.REPHRASE_MESSAGE)
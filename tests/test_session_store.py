@@ -0,0 +1,203 @@
+"""Web session stores: serialization, versioned sharing between workers, and not blocking the loop."""
+
+import asyncio
+import sqlite3
+import time
+
+from mochi.core.session_store import SessionStore, SQLiteSessionStore, dumps_session, loads_session
+from mochi.schemas import InterviewState, MessageRole
+
+
+def test_serialization_round_trip():
+    async def scenario():
+        store = SessionStore()
+        session = await store.create("Two sum " * 50)
+        store.add_message(session, MessageRole.CANDIDATE, "Brute force first?")
+        store.add_message(session, MessageRole.COACH, "Sure — what's its cost?")
+        store.set_state(session, InterviewState.APPROACH)
+        store.count_hint(session)
+        session.state.summary = "Candidate proposed brute force."
+        return session
+
+    session = asyncio.run(scenario())
+    data = dumps_session(session)
+    restored = loads_session(session.session_id, data)
+
+    assert len(data) < len(session.problem)
+    assert restored.problem == session.problem
+    assert restored.state.state == InterviewState.APPROACH
+    assert restored.state.hints_given == 1
+    assert restored.state.summary == session.state.summary
+    assert [(m.role, m.content) for m in restored.state.messages] == [
+        (m.role, m.content) for m in session.state.messages
+    ]
+
+
+def test_memory_store_keeps_released_sessions_for_resume():
+    async def scenario():
+        store = SessionStore()
+        session = await store.create("problem")
+        await store.release(session.session_id)
+        return await store.get(session.session_id) is session
+
+    assert asyncio.run(scenario())
+
+
+def test_sqlite_sessions_are_shared_between_stores(tmp_path):
+    async def scenario():
+        first = SQLiteSessionStore(tmp_path / "sessions.db")
+        second = SQLiteSessionStore(tmp_path / "sessions.db")
+        session = await first.create("problem")
+        first.add_message(session, MessageRole.CANDIDATE, "hello")
+        await first.save(session)
+
+        other = await second.get(session.session_id)
+        assert other.state.messages[-1].content == "hello"
+        second.add_message(other, MessageRole.COACH, "hi there")
+        await second.save(other)
+
+        # The first store sees the newer version and reloads it
+        reloaded = await first.get(session.session_id)
+        assert reloaded.state.messages[-1].content == "hi there"
+
+        await first.release(session.session_id)
+        assert await second.get(session.session_id) is not None
+        await second.remove(session.session_id)
+        assert await first.get(session.session_id) is None
+        assert await first.stored() == 0
+        first.close()
+        second.close()
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_writes_do_not_block_the_event_loop(tmp_path):
+    path = tmp_path / "sessions.db"
+
+    async def scenario():
+        store = SQLiteSessionStore(path)
+        session = await store.create("problem")
+
+        # Another "worker" holds the write lock for a while
+        blocker = sqlite3.connect(str(path), isolation_level=None)
+        blocker.execute("BEGIN IMMEDIATE")
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.3, blocker.rollback)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await store.save(session)
+        waited = time.perf_counter() - start
+        task.cancel()
+        blocker.close()
+        store.close()
+        return waited, ticks
+
+    waited, ticks = asyncio.run(scenario())
+    assert waited >= 0.25
+    assert ticks >= 10
+
+
+def test_summarized_turns_stay_summarized_after_reload(tmp_path):
+    async def scenario():
+        first = SQLiteSessionStore(tmp_path / "sessions.db")
+        second = SQLiteSessionStore(tmp_path / "sessions.db")
+        session = await first.create("problem")
+        for i in range(5):
+            first.add_message(session, MessageRole.CANDIDATE, f"turn {i}")
+        for message in session.state.messages[:3]:
+            message._summarized = True
+        session.state.summary = "First three turns."
+        await first.save(session)
+
+        reloaded = await second.get(session.session_id)
+        first.close()
+        second.close()
+        return reloaded
+
+    reloaded = asyncio.run(scenario())
+
+    assert reloaded.state.summary == "First three turns."
+    assert [m._summarized for m in reloaded.state.messages] == [True, True, True, False, False]
+
+
+def test_background_save_does_not_overwrite_another_workers_save(tmp_path):
+    async def scenario():
+        first = SQLiteSessionStore(tmp_path / "sessions.db")
+        second = SQLiteSessionStore(tmp_path / "sessions.db")
+        session = await first.create("problem")
+
+        # A summary lands on an unchanged session: saved
+        session.state.summary = "summary v1"
+        await first.save_if_unchanged(session)
+        assert (await second.get(session.session_id)).state.summary == "summary v1"
+
+        # Another worker moved the session on before the next summary landed: skipped
+        other = await second.get(session.session_id)
+        second.add_message(other, MessageRole.CANDIDATE, "newer turn")
+        await second.save(other)
+        session.state.summary = "stale summary"
+        await first.save_if_unchanged(session)
+
+        latest = await first.get(session.session_id)
+        first.close()
+        second.close()
+        return latest
+
+    latest = asyncio.run(scenario())
+
+    assert latest.state.summary == "summary v1"
+    assert latest.state.messages[-1].content == "newer turn"
+
+
+def test_sqlite_reloads_only_when_the_version_changes(tmp_path):
+    async def scenario():
+        first = SQLiteSessionStore(tmp_path / "sessions.db")
+        second = SQLiteSessionStore(tmp_path / "sessions.db")
+        reads = []
+        read_session = first._read_session
+        first._read_session = lambda session_id: reads.append(session_id) or read_session(session_id)
+
+        session = await first.create("problem")
+        assert session.version == 1
+        await first.save(session)
+        assert session.version == 2
+
+        # Unchanged rows come from the cache without deserializing
+        assert await first.get(session.session_id) is session
+        assert await first.get(session.session_id) is session
+        assert reads == []
+
+        other = await second.get(session.session_id)
+        assert other.version == 2
+        await second.save(other)
+
+        reloaded = await first.get(session.session_id)
+        assert reloaded is not session and reloaded.version == 3
+        assert await first.get(session.session_id) is reloaded
+        assert reads == [session.session_id]
+        first.close()
+        second.close()
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_idle_sessions_expire(tmp_path):
+    async def scenario():
+        store = SQLiteSessionStore(tmp_path / "sessions.db", idle_timeout_s=60)
+        session = await store.create("problem")
+        await store._run(
+            lambda: store._db.execute("UPDATE sessions SET last_active = ?", (time.time() - 120,))
+        )
+        assert await store.get(session.session_id) is None
+        store.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,47 @@
+"""Speculative background test runs."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from mochi.core.speculative import SpeculativeRunner
+from mochi.harness.python_harness import PythonHarness
+
+SLOW = """
+import time
+
+def add(a, b):
+    time.sleep(3)
+    return a + b
+"""
+
+FAST = """
+def add(a, b):
+    return a + b
+"""
+
+CASES = [{"name": "small", "function": "add", "input": {"a": 1, "b": 2}, "expected": 3}]
+
+
+@pytest.mark.parametrize("pool_size", [0, 2])
+def test_new_save_does_not_wait_behind_a_stale_run(tmp_path: Path, pool_size):
+    solution = tmp_path / "solution.py"
+    harness = PythonHarness(timeout_ms=5000, pool_size=pool_size)
+    runner = SpeculativeRunner(harness, solution, CASES)
+    try:
+        solution.write_text(SLOW)
+        assert runner.schedule()
+        time.sleep(0.5)  # The slow run is now in flight
+
+        solution.write_text(FAST)
+        assert runner.schedule()
+        start = time.perf_counter()
+        result = runner.result_for(FAST, timeout=10)
+        waited = time.perf_counter() - start
+    finally:
+        runner.shutdown()
+        harness.close()
+
+    assert result is not None and result.all_passing
+    assert waited < 1.5
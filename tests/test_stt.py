@@ -0,0 +1,79 @@
+"""StreamingTranscriber commits stable segments and re-decodes only the open tail."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sounddevice")
+
+from mochi.io.stt import StreamingTranscriber
+from mochi.io.stt_backends import Segment, STTBackend
+
+RATE = 16000
+
+
+class FakeBackend(STTBackend):
+    """Splits every window into one "word" per second of audio."""
+
+    name = "fake"
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def transcribe(self, audio, initial_prompt=None):
+        self.calls.append((len(audio), initial_prompt))
+        seconds = int(np.ceil(len(audio) / RATE))
+        return [
+            Segment(float(i), min(float(i + 1), len(audio) / RATE), f" w{len(self.calls)}.{i}")
+            for i in range(seconds)
+        ]
+
+
+def _audio(seconds):
+    return np.zeros(int(seconds * RATE), dtype=np.float32)
+
+
+def test_due_waits_for_a_step_of_new_audio():
+    transcriber = StreamingTranscriber(FakeBackend(), sample_rate=RATE, step_sec=1.0)
+    assert not transcriber.due(RATE - 1)
+    assert transcriber.due(RATE)
+
+    transcriber.update(_audio(1.0))
+    transcriber._pending.result()
+    assert not transcriber.due(int(1.5 * RATE))
+    assert transcriber.due(2 * RATE)
+
+
+def test_update_commits_segments_before_the_margin():
+    backend = FakeBackend()
+    partials = []
+    transcriber = StreamingTranscriber(
+        backend, sample_rate=RATE, commit_margin_sec=1.0, on_partial=partials.append,
+    )
+
+    transcriber.update(_audio(4.0))
+    transcriber._pending.result()
+
+    # Segments ending by 3 s are stable; the last one stays open
+    assert transcriber._committed_text == " w1.0 w1.1 w1.2"
+    assert transcriber._committed_samples == 3 * RATE
+    assert partials == ["w1.0 w1.1 w1.2 w1.3"]
+
+
+def test_finish_decodes_only_the_uncommitted_tail():
+    backend = FakeBackend()
+    transcriber = StreamingTranscriber(backend, sample_rate=RATE)
+
+    transcriber.update(_audio(4.0))
+    text = transcriber.finish(_audio(5.0))
+
+    assert backend.calls[-1] == (2 * RATE, " w1.0 w1.1 w1.2")
+    assert text == "w1.0 w1.1 w1.2 w2.0 w2.1"
+
+
+def test_short_windows_are_not_decoded():
+    backend = FakeBackend()
+    transcriber = StreamingTranscriber(backend, sample_rate=RATE)
+
+    assert transcriber.finish(_audio(0.2)) == ""
+    assert backend.calls == []
@@ -0,0 +1,68 @@
+"""STT backends load once per process, in the background, and retry after a failure."""
+
+import numpy as np
+import pytest
+
+from mochi.io import stt_backends
+from mochi.io.stt_backends import BACKENDS, STTBackend, load_backend_async
+
+
+class FakeBackend(STTBackend):
+    name = "fake"
+    loads = 0
+
+    def __init__(self, model_size="base", compute_type="int8"):
+        super().__init__(model_size, compute_type)
+        type(self).loads += 1
+        if model_size == "broken":
+            raise RuntimeError("model missing")
+        self.audio = []
+
+    def transcribe(self, audio, initial_prompt=None):
+        self.audio.append(audio)
+        return []
+
+
+@pytest.fixture(autouse=True)
+def fake_engine(monkeypatch):
+    monkeypatch.setitem(BACKENDS, "fake", FakeBackend)
+    monkeypatch.setattr(stt_backends, "_backends", {})
+    FakeBackend.loads = 0
+
+
+def test_registry_names_every_engine():
+    assert {"whisper", "whisper-int8", "faster-whisper"} <= set(BACKENDS)
+    assert all(BACKENDS[name].name == name for name in BACKENDS)
+
+
+def test_unknown_engine_lists_the_choices():
+    with pytest.raises(ValueError, match="faster-whisper"):
+        load_backend_async("wav2vec")
+
+
+def test_backend_is_shared_per_settings():
+    first = load_backend_async("fake", "tiny", "int8")
+    assert load_backend_async("fake", "tiny", "int8") is first
+    assert load_backend_async("fake", "base", "int8") is not first
+
+    backend = first.result(timeout=5)
+    assert (backend.model_size, backend.compute_type) == ("tiny", "int8")
+
+
+def test_failed_load_is_retried():
+    failed = load_backend_async("fake", "broken")
+    with pytest.raises(RuntimeError, match="model missing"):
+        failed.result(timeout=5)
+
+    retry = load_backend_async("fake", "broken")
+    assert retry is not failed
+    with pytest.raises(RuntimeError):
+        retry.result(timeout=5)
+    assert FakeBackend.loads == 2
+
+
+def test_warmup_runs_one_second_of_silence():
+    backend = load_backend_async("fake").result(timeout=5)
+    backend.warmup()
+    assert len(backend.audio) == 1
+    assert backend.audio[0].dtype == np.float32 and len(backend.audio[0]) == 16000
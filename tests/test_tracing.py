@@ -0,0 +1,101 @@
+"""Span tracing: the Chrome trace file and the percentiles `mochi trace` reports."""
+
+import json
+
+from click.testing import CliRunner
+
+from mochi.cli import cli
+from mochi.core import tracing
+from mochi.core.tracing import (
+    find_trace, load_trace, percentiles, span, stage_durations, start_tracing, stop_tracing,
+)
+
+
+def _write_trace(path, stages):
+    """A trace file with one complete event per (name, duration_ms, args)."""
+    lines = ["["]
+    for name, dur_ms, args in stages:
+        event = {"name": name, "ph": "X", "ts": 0, "dur": dur_ms * 1000, "pid": 1, "tid": 1, "args": args}
+        lines.append(json.dumps(event) + ",")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_spans_are_noops_until_tracing_starts(tmp_path):
+    assert span("stt.transcribe") is tracing._NOOP
+
+    start_tracing(tmp_path, "s1")
+    try:
+        with span("llm.request", model="m") as s:
+            s.set(ttft_ms=12.5)
+    finally:
+        stop_tracing()
+
+    (event,) = load_trace(tmp_path / "s1.trace.json")
+    assert event["name"] == "llm.request" and event["cat"] == "llm"
+    assert event["args"] == {"model": "m", "ttft_ms": 12.5}
+    assert span("llm.request") is tracing._NOOP
+
+
+def test_resumed_sessions_append_and_torn_lines_are_skipped(tmp_path):
+    for _ in range(2):
+        start_tracing(tmp_path, "s1")
+        span("tts.say").end()
+        stop_tracing()
+    path = tmp_path / "s1.trace.json"
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"name": "tts.say", "ph": "X", "du')
+
+    assert [e["name"] for e in load_trace(path)] == ["tts.say", "tts.say"]
+
+
+def test_stage_durations_include_ms_attributes():
+    events = [
+        {"name": "llm.request", "dur": 2000.0, "args": {"ttft_ms": 300, "tokens": 40}},
+        {"name": "llm.request", "dur": 4000.0, "args": {"ttft_ms": 500.0}},
+        {"name": "stt.transcribe", "dur": 800.0, "args": {}},
+    ]
+    assert stage_durations(events) == {
+        "llm.request": [2.0, 4.0],
+        "llm.request:ttft": [300.0, 500.0],
+        "stt.transcribe": [0.8],
+    }
+
+
+def test_percentiles_interpolate():
+    assert percentiles(list(range(1, 101))) == [50.5, 95.05, 99.01]
+    assert percentiles([7.0]) == [7.0, 7.0, 7.0]
+
+
+def test_find_trace_by_prefix_or_newest(tmp_path):
+    _write_trace(tmp_path / "abc123.trace.json", [])
+    _write_trace(tmp_path / "def456.trace.json", [])
+
+    assert find_trace(tmp_path, "abc").name == "abc123.trace.json"
+    assert find_trace(tmp_path).name == "def456.trace.json"
+    assert find_trace(tmp_path, "zzz") is None
+    assert find_trace(tmp_path / "missing") is None
+
+
+def test_trace_command_prints_stage_percentiles(tmp_path):
+    trace_dir = tmp_path / "traces"
+    trace_dir.mkdir()
+    _write_trace(
+        trace_dir / "s1.trace.json",
+        [("llm.request", ms, {"ttft_ms": ms / 10}) for ms in range(1, 101)]
+        + [("stt.transcribe", 250.0, {})],
+    )
+    config = tmp_path / "settings.toml"
+    config.write_text(f'[app]\ntrace_dir = "{trace_dir.as_posix()}"\n', encoding="utf-8")
+
+    result = CliRunner().invoke(cli, ["trace", "s1", "-c", str(config)], env={"COLUMNS": "200"})
+
+    assert result.exit_code == 0, result.output
+    rows = {}
+    for line in result.output.splitlines():
+        cells = [cell.strip() for cell in line.split("│")[1:-1]]
+        if cells and cells[0] not in ("", "Stage"):
+            rows[cells[0]] = cells[1:]
+    # Count, p50, p95, p99, Max, Total
+    assert rows["llm.request"] == ["100", "50.5", "95.0", "99.0", "100.0", "5050"]
+    assert rows["llm.request:ttft"][1:4] == ["5.0", "9.5", "9.9"]
+    assert rows["stt.transcribe"] == ["1", "250.0", "250.0", "250.0", "250.0", "250"]
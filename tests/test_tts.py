@@ -0,0 +1,146 @@
+"""TextToSpeech keeps its pyttsx3 engine on one worker thread and plays cached phrases."""
+
+import threading
+import time
+import wave
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyttsx3")
+
+from mochi.io import tts as tts_module
+from mochi.io.tts import TextToSpeech
+from mochi.io.utils import SentenceSplitter
+
+
+class FakeEngine:
+    """Records the thread of every call; "speaks" one word every few milliseconds.
+
+    ``save_to_file`` writes a short tone, standing in for a rendered clip.
+    """
+
+    def __init__(self):
+        self.threads = set()
+        self.spoken = []
+        self.properties = {"rate": 200, "voice": "v0", "voices": []}
+        self._pending = []
+        self._callbacks = {}
+        self._stopped = False
+
+    def _touch(self):
+        self.threads.add(threading.get_ident())
+
+    def setProperty(self, name, value):
+        self._touch()
+        self.properties[name] = value
+
+    def getProperty(self, name):
+        self._touch()
+        return self.properties[name]
+
+    def connect(self, topic, callback):
+        self._touch()
+        self._callbacks[topic] = callback
+
+    def say(self, text):
+        self._touch()
+        self._pending.append(text)
+
+    def save_to_file(self, text, path):
+        self._touch()
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(22050)
+            f.writeframes(np.full(100, 16384, dtype=np.int16).tobytes())
+
+    def stop(self):
+        self._touch()
+        self._stopped = True
+
+    def runAndWait(self):
+        self._touch()
+        self._stopped = False
+        for text in self._pending:
+            words = []
+            for word in text.split():
+                self._callbacks["started-word"]("utterance", 0, len(word))
+                if self._stopped:
+                    break
+                words.append(word)
+                time.sleep(0.005)
+            self.spoken.append(" ".join(words))
+        self._pending = []
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    fake = FakeEngine()
+    monkeypatch.setattr(tts_module.pyttsx3, "init", lambda: fake)
+    return fake
+
+
+def test_engine_is_only_used_on_the_worker_thread(engine):
+    speech = TextToSpeech(rate=150)
+    speech.speak("First sentence here. Second one follows.")
+    speech.set_rate(170)
+    speech.wait()
+
+    assert engine.threads == {speech._worker.ident}
+    assert engine.properties["rate"] == 170
+    assert engine.spoken == ["First sentence here.", "Second one follows."]
+    assert not speech.speaking
+
+
+def test_cancel_stops_current_sentence_and_drops_queue(engine):
+    speech = TextToSpeech()
+    speech.enqueue(" ".join(["word"] * 200) + ".")
+    speech.enqueue("Never spoken.")
+    time.sleep(0.05)
+    assert speech.speaking
+
+    speech.cancel()
+    speech.wait()
+
+    assert engine.threads == {speech._worker.ident}
+    assert len(engine.spoken) == 1
+    assert 0 < len(engine.spoken[0].split()) < 200
+    assert not speech.speaking
+
+
+def test_speech_after_cancel_plays(engine):
+    speech = TextToSpeech()
+    speech.cancel()
+    speech.speak("Still here.")
+    speech.wait()
+    assert engine.spoken == ["Still here."]
+
+
+def test_streamed_sentences_are_spoken_in_order(engine):
+    speech = TextToSpeech()
+    splitter = SentenceSplitter()
+    for chunk in ["**Good** start", ". What is the ", "cost? Think about `n`", " items."]:
+        for sentence in splitter.feed(chunk):
+            speech.enqueue(sentence)
+    speech.enqueue(splitter.flush())
+    speech.wait()
+
+    assert engine.spoken == ["Good start.", "What is the cost?", "Think about n items."]
+
+
+def test_cached_phrases_play_without_synthesis(engine, tmp_path, monkeypatch):
+    played = []
+    monkeypatch.setattr(TextToSpeech, "_play", lambda self, samples, rate: played.append(len(samples)))
+
+    speech = TextToSpeech(cache_dir=tmp_path)
+    assert speech.prerender(["**Nice** work. Keep going."]) == 2
+    speech.speak("Nice work. Something new.")
+    speech.wait()
+
+    assert played == [100]
+    assert engine.spoken == ["Something new."]
+
+    # A fresh instance loads the rendered clips from disk
+    reloaded = TextToSpeech(cache_dir=tmp_path, phrases=["Keep going."])
+    assert reloaded.audio_cache.get("Keep going.") is not None
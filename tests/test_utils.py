@@ -0,0 +1,37 @@
+"""Speech text: markdown normalization against the golden corpus, and sentence splitting."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mochi.io.utils import SentenceSplitter, strip_markdown
+
+CORPUS = json.loads(
+    (Path(__file__).parent.parent / "benchmarks" / "fixtures" / "speech_corpus.json").read_text()
+)
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[case["name"] for case in CORPUS])
+def test_strip_markdown_matches_corpus(case):
+    assert strip_markdown(case["input"]) == case["expected"]
+
+
+def test_sentence_splitter_hands_back_sentences_as_they_complete():
+    splitter = SentenceSplitter()
+
+    assert splitter.feed("Good start. What's the") == ["Good start."]
+    assert splitter.feed(" cost of that loop? It runs") == ["What's the cost of that loop?"]
+    assert splitter.feed(" n times") == []
+    assert splitter.flush() == "It runs n times"
+    assert splitter.flush() == ""
+
+
+def test_sentence_splitter_needs_whitespace_after_the_punctuation():
+    splitter = SentenceSplitter()
+
+    # A decimal point or a chunk ending on a period doesn't end a sentence yet
+    assert splitter.feed("Pi is 3.14 roughly.") == []
+    assert splitter.feed(' She said "done!" Then') == ["Pi is 3.14 roughly.", 'She said "done!"']
+    assert splitter.feed(" a list:\n\n- first") == ["Then a list:"]
+    assert splitter.flush() == "- first"